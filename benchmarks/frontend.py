@@ -0,0 +1,73 @@
+"""
+Throughput of the two front ends in lines per second.
+
+Before timing, the PLY parser and the hand written FastParser are checked to
+produce identical ASTs, globals and function tables on the example programs
+and on the generated one.
+
+    python benchmarks/frontend.py [lines]
+"""
+
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from biro import FastParser, Parser
+
+FUNCTION = """biro f{i}(arr, n) : (a[num], num, num) {{
+    smallbiro i : num = 0
+    smallbiro total : num = 0
+    biro loop {{
+        biro is i equals n? {{
+            leave
+        }}
+        total = total + biro.index(arr, i) * 2 - i / 3
+        i = i + 1
+    }}
+    donate total
+}}
+biro g{i} : a[num] = a[{i}, 1, 2, 3, 4, 5]
+biro.say(f{i}(g{i}, biro.len(g{i})), "done")
+"""
+
+
+def generate(lines):
+    """Program of roughly `lines` lines built from one repeated chunk"""
+    chunk = FUNCTION.count("\n")
+    return "".join(FUNCTION.format(i=i) for i in range(lines // chunk + 1))
+
+
+def parse(cls, code):
+    parser = cls()
+    start = time.perf_counter()
+    parser.parse(code)
+    return parser.biro, time.perf_counter() - start
+
+
+def check(code, name):
+    ply, _ = parse(Parser, code)
+    fast, _ = parse(FastParser, code)
+    for what in ("getCode", "getGlobals", "getFunc"):
+        if getattr(ply, what)() != getattr(fast, what)():
+            sys.exit(f"{name}: front ends differ in {what}()")
+
+
+def main(lines):
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "*.biro"))):
+        with open(path) as f:
+            check(f.read(), path)
+    code = generate(lines)
+    check(code, "generated program")
+    total = code.count("\n")
+    print(f"{total} lines, identical ASTs")
+    for cls in (Parser, FastParser):
+        seconds = min(parse(cls, code)[1] for _ in range(3))
+        print(f"{cls.__name__:<12}{total / seconds:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
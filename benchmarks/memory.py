@@ -0,0 +1,77 @@
+"""
+Peak memory of the front end on a large, data heavy program.
+
+Each measurement runs in its own process: `string` parses the preprocessed
+code held as one string, `stream` parses the memory mapped pieces. The source
+size is printed next to the peak RSS, so the copies of it are easy to spot.
+
+    python benchmarks/memory.py [megabytes]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def generate(path, megabytes):
+    """Global string arrays of 300 items per line"""
+    rnd = random.Random(0)
+    with open(path, "w") as f:
+        i = 0
+        while f.tell() < megabytes * 1024 * 1024:
+            items = ", ".join(
+                '"%s"' % ("x" * rnd.randint(20, 60)) for _ in range(300)
+            )
+            f.write(f"biro d{i} : a[str] = a[{items}]\n")
+            i += 1
+
+
+def measure(path, mode, frontend):
+    from biro import FastParser, Parser, Preprocessor
+
+    preprocessor = Preprocessor(path, tempfile.gettempdir())
+    parser = {"ply": Parser, "fast": FastParser}[frontend]()
+    if mode == "string":
+        parser.parse(preprocessor.process())
+    else:
+        parser.parse(preprocessor.chunks())
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+
+def main(megabytes):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.biro")
+        generate(path, megabytes)
+        size = os.path.getsize(path) / 1024 / 1024
+        for frontend in ("ply", "fast"):
+            for mode in ("string", "stream"):
+                rss = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--measure",
+                        path,
+                        mode,
+                        frontend,
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.strip()
+                print(
+                    f"{frontend:<6}{mode:<8}source {size:>6.1f} MB "
+                    f"peak RSS {rss:>6} MB"
+                )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        print(measure(*sys.argv[2:]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 25)
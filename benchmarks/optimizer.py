@@ -0,0 +1,79 @@
+"""
+Runtime effect of `biro compile -O` on the example programs.
+
+A driver adds `examples/bubble.biro` and sorts a reversed array, it is built
+with and without the optimizer under the `debug` and `release` profiles and
+every binary is timed over a few runs. The outputs must be identical.
+
+    python benchmarks/optimizer.py [items] [runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+BIRO = os.path.join(ROOT, "src", "biro.py")
+EXAMPLE = os.path.abspath(os.path.join(ROOT, "examples", "bubble.biro"))
+
+DRIVER = """!add {example}
+biro items : a[num] = a[{items}]
+items = bubblesort(items, biro.len(items))
+biro.say(biro.index(items, 0), " ", biro.index(items, {last}), "\\n")
+"""
+
+
+def build(source, output, profile, optimize, env):
+    command = [sys.executable, BIRO, "compile", source, "-o", output]
+    command += ["--profile", profile, "--no-cache"]
+    if optimize:
+        command.append("-O")
+    subprocess.run(command, env=env, capture_output=True, check=True)
+
+
+def measure(binary, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([binary], capture_output=True, check=True).stdout
+        times.append(time.perf_counter() - start)
+    return min(times), out
+
+
+def main(items, runs):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, BIROHOME=tmp, BIRONOSERVER="1")
+        source = os.path.join(tmp, "driver.biro")
+        with open(source, "w") as f:
+            f.write(
+                DRIVER.format(
+                    example=EXAMPLE,
+                    items=", ".join(str(i) for i in range(items, 0, -1)),
+                    last=items - 1,
+                )
+            )
+        for profile in ("debug", "release"):
+            results = {}
+            for optimize in (False, True):
+                binary = os.path.join(tmp, f"{profile}-{optimize}")
+                build(source, binary, profile, optimize, env)
+                results[optimize] = measure(binary, runs)
+            (plain, out), (optimized, out_optimized) = (
+                results[False],
+                results[True],
+            )
+            assert out == out_optimized, (out, out_optimized)
+            print(
+                f"{profile:<9}plain {plain * 1000:>9.1f} ms   "
+                f"-O {optimized * 1000:>9.1f} ms   "
+                f"{plain / optimized:>5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 3000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -0,0 +1,60 @@
+"""
+Parse time against program size for both front ends.
+
+List productions are linear, so the time per statement has to stay flat from
+the smallest to the largest program (100k statements by default). Exits with
+an error when it grows by more than `MAX_GROWTH`.
+
+    python benchmarks/scaling.py [statements]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from biro import FastParser, Parser
+
+MAX_GROWTH = 2.0
+
+
+def program(statements):
+    """Top level statements plus one loop body and one call of the same size"""
+    third = statements // 3
+    lines = [f"x{i} = {i} + 1" for i in range(third)]
+    lines.append("biro loop {")
+    lines += [f"    y = y * {i}" for i in range(third)]
+    lines.append("    leave")
+    lines.append("}")
+    args = ", ".join(str(i) for i in range(statements - 2 * third))
+    lines.append(f"biro.say({args})")
+    return "\n".join(lines)
+
+
+def main(statements):
+    sizes = [statements // 4, statements // 2, statements]
+    failed = False
+    for cls in (Parser, FastParser):
+        per_statement = []
+        for size in sizes:
+            code = program(size)
+            parser = cls()
+            start = time.perf_counter()
+            parser.parse(code)
+            seconds = time.perf_counter() - start
+            per_statement.append(seconds / size)
+            print(
+                f"{cls.__name__:<12}{size:>8} statements {seconds:>8.2f}s "
+                f"{per_statement[-1] * 1e6:>8.2f} us/statement"
+            )
+        growth = per_statement[-1] / per_statement[0]
+        if growth > MAX_GROWTH:
+            print(f"{cls.__name__}: time per statement grew {growth:.1f}x")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
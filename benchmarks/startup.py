@@ -0,0 +1,79 @@
+"""
+Startup cost of the PLY front end.
+
+Compares the legacy construction (lex.lex/yacc.yacc on every Parser, tables
+and parser.out written next to the module) with the shared, pickled tables.
+Every measurement runs in a fresh interpreter.
+
+    python benchmarks/startup.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+LEGACY = """
+import time, ply.lex as lex, ply.yacc as yacc
+start = time.perf_counter()
+from biro.lexerparser import Parser
+for _ in range({n}):
+    p = Parser.__new__(Parser)
+    lex.lex(module=p)
+    yacc.yacc(module=p, outputdir={outdir!r})
+print(time.perf_counter() - start)
+"""
+
+SHARED = """
+import time
+start = time.perf_counter()
+from biro.lexerparser import Parser
+for _ in range({n}):
+    Parser()
+print(time.perf_counter() - start)
+"""
+
+
+def measure(snippet, env, runs, **fmt):
+    times = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", snippet.format(**fmt)],
+            env=env,
+            cwd=SRC,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        times.append(float(out.split()[-1]))
+    return min(times)
+
+
+def main(runs):
+    with tempfile.TemporaryDirectory() as birohome:
+        env = dict(os.environ, BIROHOME=birohome, PYTHONPATH=SRC)
+        outdir = os.path.join(birohome, "legacy")
+        os.makedirs(outdir)
+        rows = [
+            ("legacy, first run", measure(LEGACY, env, 1, n=1, outdir=outdir)),
+            (
+                "legacy, warm tables",
+                measure(LEGACY, env, runs, n=1, outdir=outdir),
+            ),
+            (
+                "legacy, 20 parsers",
+                measure(LEGACY, env, runs, n=20, outdir=outdir),
+            ),
+            ("shared, first run", measure(SHARED, env, 1, n=1)),
+            ("shared, warm tables", measure(SHARED, env, runs, n=1)),
+            ("shared, 20 parsers", measure(SHARED, env, runs, n=20)),
+        ]
+    for name, seconds in rows:
+        print(f"{name:<22}{seconds * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,82 @@
+"""
+Runtime effect of generating the integer `num` variables as `int64_t`.
+
+A driver adds `examples/bubble.biro` and sorts a reversed array. Its C++ is
+made with and without the type inference, built under the `debug` and
+`release` profiles and every binary is timed over a few runs. The outputs
+must be identical.
+
+    python benchmarks/types.py [items] [runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+EXAMPLE = os.path.abspath(os.path.join(ROOT, "examples", "bubble.biro"))
+
+DRIVER = """!add {example}
+biro items : a[num] = a[{items}]
+items = bubblesort(items, biro.len(items))
+biro.say(biro.index(items, 0), " ", biro.index(items, {last}), "\\n")
+"""
+
+
+def make(source, integers):
+    from biro import CPP, Parser, Preprocessor
+
+    parser = Parser()
+    parser.parse(Preprocessor(source, tempfile.gettempdir()).chunks())
+    return CPP(parser, integers=integers).make()
+
+
+def measure(binary, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([binary], capture_output=True, check=True).stdout
+        times.append(time.perf_counter() - start)
+    return min(times), out
+
+
+def main(items, runs):
+    from biro import CPP, Toolchain
+    from biro.toolchain import PROFILES
+
+    toolchain = Toolchain(CPP.implementation_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "driver.biro")
+        with open(source, "w") as f:
+            f.write(
+                DRIVER.format(
+                    example=EXAMPLE,
+                    items=", ".join(str(i) for i in range(items, 0, -1)),
+                    last=items - 1,
+                )
+            )
+        codes = {integers: make(source, integers) for integers in (False, True)}
+        for profile in ("debug", "release"):
+            results = {}
+            for integers, code in codes.items():
+                binary = os.path.join(tmp, f"{profile}-{integers}")
+                flags = ["-std=c++17", *PROFILES[profile]]
+                assert toolchain.compile(code, binary, flags)
+                results[integers] = measure(binary, runs)
+            (floats, out), (ints, out_ints) = results[False], results[True]
+            assert out == out_ints, (out, out_ints)
+            print(
+                f"{profile:<9}float {floats * 1000:>9.1f} ms   "
+                f"int64_t {ints * 1000:>9.1f} ms   "
+                f"{floats / ints:>5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 3000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -1,9 +1,22 @@
+import collections
+import contextlib
+import glob
+import hashlib
+import io
 import platform
-import subprocess
+import shutil
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from biro import *
+from biro.emitter import Discard, Tee
+from biro.middleware import Error
 from biropkg import *
+import biroclient
 import click
-import tempfile
 import os
 import sqlite3
 import yaml
@@ -11,27 +24,98 @@ from requests import Response
 
 BIROHOME = os.environ["BIROHOME"]
 BIROLIB = os.environ.get("BIROLIB", os.path.join(os.environ["BIROHOME"], "lib"))
+BIROCACHE = os.path.join(BIROHOME, "cache")
+BIROPCH = os.path.join(BIROHOME, "pch")
+BIROPROFILES = os.path.join(BIROHOME, "profiles.yml")
+BIROPGO = os.path.join(BIROHOME, "pgo")
+BIROAST = os.path.join(BIROHOME, "ast")
+# Cache size limit in megabytes
+BIROCACHESIZE = int(os.environ.get("BIROCACHESIZE", "512"))
+
+CXXFLAGS = ["-std=c++17"]
+
+
+_session = None
+
+
+def _get_session():
+    """Compiler session of the process, its parsers stay warm across programs"""
+    global _session
+    if _session is None:
+        graph = ModuleGraph(BIROLIB, os.path.join(BIROHOME, "modules.json"))
+        modules = ModuleCache(BIROAST, __version__)
+        _session = Session(BIROLIB, graph, modules)
+    return _session
+
+
+def _preprocess(filename):
+    """Preprocessor of a file and the files it pulls in with `!add`"""
+    preprocessor = Preprocessor(filename, BIROLIB, graph=_get_session().graph)
+    sources = preprocessor.sources()
+    return preprocessor, sources[:-1]
+
+
+def _make_cpp(
+    preprocessor,
+    use_runtime_header=False,
+    build_info=None,
+    frontend="ply",
+    optimize=False,
+    num="float",
+    unchecked=False,
+):
+    """Parse and optimize a program, returns a function writing its C++"""
+    options = CompileOptions(
+        frontend=frontend,
+        optimize=optimize,
+        num=num,
+        unchecked=unchecked,
+        use_runtime_header=use_runtime_header,
+        build_info=build_info,
+    )
+    backend, report = _get_session().prepare(preprocessor, options)
+    for change in report:
+        click.echo(click.style(f"[optimize] {change}", dim=True))
+
+    def write(sink):
+        backend.write(sink)
+        if unchecked and not backend.unchecked:
+            click.echo(
+                click.style(
+                    "[unchecked] the program uses attempt, index keeps its checks",
+                    dim=True,
+                )
+            )
+
+    return write
+
+
+def _text(write):
+    """What `write` writes, as a string"""
+    sink = io.StringIO()
+    write(sink)
+    return sink.getvalue()
+
+
+def _error(msg):
+    click.echo(
+        f'{click.style("Error: ", bold=True, fg="red")}{click.style(msg, fg="red")}'
+    )
+    exit(1)
 
 
-def _make_cpp(filename):
-    Preprocessor(
-        filename,
-        BIROLIB,
-        "so.pirocode",
-    ).process()
-    with open("so.pirocode", "r") as f:
-        code = f.read()
-    os.remove("so.pirocode")
-    p = Parser()
-    p.parse(code)
-    a = CPP(p)
-    return a.make()
+def _profiles():
+    try:
+        return load_profiles(BIROPROFILES)
+    except ValueError as e:
+        _error(str(e))
 
 
-def _compile_cpp(file_path, output_name, making_source):
+def _compile_cpp(toolchain, write, output_name, making_source, flags, pgo=None):
     if platform.system() == "Windows":
         if making_source:
-            return
+            write(Discard())
+            return False
         click.echo(
             click.style(
                 "Not implemented on windows yet. Use `compile -s` command",
@@ -39,17 +123,48 @@ def _compile_cpp(file_path, output_name, making_source):
             )
         )
         exit(1)
-    else:
-        compile_command = ["g++", file_path, "-std=c++17", "-o", output_name]
-
-    try:
-        subprocess.run(compile_command, check=True)
-    except subprocess.CalledProcessError as e:
-        pass
+    if pgo is not None:
+        data_dir, training, code = pgo
+        return toolchain.pgo_compile(
+            code, output_name, flags, data_dir, training
+        )
+    return toolchain.compile_stream(write, output_name, flags)
 
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
+FRONTEND_OPTION = click.option(
+    "--frontend",
+    type=click.Choice(list(Session.frontends)),
+    default="ply",
+    show_default=True,
+    help="Parser used for the biro code, `fast` is the hand written one.",
+)
+
+OPTIMIZE_OPTION = click.option(
+    "-O",
+    "--optimize",
+    is_flag=True,
+    default=False,
+    help="Optimize the biro code before generating C++ and report the changes.",
+)
+
+DOUBLE_OPTION = click.option(
+    "--double",
+    is_flag=True,
+    default=False,
+    help="Hold the non integer numbers in doubles instead of floats, "
+    "results relying on float rounding change.",
+)
+
+UNCHECKED_OPTION = click.option(
+    "--unchecked",
+    is_flag=True,
+    default=False,
+    help="Index without bounds checks, an index out of bounds is undefined "
+    "behaviour. Programs with `attempt` keep the checks.",
+)
+
 
 @click.group(context_settings=CONTEXT_SETTINGS)
 def biro():
@@ -58,8 +173,10 @@ def biro():
 
 
 @biro.command()
-@click.argument("filename")
-@click.option("-o", "--output", help="Specify an output filename")
+@click.argument("filenames", nargs=-1, required=True)
+@click.option(
+    "-o", "--output", help="Specify an output filename (single file only)"
+)
 @click.option(
     "-s",
     "--source",
@@ -68,28 +185,522 @@ def biro():
     help="""Generate the intermediate C++ source file.
     Use this flag to create the intermediate code file along with compiling it.""",
 )
-def compile(filename, output, source):
-    """Compiles a biro file."""
-    basename, file_ext = os.path.splitext(os.path.basename(filename))
-    tempdir = os.getcwd()
-    if not source:
-        tempdir = tempfile.mkdtemp()
-    if not os.path.exists(filename) or not os.path.isfile(filename):
-        click.echo(
-            f'{click.style("Error: ", bold=True, fg="red")}{click.style(f"No such file {filename} exist", fg="red")}'
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore the compilation cache and always rebuild.",
+)
+@click.option(
+    "--no-pch",
+    is_flag=True,
+    default=False,
+    help="Inline the runtime instead of using the precompiled header.",
+)
+@click.option(
+    "-p",
+    "--profile",
+    default="debug",
+    show_default=True,
+    help="Build profile: debug, release, fast, lto or one defined in $BIROHOME/profiles.yml.",
+)
+@click.option(
+    "--pgo",
+    is_flag=True,
+    default=False,
+    help="Profile guided build, reusing the stored profile of this program.",
+)
+@click.option(
+    "--train",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Input fed to `ask` on stdin for a PGO training run (repeatable).",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of files compiled in parallel.",
+)
+@FRONTEND_OPTION
+@OPTIMIZE_OPTION
+@DOUBLE_OPTION
+@UNCHECKED_OPTION
+def compile(
+    filenames,
+    output,
+    source,
+    no_cache,
+    no_pch,
+    profile,
+    pgo,
+    train,
+    jobs,
+    frontend,
+    optimize,
+    double,
+    unchecked,
+):
+    """Compiles biro files, given as paths or glob patterns."""
+    files = []
+    for pattern in filenames:
+        matches = (
+            sorted(glob.glob(pattern, recursive=True))
+            if glob.has_magic(pattern)
+            else []
         )
+        for filename in matches or [pattern]:
+            if not os.path.exists(filename) or not os.path.isfile(filename):
+                _error(f"No such file {filename} exist")
+            if filename not in files:
+                files.append(filename)
+    if output and len(files) > 1:
+        _error("--output can only be used when compiling a single file")
+    if train and len(files) > 1:
+        _error("--train can only be used when compiling a single file")
+
+    settings, build = _configure(
+        profile,
+        source,
+        no_cache,
+        no_pch,
+        frontend,
+        pgo,
+        train,
+        optimize,
+        double,
+        unchecked,
+    )
+
+    if len(files) == 1:
+        front = _front_end(files[0], settings, stream=True)
+        if _back_end(build, front, output) == "failed":
+            exit(1)
+        return
+
+    results = _compile_many(files, jobs, settings, build)
+    _print_summary(results)
+    if any(result[1] == "failed" for result in results):
         exit(1)
-    code = _make_cpp(filename)
-    cpp_file = os.path.join(tempdir, f"{basename}.cpp")
-    out_file = f"{basename}.birocode"
-    if output:
-        out_file = output
-    with open(cpp_file, "w") as f:
-        f.write(code)
-    _compile_cpp(cpp_file, out_file, making_source=source)
-    if not source:
-        os.remove(cpp_file)
-        os.rmdir(tempdir)
+
+
+def _configure(
+    profile,
+    source,
+    no_cache,
+    no_pch,
+    frontend,
+    pgo=False,
+    train=(),
+    optimize=False,
+    double=False,
+    unchecked=False,
+):
+    """Resolve the CLI build options into front end settings and a build"""
+    profiles = _profiles()
+    if profile not in profiles:
+        _error(f"Unknown profile {profile}, choose from {', '.join(profiles)}")
+    profile_flags = CXXFLAGS + profiles[profile]
+    build_info = f"profile={profile} flags={' '.join(profile_flags)}"
+    if optimize:
+        build_info += " optimize"
+    if double:
+        build_info += " double"
+    if unchecked:
+        build_info += " unchecked"
+    if train:
+        pgo = True
+    if pgo:
+        levels = [flag for flag in profile_flags if flag.startswith("-O")]
+        if not levels or levels[-1] == "-O0":
+            _error(
+                f"--pgo needs an optimizing profile, `{profile}` builds "
+                "without optimizations. Pick one like release."
+            )
+        build_info += " pgo"
+        # The binary depends on the training runs, which the cache can't see
+        no_cache = True
+
+    toolchain = Toolchain(CPP.implementation_path)
+    flags = profile_flags
+    # The C++ file written by `-s` has to stand on its own
+    use_pch = not no_pch and not source and platform.system() != "Windows"
+    if use_pch:
+        pch_dir = toolchain.precompiled_header(BIROPCH, profile_flags)
+        flags = profile_flags + toolchain.include_flags(pch_dir)
+
+    settings = _FrontEndSettings(
+        use_cache=not no_cache,
+        use_pch=use_pch,
+        frontend=frontend,
+        optimize=optimize,
+        num="double" if double else "float",
+        unchecked=unchecked,
+        build_info=build_info,
+        flags=flags,
+        toolchain_version=toolchain.version(),
+    )
+    build = _Build(
+        toolchain=toolchain,
+        flags=flags,
+        profile_flags=profile_flags,
+        source=source,
+        pgo=pgo,
+        train=train,
+    )
+    return settings, build
+
+
+_FrontEndSettings = collections.namedtuple(
+    "_FrontEndSettings",
+    "use_cache use_pch frontend optimize num unchecked build_info flags "
+    "toolchain_version",
+)
+_FrontEnd = collections.namedtuple(
+    "_FrontEnd", "filename key entry code write deps seconds"
+)
+_Build = collections.namedtuple(
+    "_Build", "toolchain flags profile_flags source pgo train"
+)
+
+
+def _front_end(filename, settings, stream=False):
+    """
+    Preprocess a file, look it up in the cache and transpile it on a miss.
+    With `stream` the C++ is not made yet, the back end writes it straight
+    where it goes through `write`.
+    """
+    try:
+        return _try_front_end(filename, settings, stream)
+    except BiroError as e:
+        Error().show(e.message)
+        exit(1)
+
+
+def _try_front_end(filename, settings, stream):
+    start = time.perf_counter()
+    preprocessor, deps = _preprocess(filename)
+    key = entry = code = write = None
+    if settings.use_cache:
+        key = CompileCache.key(
+            preprocessor.chunks(),
+            __version__,
+            settings.toolchain_version,
+            CPP.implementation_path,
+            [
+                *settings.flags,
+                f"frontend={settings.frontend}",
+                f"optimize={settings.optimize}",
+                f"num={settings.num}",
+                f"unchecked={settings.unchecked}",
+                # Embedded into the binary, it names the profile
+                f"build_info={settings.build_info}",
+            ],
+        )
+        entry = CompileCache(BIROCACHE, BIROCACHESIZE * 1024 * 1024).get(key)
+    if entry is None:
+        write = _make_cpp(
+            preprocessor,
+            settings.use_pch,
+            settings.build_info,
+            settings.frontend,
+            settings.optimize,
+            settings.num,
+            settings.unchecked,
+        )
+        if not stream:
+            code = _text(write)
+            write = None
+    return _FrontEnd(
+        filename, key, entry, code, write, deps, time.perf_counter() - start
+    )
+
+
+def _back_end(build, front, output=None):
+    """Run g++ for a transpiled file, or copy the cached result on a hit"""
+    basename, file_ext = os.path.splitext(os.path.basename(front.filename))
+    # The C++ code is piped into g++, it only hits the disk when asked for
+    cpp_file = f"{basename}.cpp"
+    out_file = output or f"{basename}.birocode"
+    if front.entry:
+        click.echo(click.style(f"[cache] hit {front.key[:12]}", dim=True))
+        cache = CompileCache(BIROCACHE, BIROCACHESIZE * 1024 * 1024)
+        with cache.hold(front.key):
+            if build.source:
+                shutil.copy2(
+                    os.path.join(front.entry, CompileCache.cpp_name), cpp_file
+                )
+            binary = os.path.join(front.entry, CompileCache.binary_name)
+            if os.path.isfile(binary):
+                shutil.copy2(binary, out_file)
+        return "cached"
+    cache = None
+    if front.key:
+        click.echo(click.style(f"[cache] miss {front.key[:12]}", dim=True))
+        cache = CompileCache(BIROCACHE, BIROCACHESIZE * 1024 * 1024)
+
+    make = front.write or (lambda sink: sink.write(front.code))
+    # The C++ goes to g++ as it is made, and to the file kept for `-s` or
+    # the cache on the way
+    kept = cpp_file if build.source else cache and cache.staging(front.key)
+    with contextlib.ExitStack() as files:
+        write = make
+        if kept:
+            copy = files.enter_context(open(kept, "w"))
+            write = lambda sink: make(Tee(sink, copy))
+        pgo_data = None
+        if build.pgo:
+            code = _text(write)
+            source_hash = hashlib.sha256(
+                "\0".join(
+                    [
+                        code,
+                        build.toolchain.version(),
+                        *build.profile_flags,
+                    ]
+                ).encode()
+            ).hexdigest()
+            data_dir = os.path.join(BIROPGO, source_hash[:16])
+            if not build.train and not Toolchain.has_profile(data_dir):
+                click.echo(
+                    click.style(
+                        f"No stored profile for {front.filename}, pass --train inputs",
+                        fg="red",
+                    )
+                )
+                return "failed"
+            pgo_data = (data_dir, build.train, code)
+        try:
+            compiled = _compile_cpp(
+                build.toolchain,
+                write,
+                out_file,
+                build.source,
+                build.flags,
+                pgo_data,
+            )
+        except BiroError as e:
+            Error().show(e.message)
+            compiled = False
+    if cache and compiled:
+        cache.put(front.key, kept, out_file, move=not build.source)
+    elif cache and not build.source and os.path.exists(kept):
+        os.remove(kept)
+    return "compiled" if compiled else "failed"
+
+
+def _compile_many(files, jobs, settings, build):
+    """
+    Transpile the files in a process pool and hand each finished one to a
+    bounded pool of g++ jobs, so parsing overlaps with compiling.
+    Returns (filename, status, front end seconds, g++ seconds) per file.
+    """
+
+    def timed_back_end(front):
+        start = time.perf_counter()
+        status = _back_end(build, front)
+        return status, time.perf_counter() - start
+
+    results = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs
+    ) as front_pool, ThreadPoolExecutor(max_workers=jobs) as back_pool:
+        fronts = {
+            front_pool.submit(_front_end, filename, settings): filename
+            for filename in files
+        }
+        backs = {}
+        for future in as_completed(fronts):
+            filename = fronts[future]
+            try:
+                front = future.result()
+            except BaseException:
+                results[filename] = (filename, "failed", None, None)
+                continue
+            backs[back_pool.submit(timed_back_end, front)] = front
+        for future in as_completed(backs):
+            front = backs[future]
+            try:
+                status, seconds = future.result()
+            except Exception:
+                status, seconds = "failed", None
+            results[front.filename] = (
+                front.filename,
+                status,
+                front.seconds,
+                seconds,
+            )
+    return [results[filename] for filename in files]
+
+
+def _print_summary(results):
+    fmt = lambda s: "-" if s is None else f"{s:.2f}s"
+    colors = {"compiled": "green", "cached": "cyan", "failed": "red"}
+    click.echo(f"\n{'status':<10}{'front':>8}{'g++':>8}  file")
+    for filename, status, front, back in results:
+        click.echo(
+            f"{click.style(f'{status:<10}', fg=colors[status])}"
+            f"{fmt(front):>8}{fmt(back):>8}  {filename}"
+        )
+    counts = ", ".join(
+        f"{sum(r[1] == status for r in results)} {status}" for status in colors
+    )
+    click.echo(f"{len(results)} files: {counts}")
+
+
+@biro.command()
+@click.argument("filename")
+@click.option("-o", "--output", help="Specify an output filename")
+@click.option(
+    "-p",
+    "--profile",
+    default="debug",
+    show_default=True,
+    help="Build profile, see `biro profiles`.",
+)
+@click.option(
+    "--no-pch",
+    is_flag=True,
+    default=False,
+    help="Inline the runtime instead of using the precompiled header.",
+)
+@click.option(
+    "--interval",
+    default=0.3,
+    show_default=True,
+    help="Seconds between checks for changed files.",
+)
+@FRONTEND_OPTION
+@OPTIMIZE_OPTION
+@DOUBLE_OPTION
+@UNCHECKED_OPTION
+def watch(
+    filename,
+    output,
+    profile,
+    no_pch,
+    interval,
+    frontend,
+    optimize,
+    double,
+    unchecked,
+):
+    """Recompile a biro file whenever it or one of its `!add` files changes."""
+    if not os.path.isfile(filename):
+        _error(f"No such file {filename} exist")
+    settings, build = _configure(
+        profile,
+        False,
+        False,
+        no_pch,
+        frontend,
+        optimize=optimize,
+        double=double,
+        unchecked=unchecked,
+    )
+
+    def mtimes(paths):
+        stamps = {}
+        for path in paths:
+            try:
+                stamps[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                stamps[path] = None
+        return stamps
+
+    deps = []
+    seen = None
+    last_code = None
+    click.echo(f"Watching {filename}, press Ctrl+C to stop")
+    try:
+        while True:
+            # Taken before building, so edits made during a build trigger
+            # another one
+            current = mtimes([filename, *deps])
+            if current == seen:
+                time.sleep(interval)
+                continue
+            seen = current
+            start = time.perf_counter()
+            try:
+                front = _front_end(filename, settings)
+            except SystemExit:
+                click.echo(
+                    click.style("Build failed, waiting for changes", fg="red")
+                )
+                continue
+            if front.deps != deps:
+                deps = front.deps
+                seen = mtimes([filename, *deps])
+            if front.code is not None and front.code == last_code:
+                click.echo(click.style("Generated code unchanged", dim=True))
+                continue
+            status = _back_end(build, front, output)
+            if status != "failed":
+                last_code = front.code
+            click.echo(
+                click.style(
+                    f"[{time.strftime('%H:%M:%S')}] {status} {filename} "
+                    f"in {time.perf_counter() - start:.2f}s",
+                    fg="red" if status == "failed" else "green",
+                )
+            )
+    except KeyboardInterrupt:
+        pass
+
+
+@biro.command()
+@click.option(
+    "--idle-timeout",
+    default=1800,
+    show_default=True,
+    help="Seconds without requests after which the server exits.",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    default=False,
+    help="Stop the running server.",
+)
+def serve(idle_timeout, stop):
+    """Run the compile server used by the biro client."""
+    path = biroclient.socket_path()
+    if stop:
+        try:
+            biroclient._request(path, {"stop": True})
+        except OSError:
+            click.echo("No server running")
+        return
+
+    from biro.server import CompileServer
+
+    def run(argv, color):
+        biro.main(args=argv, prog_name="biro", color=color)
+
+    server = CompileServer(path, run, biroclient.source_stamp(), idle_timeout)
+    click.echo(f"Listening on {path}")
+    server.serve()
+
+
+@biro.command()
+def profiles():
+    """List the build profiles."""
+    for name, flags in _profiles().items():
+        click.echo(f"{name}\t{' '.join(flags)}")
+
+
+@biro.command()
+@click.argument("binary")
+def info(binary):
+    """Show how a birocode binary was built."""
+    if not os.path.isfile(binary):
+        _error(f"No such file {binary} exist")
+    build_info = read_build_info(binary, CPP.build_marker)
+    if build_info is None:
+        _error(f"{binary} has no biro build information")
+    click.echo(build_info)
 
 
 @biro.command()
@@ -98,6 +709,31 @@ def version():
     click.echo(__version__)
 
 
+@biro.command()
+@click.option(
+    "--clear",
+    is_flag=True,
+    default=False,
+    help="Remove every entry from the compilation cache.",
+)
+def cache(clear):
+    """Show compilation cache statistics."""
+    cache = CompileCache(BIROCACHE, BIROCACHESIZE * 1024 * 1024)
+    if clear:
+        cache.clear()
+        click.echo("Cache cleared")
+        return
+    stats = cache.stats()
+    entries, size = cache.size()
+    lookups = stats["hits"] + stats["misses"]
+    ratio = stats["hits"] / lookups * 100 if lookups else 0
+    click.echo(f"Location: {BIROCACHE}")
+    click.echo(f"Entries:  {entries} ({size / 1024 / 1024:.1f} MB)")
+    click.echo(f"Hits:     {stats['hits']}")
+    click.echo(f"Misses:   {stats['misses']}")
+    click.echo(f"Hit rate: {ratio:.1f}%")
+
+
 @biro.command()
 def list():
     """List all commands."""
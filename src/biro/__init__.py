@@ -1,14 +1,42 @@
 from biro.cpp_transpiler import CPP
 from biro.lexerparser import Parser
+from biro.fastparser import FastParser
 from biro.preprocessor import Preprocessor
+from biro.modulegraph import ModuleGraph
+from biro.modulecache import ModuleCache
 from biro.loader import Loader
+from biro.optimizer import Optimizer
+from biro.cache import CompileCache
+from biro.toolchain import Toolchain, load_profiles, read_build_info
+from biro.middleware import BiroError, BiroSyntaxError, ModuleError
+from biro.session import (
+    CompileOptions,
+    CompileResult,
+    Session,
+    compile_source,
+)
 
 __version__ = "0.1.0"
 
 __all__ = (
     "CPP",
     "Parser",
+    "FastParser",
     "Preprocessor",
+    "ModuleGraph",
+    "ModuleCache",
     "Loader",
+    "Optimizer",
+    "CompileCache",
+    "Toolchain",
+    "load_profiles",
+    "read_build_info",
+    "BiroError",
+    "BiroSyntaxError",
+    "ModuleError",
+    "CompileOptions",
+    "CompileResult",
+    "Session",
+    "compile_source",
     "__version__",
 )
@@ -0,0 +1,470 @@
+import typing as t
+from biro import nodes
+from biro.middleware import Scope
+
+# Builtins without side effects, with the numbers of arguments for which
+# they are. `index` with three arguments stores into the array it is given.
+pure_builtins = {"len": (1,), "index": (2,)}
+# Pure builtins that can throw, they are only evaluated where the program
+# would evaluate them anyway
+throwing_builtins = {"index"}
+# Builtins writing to their first argument, by number of arguments
+writing_builtins = {"index": (3,)}
+
+# Statements holding a nested list of statements
+compound_statements = (
+    nodes.If,
+    nodes.Loop,
+    nodes.Try,
+    nodes.Catch,
+    nodes.FunctionDef,
+)
+
+
+# Binding of the operators in C++. The generated code has no parentheses, so
+# C++ reads `a less b and c` as `(a < b) && c` while biro has `a < (b && c)`,
+# only the subexpressions C++ reads as a unit can be replaced by a value.
+cpp_precedence = {
+    "||": 0,
+    "&&": 1,
+    "==": 2,
+    "<": 3,
+    ">": 3,
+    "+": 4,
+    "-": 4,
+    "*": 5,
+    "/": 5,
+}
+
+
+def binds(op: str, position: int, operand) -> bool:
+    """True when C++ reads `operand`, left (0) or right (1) of `op`, whole"""
+    if type(operand) is not nodes.BinOp:
+        return True
+    inner, outer = cpp_precedence[operand.op], cpp_precedence[op]
+    return inner > outer or (inner == outer and position == 0)
+
+
+def faithful(expression) -> bool:
+    """True when C++ reads the code of the expression as its tree"""
+    if type(expression) is not nodes.BinOp:
+        return True
+    op, left, right = expression.op, expression.left, expression.right
+    return (
+        binds(op, 0, left)
+        and binds(op, 1, right)
+        and faithful(left)
+        and faithful(right)
+    )
+
+
+def units(expression, unit: bool = True) -> t.List[bool]:
+    """
+    For each operand, whether C++ reads it whole, given whether it reads
+    `expression` whole. Arguments and items are always read whole.
+    """
+    if type(expression) is nodes.BinOp:
+        return [
+            unit and binds(expression.op, 0, expression.left),
+            unit and binds(expression.op, 1, expression.right),
+        ]
+    return [True] * len(children(expression))
+
+
+def children(expression) -> tuple:
+    """Operands of an expression, empty for leaves"""
+    kind = type(expression)
+    if kind is nodes.BinOp:
+        return (expression.left, expression.right)
+    if kind is nodes.Call or kind is nodes.BuiltinCall:
+        return expression.args
+    if kind is nodes.Collection:
+        return expression.items
+    return ()
+
+
+def names(expression) -> t.Set[str]:
+    """Variables read by an expression"""
+    if nodes.is_name(expression):
+        return {expression}
+    found = set()
+    for child in children(expression):
+        found |= names(child)
+    return found
+
+
+def is_pure(expression) -> bool:
+    """True when evaluating the expression has no side effects"""
+    kind = type(expression)
+    if kind is nodes.BinOp:
+        return is_pure(expression.left) and is_pure(expression.right)
+    if kind is nodes.BuiltinCall:
+        if len(expression.args) not in pure_builtins.get(expression.name, ()):
+            return False
+        return all(is_pure(arg) for arg in expression.args)
+    if kind is nodes.Call or kind is nodes.Collection:
+        return False
+    return True
+
+
+def may_throw(expression) -> bool:
+    if type(expression) is nodes.BuiltinCall:
+        if expression.name in throwing_builtins:
+            return True
+    return any(may_throw(child) for child in children(expression))
+
+
+def calls(expression) -> bool:
+    """True when `expression` calls a user function"""
+    if type(expression) is nodes.Call:
+        return True
+    return any(calls(child) for child in children(expression))
+
+
+def call_writes(call, global_names: t.Iterable[str]) -> t.Set[str]:
+    """Variables a call itself writes, not counting its arguments"""
+    if type(call) is nodes.Call:
+        # Functions take their arguments by value, only globals can change
+        return set(global_names)
+    if len(call.args) in writing_builtins.get(call.name, ()):
+        if nodes.is_name(call.args[0]):
+            return {call.args[0]}
+    return set()
+
+
+def expression_writes(expression, global_names) -> t.Set[str]:
+    found = set()
+    if type(expression) in (nodes.Call, nodes.BuiltinCall):
+        found |= call_writes(expression, global_names)
+    for child in children(expression):
+        found |= expression_writes(child, global_names)
+    return found
+
+
+def expressions(statement) -> tuple:
+    """Expressions a statement evaluates itself, not those of nested blocks"""
+    kind = type(statement)
+    if kind in (nodes.VarDecl, nodes.Assign, nodes.Donate):
+        return (statement.value,)
+    if kind is nodes.If:
+        return (statement.condition,)
+    if kind is nodes.Call or kind is nodes.BuiltinCall:
+        return (statement,)
+    return ()
+
+
+def statements(body: list) -> t.Iterator:
+    """Every statement of `body`, nested blocks and functions included"""
+    for statement in body:
+        yield statement
+        if type(statement) in compound_statements:
+            yield from statements(statement.body)
+
+
+def used_names(code: list, global_names) -> t.Set[str]:
+    """Every name of the program, generated names must not shadow them"""
+    found = set(global_names)
+    for statement in statements(code):
+        kind = type(statement)
+        if kind is nodes.VarDecl or kind is nodes.Assign:
+            found.add(statement.name)
+        elif kind is nodes.FunctionDef:
+            found.add(statement.name)
+            found.update(statement.args)
+        for expression in expressions(statement):
+            found |= names(expression)
+    return found
+
+
+def writes(body: list, global_names) -> t.Set[str]:
+    """
+    Variables that running the statements of `body` may write, including
+    the nested blocks but not the functions declared in them
+    """
+    found = set()
+    for statement in body:
+        kind = type(statement)
+        if kind is nodes.FunctionDef:
+            continue
+        if kind is nodes.VarDecl or kind is nodes.Assign:
+            found.add(statement.name)
+        for expression in expressions(statement):
+            found |= expression_writes(expression, global_names)
+        if kind in compound_statements:
+            found |= writes(statement.body, global_names)
+    return found
+
+
+def proceeds(body: list) -> bool:
+    """True when a `proceed` of `body` continues the loop running it"""
+    for statement in body:
+        kind = type(statement)
+        if kind is nodes.Proceed:
+            return True
+        if kind in (nodes.If, nodes.Try, nodes.Catch) and proceeds(
+            statement.body
+        ):
+            return True
+    return False
+
+
+class Scopes:
+    """
+    Variables declared in each scope of a program: the body of a function,
+    `main` for the code out of them or None for the globals. Variables are
+    keyed by `(scope, name)`.
+    """
+
+    def __init__(self, code: list, global_names) -> None:
+        self.global_names = global_names
+        self.main = id(code)
+        # Declared type of each variable, None when they disagree
+        self.types: t.Dict[tuple, t.Any] = {}
+        # Values the optimizer's temporaries are declared with
+        self.temporaries: t.Dict[tuple, tuple] = {}
+        self.locals: t.Dict[int, t.Set[str]] = {self.main: set()}
+        self.functions: t.Dict[str, t.List[nodes.FunctionDef]] = {}
+        self._declare(code, self.main)
+        for name, Type in global_names.items():
+            self._type((None, name), Type)
+
+    def _declare(self, body: list, scope: int) -> None:
+        for statement in body:
+            kind = type(statement)
+            if kind is nodes.VarDecl:
+                if statement.scope == Scope.GLOBAL:
+                    variable = (None, statement.name)
+                else:
+                    self.locals[scope].add(statement.name)
+                    variable = (scope, statement.name)
+                self._type(variable, statement.type)
+                if statement.type == "auto":
+                    self.temporaries[variable] = (statement.value, scope)
+            elif kind is nodes.FunctionDef:
+                self.functions.setdefault(statement.name, []).append(statement)
+                inner = id(statement.body)
+                self.locals[inner] = set(statement.args)
+                for name, Type in zip(statement.args, statement.types):
+                    self._type((inner, name), Type)
+                self._declare(statement.body, inner)
+            elif kind in compound_statements:
+                self._declare(statement.body, scope)
+
+    def _type(self, variable: tuple, Type) -> None:
+        if self.types.get(variable, Type) != Type:
+            Type = None
+        self.types[variable] = Type
+
+    def variable(self, name: str, scope: int) -> t.Optional[tuple]:
+        """Key of the variable `name` refers to in `scope`"""
+        if name in self.locals.get(scope, ()):
+            return (scope, name)
+        if name in self.global_names:
+            return (None, name)
+        return None
+
+    def type(self, name: str, scope: int):
+        """Declared type of `name` in `scope`, None when unknown"""
+        return self.types.get(self.variable(name, scope))
+
+
+# Floats count exactly up to 2^24, where `i + 1` rounds back to `i`
+float_counter_max = 1 << 24
+
+
+class CountedLoop(t.NamedTuple):
+    """
+    A loop counting `counter` up by one from the integer `start`, left when
+    `counter exit limit` holds. `exit` is `==` or `>`.
+    """
+
+    counter: str
+    start: int
+    exit: str
+    limit: t.Any
+    step: nodes.Assign
+
+
+def counted_loop(block: list, position: int, global_names):
+    """
+    The `CountedLoop` of the loop at `position` in `block`, None when it is
+    not of the form::
+
+        smallbiro i : num = 0
+        biro loop {
+            biro is i equals n? { leave }
+            ...
+            i = i + 1
+        }
+
+    The exit test can also be `i more n` or `n less i`. The counter must not
+    be written by the statements in between, `n` not at all in the loop.
+    """
+    body = block[position].body
+    if len(body) < 2:
+        return None
+    test, step = body[0], body[-1]
+    if type(test) is not nodes.If or type(step) is not nodes.Assign:
+        return None
+    if len(test.body) != 1 or type(test.body[0]) is not nodes.Leave:
+        return None
+    counter = step.name
+    if not _increments(step.value, counter):
+        return None
+
+    condition = test.condition
+    if type(condition) is not nodes.BinOp:
+        return None
+    op, left, right = condition.op, condition.left, condition.right
+    if op == "==" and left == counter:
+        exit, limit = "==", right
+    elif op == "==" and right == counter:
+        exit, limit = "==", left
+    elif op == ">" and left == counter:
+        exit, limit = ">", right
+    elif op == "<" and right == counter:
+        exit, limit = ">", left
+    else:
+        return None
+    if not is_pure(limit) or names(limit) & writes(body, global_names):
+        return None
+    if counter in writes(body[1:-1], global_names) or proceeds(body[1:-1]):
+        return None
+
+    start = _start(block, position, counter)
+    if start is None:
+        return None
+    return CountedLoop(counter, start, exit, limit, step)
+
+
+def _increments(value, counter: str) -> bool:
+    """True for `counter + 1` and `1 + counter`"""
+    if type(value) is not nodes.BinOp or value.op != "+":
+        return False
+    for one, name in ((value.right, value.left), (value.left, value.right)):
+        if type(one) is float and one == 1 and name == counter:
+            return True
+    return False
+
+
+def _start(block: list, position: int, counter: str) -> t.Optional[int]:
+    """Integer the counter is declared with right before the loop"""
+    for index in range(position - 1, -1, -1):
+        statement = block[index]
+        if type(statement) is not nodes.VarDecl:
+            return None
+        # Temporaries of the optimizer are computed in front of loops
+        if statement.type == "auto" and counter not in names(statement.value):
+            continue
+        value = statement.value
+        if statement.name != counter or statement.type != "num":
+            return None
+        if type(value) is not float or not value.is_integer():
+            return None
+        return int(value) if abs(value) <= float_counter_max else None
+    return None
+
+
+class LoopBounds(t.NamedTuple):
+    """
+    `biro.index` calls of a counted loop that stay in bounds when checks
+    made before the loop hold. `spans` maps an array to the lowest and the
+    highest offset from the counter it is indexed at, `covers` holds the
+    `(array, index)` pairs of indexes the loop does not change.
+    """
+
+    calls: t.Set[int]
+    spans: t.Dict[str, t.Tuple[int, int]]
+    covers: t.List[tuple]
+
+
+def loop_bounds(
+    body: list, counter: str, global_names, integer: t.Callable
+) -> t.Optional[LoopBounds]:
+    """
+    `LoopBounds` of the statements `body` of a counted loop, None when no
+    check can be made before it. Only innermost loops are considered and
+    only indexes `integer` is true for, the arrays must keep their size.
+    """
+    resized = set()
+    for statement in statements(body):
+        kind = type(statement)
+        if kind is nodes.Loop or kind is nodes.FunctionDef:
+            return None
+        if kind is nodes.VarDecl or kind is nodes.Assign:
+            resized.add(statement.name)
+        if any(calls(e) for e in expressions(statement)):
+            resized.update(global_names)
+    written = writes(body, global_names) | {counter}
+
+    bounds = LoopBounds(set(), {}, [])
+    for statement in statements(body):
+        for expression in expressions(statement):
+            for call in _index_calls(expression):
+                array, position = call.args[0], call.args[1]
+                if not nodes.is_name(array) or array in resized:
+                    continue
+                if not integer(position):
+                    continue
+                offset = _offset(position, counter)
+                if offset is not None:
+                    low, high = bounds.spans.get(array, (offset, offset))
+                    bounds.spans[array] = (min(low, offset), max(high, offset))
+                elif (
+                    is_pure(position)
+                    and not may_throw(position)
+                    and not names(position) & written
+                ):
+                    bounds.covers.append((array, position))
+                else:
+                    continue
+                bounds.calls.add(id(call))
+    return bounds if bounds.calls else None
+
+
+def _index_calls(expression) -> t.Iterator[nodes.BuiltinCall]:
+    if type(expression) is nodes.BuiltinCall and expression.name == "index":
+        if len(expression.args) in (2, 3):
+            yield expression
+    for child in children(expression):
+        yield from _index_calls(child)
+
+
+def _offset(position, counter: str) -> t.Optional[int]:
+    """`c` for the positions `counter + c`, `c + counter` and `counter - c`"""
+    if position == counter:
+        return 0
+    if type(position) is not nodes.BinOp or position.op not in ("+", "-"):
+        return None
+    left, right = position.left, position.right
+    if position.op == "+" and right == counter:
+        left, right = right, left
+    if left != counter or type(right) is not float:
+        return None
+    if not right.is_integer() or abs(right) > float_counter_max:
+        return None
+    return int(right) if position.op == "+" else -int(right)
+
+
+# Biro keyword of the operators spelled differently in C++
+keywords = {symbol: word for word, symbol in nodes.operator_symbols.items()}
+
+
+def source(expression) -> str:
+    """Biro spelling of an expression, for messages"""
+    kind = type(expression)
+    if kind is nodes.BinOp:
+        op = keywords.get(expression.op, expression.op)
+        return f"{source(expression.left)} {op} {source(expression.right)}"
+    if kind is nodes.Call or kind is nodes.BuiltinCall:
+        prefix = "biro." if kind is nodes.BuiltinCall else ""
+        args = ", ".join(source(arg) for arg in expression.args)
+        return f"{prefix}{expression.name}({args})"
+    if kind is nodes.Collection:
+        items = ", ".join(source(item) for item in expression.items)
+        return f"{expression.kind}[{items}]"
+    if kind is bool:
+        return "true" if expression else "false"
+    if kind is float and expression.is_integer() and abs(expression) < 1e16:
+        return str(int(expression))
+    return str(expression)
@@ -0,0 +1,207 @@
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import threading
+import typing as t
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class CompileCache:
+    """Content addressed store of generated C++ and compiled birocode binaries"""
+
+    cpp_name = "code.cpp"
+    binary_name = "code.birocode"
+    stats_name = "stats.json"
+
+    _stamp = None
+    _lock = threading.Lock()
+    # Keys of the entries being copied out in this process, never evicted
+    _held = collections.Counter()
+
+    def __init__(self, root: str, max_size: int = 512 * 1024 * 1024) -> None:
+        """
+        Constructor method
+
+        :param root: directory holding the cache entries
+        :type root: str
+        :param max_size: size in bytes after which least recently used entries are evicted
+        :type max_size: int
+        """
+        self.root = root
+        self.max_size = max_size
+        os.makedirs(self.root, exist_ok=True)
+
+    @classmethod
+    def stamp(cls) -> bytes:
+        """Hash of the compiler sources, they shape the C++ of every entry"""
+        with cls._lock:
+            if cls._stamp is None:
+                digest = hashlib.sha256()
+                here = os.path.dirname(os.path.abspath(__file__))
+                for name in sorted(os.listdir(here)):
+                    if name.endswith(".py"):
+                        digest.update(name.encode() + b"\0")
+                        with open(os.path.join(here, name), "rb") as f:
+                            digest.update(f.read())
+                cls._stamp = digest.digest()
+        return cls._stamp
+
+    @classmethod
+    def key(
+        cls,
+        pirocode: t.Union[str, t.Iterable[str]],
+        version: str,
+        toolchain: str,
+        runtime_path: str,
+        flags: t.Sequence[str],
+    ) -> str:
+        """
+        Hash everything that can change the produced binary. The code can be
+        given in pieces, it is hashed as it streams by.
+        """
+        h = hashlib.sha256()
+
+        def feed(part):
+            if isinstance(part, str):
+                part = part.encode()
+            h.update(str(len(part)).encode() + b":" + part)
+
+        source = hashlib.sha256()
+        for chunk in (pirocode,) if isinstance(pirocode, str) else pirocode:
+            source.update(chunk.encode())
+        feed(source.digest())
+        feed(version)
+        feed(cls.stamp())
+        feed(toolchain)
+        for name in sorted(os.listdir(runtime_path)):
+            feed(name)
+            with open(os.path.join(runtime_path, name), "rb") as f:
+                feed(f.read())
+        for flag in flags:
+            feed(flag)
+        return h.hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, key: str) -> t.Optional[str]:
+        """Return the entry directory for `key` or None, counting the lookup"""
+        entry = self._entry(key)
+        found = os.path.isfile(os.path.join(entry, self.cpp_name))
+        if found:
+            # mtime of the entry directory is the LRU clock
+            os.utime(entry)
+        self._count("hits" if found else "misses")
+        return entry if found else None
+
+    def staging(self, key: str) -> str:
+        """Path to write the C++ of `key` to before it is `put`"""
+        entry = self._entry(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        return f"{entry}.{os.getpid()}.{threading.get_ident()}.cpp"
+
+    def put(
+        self, key: str, cpp_file: str, binary_file: str, move: bool = False
+    ) -> None:
+        """Store copies of the files, `cpp_file` is moved in with `move`"""
+        entry = self._entry(key)
+        tmp = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        if move:
+            os.replace(cpp_file, os.path.join(tmp, self.cpp_name))
+        else:
+            shutil.copy2(cpp_file, os.path.join(tmp, self.cpp_name))
+        shutil.copy2(binary_file, os.path.join(tmp, self.binary_name))
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+        self.evict(keep=(key,))
+
+    @contextlib.contextmanager
+    def hold(self, key: str) -> t.Iterator[None]:
+        """Keep `evict` of this process off the entry of `key` meanwhile"""
+        with self._lock:
+            self._held[key] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._held[key] -= 1
+                if not self._held[key]:
+                    del self._held[key]
+
+    def _entries(self) -> t.List[t.Tuple[float, int, str]]:
+        entries = []
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            try:
+                found = list(os.scandir(shard.path))
+            except FileNotFoundError:
+                continue
+            for entry in found:
+                if not entry.is_dir() or entry.name.endswith(".tmp"):
+                    continue
+                # Entries are replaced and evicted by other compiles meanwhile
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    entries.append((entry.stat().st_mtime, size, entry.path))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def evict(self, keep: t.Iterable[str] = ()) -> t.List[str]:
+        """
+        Remove least recently used entries until the cache fits in `max_size`,
+        sparing those of the `keep` keys and the held ones
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        with self._lock:
+            kept = {self._entry(key) for key in (*keep, *self._held)}
+        removed = []
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            if path in kept:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed.append(path)
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        os.makedirs(self.root, exist_ok=True)
+
+    def size(self) -> t.Tuple[int, int]:
+        """Number of entries and their total size in bytes"""
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def stats(self) -> t.Dict[str, int]:
+        try:
+            with open(os.path.join(self.root, self.stats_name)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"hits": 0, "misses": 0}
+
+    def _count(self, field: str) -> None:
+        path = os.path.join(self.root, self.stats_name)
+        # Concurrent compiles take turns, each replacing the file whole
+        with open(f"{path}.lock", "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            stats = self.stats()
+            stats[field] = stats.get(field, 0) + 1
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(stats, f)
+            os.replace(tmp, path)
@@ -1,10 +1,15 @@
-from biro.middleware import BiroIntermediateCode, BiroBuiltins, Error, Scope
+from biro.middleware import BiroIntermediateCode, BiroBuiltins, BiroError, Scope
 from biro.lexerparser import Parser
+from biro import analysis, nodes
+from biro.emitter import Discard, Emitter
+from biro.inference import TypeInference
+from biro.ownership import Ownership
+import io
 import os
+import typing as t
 
 
 class CPP(BiroBuiltins):
-    code = []
     comment_mark = "//"
     namespace = "builtins"
 
@@ -22,6 +27,8 @@ class CPP(BiroBuiltins):
         "num": "float",
         "str": "std::string",
         "bool": "bool",
+        # Temporaries of the optimizer take the type of their value
+        "auto": "auto",
         ("a", "num"): "std::vector<float>",
         ("a", "str"): "std::vector<std::string>",
         ("a", "bool"): "std::vector<bool>",
@@ -33,244 +40,514 @@ class CPP(BiroBuiltins):
         ("s", "bool"): "std::stack<bool>",
     }
 
-    def __init__(self, parser: Parser) -> None:
+    # Standard headers declaring the types of the biro types
+    type_headers = {
+        "str": "<string>",
+        "a": "<vector>",
+        "q": "<queue>",
+        "s": "<stack>",
+    }
+    # Implementation files declare the headers they need on this line
+    requires_mark = "// requires:"
+
+    runtime_header = "biro_runtime.hpp"
+    build_marker = "biro-build: "
+
+    def __init__(
+        self,
+        parser: Parser,
+        use_runtime_header=False,
+        build_info=None,
+        num="float",
+        integers=True,
+        unchecked=False,
+    ) -> None:
         self.biro: BiroIntermediateCode = parser.biro
         self.parser = parser
+        # Emitter of the code being written, see `write`
+        self.out: t.Optional[Emitter] = None
+        # C++ type of the `num` values not known to be integers
+        self.num = num
+        self.initialization = {
+            Type: name.replace("float", num)
+            for Type, name in CPP.initialization.items()
+        }
+        # Generate the `num` variables holding only integers as `int64_t`
+        self.integers = integers
+        self.types = None
+        # Body of the function being made, the main code out of them
+        self.scope = None
+        # Index without bounds checks, `proven` holds the ids of the calls
+        # known to be in bounds where they are made
+        self.unchecked = unchecked
+        self.proven = set()
+        # Builtins (`say`, `loop`, ...) and standard headers the code uses
+        self.builtins = set()
+        self.headers = set()
+        # Include the (precompiled) runtime header instead of inlining it
+        self.use_runtime_header = use_runtime_header
+        # Description of the build embedded into the binary
+        self.build_info = build_info
+        # Statements are written by the method registered for their node
+        # class, classes without one (function declarations, bare
+        # collections) are not emitted in place
         self.type_func_mapping = {
-            "variable_declaration": (self._make_variable_declaration, ";"),
-            "variable_assignment": (self._make_variable_assignment, ";"),
-            "function_call": (self._make_function_call, ";"),
-            "builtin_call": (self._make_builtin_call, ";"),
-            "try_block": (self._make_try_block, ""),
-            "catch_block": (self._make_catch_block, ""),
-            "loop_statement": (self._make_loop_statement, ""),
-            "conditional_statement": (self._make_conditional_statement, ""),
-            "donate_statement": (self._make_donate_statement, ";"),
+            nodes.VarDecl: self._make_variable_declaration,
+            nodes.Assign: self._make_variable_assignment,
+            nodes.Call: self._make_call_statement,
+            nodes.BuiltinCall: self._make_call_statement,
+            nodes.Try: self._make_try_block,
+            nodes.Catch: self._make_catch_block,
+            nodes.Loop: self._make_loop_statement,
+            nodes.If: self._make_conditional_statement,
+            nodes.Donate: self._make_donate_statement,
+            nodes.Leave: self._make_leave_statement,
+            nodes.Proceed: self._make_proceed_statement,
+        }
+        self.expression_mapping = {
+            float: self._make_literal,
+            bool: self._make_literal,
+            str: self._make_literal,
+            nodes.BinOp: self._make_binary_operation,
+            nodes.Call: self._make_function_call,
+            nodes.BuiltinCall: self._make_builtin_call,
         }
 
-    def make(self):
-        # print(self.biro.getCode())
+    def make(self) -> str:
+        """The C++ code of the program"""
+        sink = io.StringIO()
+        self.write(sink)
+        return sink.getvalue()
+
+    def write(self, sink: t.TextIO) -> None:
+        """Write the C++ code of the program to `sink` as it is made"""
+        # Names of the program, generated variables must not shadow them
+        names = analysis.used_names(self.biro.getCode(), self.biro.getGlobals())
+        if self.integers:
+            self.types = TypeInference(self.biro, self.num)
+        self.ownership = Ownership(self.biro)
+        if self.unchecked and any(
+            type(statement) is nodes.Try
+            for statement in analysis.statements(self.biro.getCode())
+        ):
+            # The program may recover from an index out of bounds
+            self.unchecked = False
+        self.builtins = set()
+        self.headers = set()
+        if not self.use_runtime_header:
+            # The builtins and headers to inline in front of the program are
+            # those it uses, a first pass making it into nothing finds them
+            self.names = set(names)
+            self.out = Emitter(Discard())
+            self._make_program()
+        self.names = set(names)
+        self.out = Emitter(sink)
         self._make_header()
         self._make_includes()
         self._make_builtins()
+        self._make_program()
+
+    def _make_program(self) -> None:
+        self._make_build_info()
         self._make_globals()
         self._make_funcs()
         self._make_user_code()
-        return "\n".join(self.code)
 
     def _make_header(self) -> None:
-        code = ""
         for line in self.biro._header.split("\n"):
-            code += f"{self.comment_mark}{line}\n"
-        self.code.append(code)
+            self.out.line(f"{self.comment_mark}{line}")
 
     def _make_includes(self) -> None:
-        code = """
-        #include <iostream>
-        #include <string>
-        #include <vector>
-        #include <queue>
-        #include <stack>
-        #include <cmath>
-        """
-        self.code.append(code)
+        if self.use_runtime_header:
+            self.out.line(f'#include "{self.runtime_header}"')
+            return
+        headers = set(self.headers)
+        for implementation in self._implementations():
+            headers.update(self._requirements(implementation))
+        for header in sorted(headers):
+            self.out.line(f"#include {header}")
+
+    def _make_build_info(self) -> None:
+        if not self.build_info:
+            return
+        info = self.build_info.replace("\\", "\\\\").replace('"', '\\"')
+        self.out.line(f"{self.comment_mark} {self.build_info}")
+        self.out.line(
+            "__attribute__((used)) static const char biro_build_info[] = "
+            f'"{self.build_marker}{info}";'
+        )
 
     def _make_globals(self) -> None:
-        code = [
-            f"\t{self.initialization[Type]} {name};"
-            for name, Type in self.biro.getGlobals().items()
-        ]
-        self.code.append("\n".join(code))
+        for name, Type in self.biro.getGlobals().items():
+            self.out.line(f"{self._declared_type(name, Type)} {name};")
 
     def _make_funcs(self) -> None:
         for func, body in self.biro.getFunc().items():
-            code = f"""{
-                    self.initialization[body[1]] if body[1] != 'void' else 'void'
-                } {func[0]} ({
-                ",".join(
-                    [
-                        f"{self.initialization[types]} {names}"
-                        for names, types in zip(body[0], func[1])
-                    ]
-                )
-            }) {{
-                {self._make_statement_list(body[2])}
-            }}"""
-            self.code.append(code)
+            self.scope = id(body[2])
+            returned = "void" if body[1] == "void" else self._type_name(body[1])
+            parameters = ", ".join(
+                f"{self._parameter_type(name, Type)} {name}"
+                for name, Type in zip(body[0], func[1])
+            )
+            with self.out.block(f"{returned} {func[0]}({parameters})"):
+                self._make_statement_list(body[2])
 
     def _make_builtins(self) -> None:
-        builtins = "\n".join(
-            [
-                self._builtin_say(),
-                self._builtin_ask(),
-                self._builtin_index(),
-                self._builtin_len(),
-            ]
-        )
-        code = f"""
-        namespace builtins{{
-            {builtins}
-        }}
-        """
-        self.code.append(code)
+        if self.use_runtime_header or not self.builtins:
+            return
+        with self.out.block(f"namespace {self.namespace}"):
+            for implementation in self._implementations():
+                self.out.text(implementation)
 
     def _make_user_code(self):
         user_code = self.biro.getCode()
-        self.code.append("int main() {")
-        code = self._make_statement_list(user_code)
-        self.code.append(code)
-        self.code.append("return 0; }")
-
-    def _make_statement_list(self, statements):
-        code = []
-        for token in statements:
-            # print("\t*\t", token)
-            if token is None:
-                continue
-            Type = token[0]
-            if isinstance(token, list):
-                code.append(self._make_statement_list(token))
-                continue
-            elif Type not in self.type_func_mapping:
-                # print("type:", Type)
-                continue
-            making_method = self.type_func_mapping[Type]
-            code.append(making_method[0](token) + making_method[1])
-        return "\n".join(code)
-
-    def _make_variable_declaration(self, token):
-        init = ""
-        if token[1] == Scope().LOCAL:
-            init = self.initialization[token[2]]
-        code = f"{init} {self._make_assigned_expression(token[4], token[3])}"
-        return code
+        self.scope = id(user_code)
+        with self.out.block("int main()"):
+            self._make_statement_list(user_code)
+            self.out.line("return 0;")
+
+    def _make_statement_list(self, statements) -> None:
+        mapping = self.type_func_mapping
+        for position, token in enumerate(statements):
+            if type(token) is nodes.Loop:
+                counted = analysis.counted_loop(
+                    statements, position, self.biro.getGlobals()
+                )
+                if counted:
+                    self._make_counted_loop(token, counted)
+                    continue
+            making_method = mapping.get(type(token))
+            if making_method is not None:
+                making_method(token)
+
+    def _make_variable_declaration(self, token) -> None:
+        declared = ""
+        if token.scope == Scope.LOCAL:
+            declared = self._declared_type(token.name, token.type)
+        self._make_assigned_expression(token.value, token.name, declared)
 
     def _make_variable_assignment(self, token) -> None:
-        code = self._make_assigned_expression(token[2], token[1])
-        return code
-
-    def _make_assigned_expression(self, expression, iden):
-        if (
-            hasattr(expression, "__getitem__")
-            and expression[0] == "array_declaration"
-        ):
-            return self._make_array_declaration(expression[1], iden)
-        elif (
-            hasattr(expression, "__getitem__")
-            and expression[0] == "queue_declaration"
-        ):
-            return self._make_queue_declaration(expression[1], iden)
-        elif (
-            hasattr(expression, "__getitem__")
-            and expression[0] == "stack_declaration"
-        ):
-            return self._make_stack_declaration(expression[1], iden)
+        move = self.ownership.moves.get(id(token))
+        if move:
+            self._make_moving_call(token.value, move, f"{token.name} = ")
+            return
+        self._make_assigned_expression(token.value, token.name)
+
+    def _make_assigned_expression(self, expression, iden, declared="") -> None:
+        """`iden` takes the value of `expression`, declared as `declared`"""
+        if type(expression) is nodes.Collection:
+            if declared:
+                self.out.line(f"{declared} {iden};")
+            if expression.kind == "a":
+                self._make_array_declaration(expression.items, iden)
+            elif expression.kind == "q":
+                self._make_queue_declaration(expression.items, iden)
+            else:
+                self._make_stack_declaration(expression.items, iden)
+            return
+        if self._integer_variable(iden):
+            value = self._make_integer(expression)
         else:
-            return f"{iden} = {self._make_expression(expression)}"
+            value = self._make_expression(expression)
+        declared = f"{declared} " if declared else ""
+        self.out.line(f"{declared}{iden} = {value};")
+
+    def _parameter_type(self, name, Type) -> str:
+        if self.ownership.is_reference(name, self.scope):
+            # Containers the function only reads are not copied
+            return f"const {self._type_name(Type)}&"
+        return self._declared_type(name, Type)
+
+    def _declared_type(self, name, Type) -> str:
+        if self._integer_variable(name):
+            self.headers.add("<cstdint>")
+            return "int64_t"
+        return self._type_name(Type)
+
+    def _type_name(self, Type) -> str:
+        """C++ type of a biro type, its header is included"""
+        for part in Type if isinstance(Type, tuple) else (Type,):
+            if part in self.type_headers:
+                self.headers.add(self.type_headers[part])
+        return self.initialization[Type]
+
+    def _integer_variable(self, name) -> bool:
+        if self.types is None:
+            return False
+        return self.types.is_integer_variable(name, self.scope)
+
+    def _integer(self, expression) -> bool:
+        if self.types is None:
+            return False
+        return self.types.is_integer(expression, self.scope)
+
+    def _make_integer(self, expression) -> str:
+        """Code of an integer expression computed in `int64_t`"""
+        if self._constant(expression):
+            value = self.types.interval(expression, self.scope)[0]
+            return str(value) if abs(value) < 1 << 31 else f"{value}LL"
+        kind = type(expression)
+        if kind is nodes.BinOp:
+            left = self._make_integer(expression.left)
+            right = self._make_integer(expression.right)
+            return f"{left} {expression.op} {right}"
+        if kind is nodes.BuiltinCall:
+            # `len`, the only builtin giving integers
+            self.builtins.add("len")
+            container = self._make_expression(expression.args[0])
+            return f"{self.namespace}::size({container})"
+        return expression
+
+    def _constant(self, expression) -> bool:
+        if type(expression) is nodes.BinOp:
+            return self._constant(expression.left) and self._constant(
+                expression.right
+            )
+        return type(expression) is float
 
     def _make_expression(self, expression):
-        if isinstance(expression, (float, bool)):
-            return str(expression).lower()
+        if type(expression) is not float and self._integer(expression):
+            # The integers are converted back where a number is expected
+            original = self.types.original(expression, self.scope)
+            return f"static_cast<{original}>({self._make_integer(expression)})"
+        making_method = self.expression_mapping.get(type(expression))
+        if making_method is None:
+            raise BiroError(
+                f"Internal error while making expression {expression!r}"
+            )
+        return making_method(expression)
+
+    def _make_literal(self, expression):
+        if nodes.is_string(expression):
+            self.headers.add("<string>")
+            return f"std::string({expression})"
         if isinstance(expression, str):
-            if expression[0] == expression[-1] == '"':
-                return f"std::string({expression})"
-            else:
-                return expression
-        if not isinstance(expression, tuple):
-            print(expression)
-            Error().show("Internal error while making expression")
-            exit(1)
-        if expression[0] == "builtin_call":
-            return self._make_builtin_call(expression)
-        if expression[0] == "function_call":
-            return self._make_function_call(expression)
-        else:
-            p = {
-                "equals": "==",
-                "more": ">",
-                "less": "<",
-                "and": "&&",
-                "or": "||",
-            }
-            symbol = expression[0]
-            if symbol in p:
-                symbol = p[symbol]
-            return f"{self._make_expression(expression[1])} {symbol} {self._make_expression(expression[2])}"
+            return expression
+        return str(expression).lower()
+
+    def _make_binary_operation(self, expression):
+        left, right = expression.left, expression.right
+        if expression.op in ("==", "<", ">"):
+            if self._integer(left) and self._integer(right):
+                return f"{self._make_integer(left)} {expression.op} {self._make_integer(right)}"
+        return f"{self._make_expression(expression.left)} {expression.op} {self._make_expression(expression.right)}"
 
     def _make_builtin_call(self, expression):
-        return f"{self.namespace}::{self._make_function_call(expression[1])}"
+        self.builtins.add(expression.name)
+        if expression.name == "index" and len(expression.args) > 1:
+            name = "index"
+            if self.unchecked or id(expression) in self.proven:
+                name = "index_unchecked"
+            args = list(map(self._make_expression, expression.args))
+            if self.types and self.types.is_index(
+                expression.args[1], self.scope
+            ):
+                args[1] = self._make_integer(expression.args[1])
+            return f"{self.namespace}::{name}({','.join(args)})"
+        return f"{self.namespace}::{self._make_function_call(expression)}"
+
+    def _make_call_statement(self, expression) -> None:
+        self.out.line(
+            f"{self.expression_mapping[type(expression)](expression)};"
+        )
 
     def _make_function_call(self, expression):
-        # print(expression)
-        return f"{expression[1]}({','.join([self._make_expression(i) for i in expression[2]])})"
+        return (
+            f"{expression.name}({','.join(self._make_arguments(expression))})"
+        )
+
+    def _make_arguments(self, expression) -> list:
+        if type(expression) is nodes.Call and self.types:
+            integers = self.types.integer_parameters(expression.name)
+            args = [
+                (
+                    self._make_integer(arg)
+                    if integer
+                    else self._make_expression(arg)
+                )
+                for arg, integer in zip(expression.args, integers)
+            ]
+            args += map(self._make_expression, expression.args[len(args) :])
+            return args
+        return [self._make_expression(i) for i in expression.args]
 
-    def _make_array_declaration(self, expression, iden):
-        code = []
+    def _make_moving_call(self, expression, move, assignment) -> None:
+        """
+        Call moving the container at `move.position` into the function, the
+        arguments reading it are computed before
+        """
+        args = self._make_arguments(expression)
+        early = []
+        for position in move.early:
+            name = self._unused_name("_biro_arg")
+            self.names.add(name)
+            early.append(f"auto {name} = {args[position]};")
+            args[position] = name
+        args[move.position] = f"std::move({args[move.position]})"
+        self.headers.add("<utility>")
+        call = f"{assignment}{expression.name}({','.join(args)});"
+        if not early:
+            self.out.line(call)
+            return
+        with self.out.block():
+            for line in early:
+                self.out.line(line)
+            self.out.line(call)
+
+    def _make_array_declaration(self, expression, iden) -> None:
         for i in expression:
-            code.append(f"{iden}.push_back({self._make_expression(i)});")
-        return "\n".join(code)
+            self.out.line(f"{iden}.push_back({self._make_expression(i)});")
 
-    def _make_queue_declaration(self, expression, iden):
-        code = []
+    def _make_queue_declaration(self, expression, iden) -> None:
         for i in expression:
-            code.append(f"{iden}.push({self._make_expression(i)});")
-        return "\n".join(code)
+            self.out.line(f"{iden}.push({self._make_expression(i)});")
 
-    def _make_stack_declaration(self, expression, iden):
-        code = []
+    def _make_stack_declaration(self, expression, iden) -> None:
         for i in expression:
-            code.append(f"{iden}.push({self._make_expression(i)});")
-        return "\n".join(code)
-
-    def _make_try_block(self, expression):
-        return f"""
-        try{{
-            {self._make_statement_list(expression[1])}
-        }}
-        """
+            self.out.line(f"{iden}.push({self._make_expression(i)});")
 
-    def _make_catch_block(self, expression):
-        return f"""
-        catch(const std::exception& e){{
-            {self._make_statement_list(expression[1])}
-        }}
-        """
+    def _make_try_block(self, expression) -> None:
+        with self.out.block("try"):
+            self._make_statement_list(expression.body)
 
-    def _make_loop_statement(self, expression):
-        return f"while(true){{ {self._make_control_flow_statements_list(expression[1])} }}"
+    def _make_catch_block(self, expression) -> None:
+        self.headers.add("<exception>")
+        with self.out.block("catch(const std::exception& e)"):
+            self._make_statement_list(expression.body)
 
-    def _make_control_flow_statements_list(self, expression):
-        code = []
-        for i in expression:
-            if isinstance(i, tuple):
-                if i[0] == "leave":
-                    code.append("break;")
-                elif i[0] == "proceed":
-                    code.append("continue;")
-                elif i[0] == "donate_statement":
-                    code.append(f"return {self._make_expression(i[1])};")
-            else:
-                code.append(self._make_statement_list(i))
-        return "\n".join(code)
-
-    def _make_conditional_statement(self, expression):
-        return f"""
-        if({self._make_expression(expression[1])}){{
-            {self._make_control_flow_statements_list(expression[2])}
-        }}
+    def _make_loop_statement(self, expression) -> None:
+        with self.out.block("while(true)"):
+            self._make_statement_list(expression.body)
+
+    def _make_counted_loop(self, expression, counted) -> None:
         """
+        `for` loop on an integer induction variable, the exit test and the
+        increment of the counter are replaced by the bounds of the loop
+        """
+        self.builtins.add("loop")
+        induction = self._unused_name("_biro_k")
+        end = self._unused_name("_biro_end")
+        ends = {"==": "loop_end_equals", ">": "loop_end_more"}
+        body = expression.body[1:-1]
+        pragmas = []
+        if not self._stores(body):
+            pragmas.append("#pragma GCC ivdep")
+        if not any(type(s) is nodes.Loop for s in analysis.statements(body)):
+            pragmas.append("#pragma GCC unroll 4")
+        bounds = None
+        if self.types and not self.unchecked:
+            bounds = analysis.loop_bounds(
+                body,
+                counted.counter,
+                self.biro.getGlobals(),
+                lambda position: self.types.is_index(position, self.scope),
+            )
+        limit = self._make_expression(counted.limit)
+        end_value = f"{self.namespace}::{ends[counted.exit]}<{self.num}>({counted.start}, {limit})"
+        step = f"{counted.counter} = {self.namespace}::loop_index<{self.num}>(++{induction})"
+        if bounds is None:
+            for pragma in pragmas:
+                self.out.line(pragma)
+            with self.out.block(
+                f"for(int64_t {induction} = {counted.start}, {end} = {end_value}; {induction} != {end}; {step})"
+            ):
+                self._make_statement_list(body)
+            return
+
+        # The bounds checks are made once before the loop, which runs
+        # without them when they pass and as it was written otherwise
+        checks = [
+            f"{self.namespace}::spans({array}, {counted.start}, {end}, {low}, {high})"
+            for array, (low, high) in bounds.spans.items()
+        ]
+        checks += [
+            f"{self.namespace}::covers({array}, {self._make_integer(position)})"
+            for array, position in bounds.covers
+        ]
+        head = f"for(int64_t {induction} = {counted.start}; {induction} != {end}; {step})"
+        with self.out.block():
+            self.out.line(f"int64_t {end} = {end_value};")
+            for condition, proven in (
+                (f"if({' && '.join(checks)})", bounds.calls),
+                ("else", set()),
+            ):
+                with self.out.block(condition):
+                    for pragma in pragmas:
+                        self.out.line(pragma)
+                    self.proven = proven
+                    with self.out.block(head):
+                        self._make_statement_list(body)
+                    self.proven = set()
+
+    def _stores(self, body) -> bool:
+        """True when `body` may write to the elements of a container"""
+        for statement in analysis.statements(body):
+            for expression in analysis.expressions(statement):
+                if analysis.expression_writes(expression, ()):
+                    return True
+                if analysis.calls(expression):
+                    return True
+            value = getattr(statement, "value", None)
+            if type(value) is nodes.Collection:
+                return True
+        return False
+
+    def _unused_name(self, name: str) -> str:
+        """`name`, suffixed when the program already uses it"""
+        unused, suffix = name, 0
+        while unused in self.names:
+            suffix += 1
+            unused = f"{name}{suffix}"
+        return unused
+
+    def _make_conditional_statement(self, expression) -> None:
+        with self.out.block(
+            f"if({self._make_expression(expression.condition)})"
+        ):
+            self._make_statement_list(expression.body)
+
+    def _make_donate_statement(self, expression) -> None:
+        move = self.ownership.moves.get(id(expression))
+        if move:
+            self._make_moving_call(expression.value, move, "return ")
+            return
+        self.out.line(f"return {self._make_expression(expression.value)};")
+
+    def _make_leave_statement(self, expression) -> None:
+        self.out.line("break;")
 
-    def _make_donate_statement(self, expression) -> str:
-        return f"return {self._make_expression(expression[1])}"
+    def _make_proceed_statement(self, expression) -> None:
+        self.out.line("continue;")
 
     def getImplementation(self, file):
         file = os.path.abspath(os.path.join(self.implementation_path, file))
         if not os.path.exists(file) or not os.path.isfile(file):
-            Error().show(f"Implementation error:\n\tFile {file} not found")
-            exit(1)
+            raise BiroError(f"Implementation error:\n\tFile {file} not found")
         with open(file) as f:
             return f.read()
 
+    def _implementations(self) -> t.List[str]:
+        """Code of the builtins used, in the order of the runtime header"""
+        builtins = {
+            "say": self._builtin_say,
+            "ask": self._builtin_ask,
+            "index": self._builtin_index,
+            "len": self._builtin_len,
+            "loop": self._builtin_loop,
+        }
+        return [
+            implementation()
+            for name, implementation in builtins.items()
+            if name in self.builtins
+        ]
+
+    def _requirements(self, implementation: str) -> t.List[str]:
+        """Headers an implementation file declares on its first line"""
+        first = implementation.split("\n", 1)[0]
+        if not first.startswith(self.requires_mark):
+            return []
+        return first[len(self.requires_mark) :].split()
+
     def _builtin_say(self) -> str:
         return self.getImplementation("builtin_say.cpp")
 
@@ -282,3 +559,6 @@ class CPP(BiroBuiltins):
 
     def _builtin_len(self) -> str:
         return self.getImplementation("builtin_len.cpp")
+
+    def _builtin_loop(self) -> str:
+        return self.getImplementation("builtin_loop.cpp")
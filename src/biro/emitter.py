@@ -0,0 +1,63 @@
+import contextlib
+import typing as t
+
+
+class Emitter:
+    """
+    Writes generated code line by line to a file-like `sink`, indented by the
+    number of blocks open. Nothing is kept once it is written.
+    """
+
+    def __init__(self, sink: t.TextIO, indent: str = "    ") -> None:
+        """
+        Constructor method
+
+        :param sink: object with a `write` method taking strings
+        :type sink: t.TextIO
+        :param indent: text added in front of the lines for each open block
+        :type indent: str
+        """
+        self.sink = sink
+        self.indent = indent
+        self.depth = 0
+
+    def line(self, text: str = "") -> None:
+        """Write `text` as a line at the current indentation"""
+        if text:
+            self.sink.write(f"{self.indent * self.depth}{text}\n")
+        else:
+            self.sink.write("\n")
+
+    def text(self, text: str) -> None:
+        """Write `text` as it is, for code already laid out"""
+        self.sink.write(text if text.endswith("\n") else f"{text}\n")
+
+    @contextlib.contextmanager
+    def block(self, opening: str = "", closing: str = "}") -> t.Iterator[None]:
+        """Lines written in the `with` go in `opening { ... }`, indented"""
+        self.line(f"{opening} {{" if opening else "{")
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+        self.line(closing)
+
+
+class Discard:
+    """Sink forgetting what is written, for the passes made to learn something"""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+class Tee:
+    """Sink writing to every one of `sinks`"""
+
+    def __init__(self, *sinks: t.TextIO) -> None:
+        self.sinks = sinks
+
+    def write(self, text: str) -> int:
+        for sink in self.sinks:
+            sink.write(text)
+        return len(text)
@@ -0,0 +1,440 @@
+import re
+import typing as t
+from biro.lexerparser import Parser, function_return_type
+from biro.middleware import Scope, BiroSyntaxError, BiroIntermediateCode
+from biro import nodes
+
+
+class Token:
+    __slots__ = ("type", "value", "lineno")
+
+    def __init__(self, type, value, lineno):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+
+    def __repr__(self):
+        return f"Token({self.type}, {self.value!r}, {self.lineno})"
+
+
+class Lexer:
+    """
+    Single pass lexer producing the same tokens as the PLY rules of `Parser`.
+    It dispatches on the current character instead of trying one big
+    alternation of every token pattern.
+    """
+
+    reserved = Parser.reserved
+
+    # Same patterns as Parser.t_ID and Parser.t_NUMBER
+    _id = re.compile(r"[a-zA-Z_][a-zA-Z_0-9]*(?!\[)")
+    _number = re.compile(r"[+-]?([0-9]*[.])?[0-9]+")
+
+    _punctuation = {
+        "(": "LPAREN",
+        ")": "RPAREN",
+        "{": "LCURL",
+        "}": "RCURL",
+        ".": "DOT",
+        "+": "PLUS",
+        "-": "MINUS",
+        "*": "ASTERISK",
+        "/": "DIVIDE",
+        "?": "QUESMARK",
+        ",": "COMMA",
+        "[": "LSQUARE",
+        "]": "RSQUARE",
+        "=": "ASSIGN",
+        ">": "MORE",
+        "<": "LESS",
+        ":": "COLON",
+    }
+    _literals = {"a": "LITERAL_A", "q": "LITERAL_Q", "s": "LITERAL_S"}
+    _id_start = frozenset(
+        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+    )
+    _number_start = frozenset("0123456789.+-")
+
+    def tokenize(self, text: str) -> t.Iterator[Token]:
+        return self.tokenize_stream((text,))
+
+    def tokenize_stream(
+        self, chunks: t.Iterable[str], lineno: int = 1
+    ) -> t.Iterator[Token]:
+        """
+        Tokens of the code given as consecutive pieces, starting at line
+        `lineno`. Only the text after the last separator seen so far is kept
+        between pieces, so memory does not grow with the size of the code.
+        """
+        reserved = self.reserved
+        punctuation = self._punctuation
+        id_start = self._id_start
+        number_start = self._number_start
+        match_id = self._id.match
+        match_number = self._number.match
+        text = ""
+        chunks = iter(chunks)
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            if chunk is None:
+                final = True
+                limit = len(text)
+            else:
+                text += chunk
+                # Tokens other than strings and comments never span a space,
+                # comma or newline, so everything before the last one can be
+                # tokenized without looking at the next piece
+                limit = 1 + max(
+                    text.rfind("\n"), text.rfind(" "), text.rfind(",")
+                )
+            pos = 0
+            while pos < limit:
+                c = text[pos]
+                if c == " " or c == "\t":
+                    pos += 1
+                    continue
+                if c == "\n":
+                    lineno += 1
+                    pos += 1
+                    continue
+                if c in id_start:
+                    m = match_id(text, pos)
+                    if m:
+                        value = m.group()
+                        pos = m.end()
+                        kind = reserved.get(value, "ID")
+                        if kind == "TRUE":
+                            value = True
+                        elif kind == "FALSE":
+                            value = False
+                        yield Token(kind, value, lineno)
+                        continue
+                    if c in self._literals:
+                        # Only reached when `[` follows a single letter
+                        yield Token(self._literals[c], c, lineno)
+                        pos += 1
+                        continue
+                elif c == '"':
+                    close = text.find('"', pos + 1)
+                    if close == -1 and not final:
+                        break
+                    if close != -1:
+                        yield Token("STRING", text[pos : close + 1], lineno)
+                        pos = close + 1
+                        continue
+                if c in number_start:
+                    m = match_number(text, pos)
+                    if m:
+                        yield Token("NUMBER", float(m.group()), lineno)
+                        pos = m.end()
+                        continue
+                if c == "/" and text.startswith("//", pos):
+                    newline = text.find("\n", pos)
+                    if newline == -1 and not final:
+                        break
+                    pos = len(text) if newline == -1 else newline
+                    continue
+                if c == "=" and text.startswith("==", pos):
+                    yield Token("EQUALS", "==", lineno)
+                    pos += 2
+                    continue
+                kind = punctuation.get(c)
+                if kind is None:
+                    print(f"Illegal character '{c}'")
+                    pos += 1
+                    continue
+                yield Token(kind, c, lineno)
+                pos += 1
+            text = text[pos:]
+
+
+class FastParser:
+    """
+    Hand written recursive descent parser with Pratt style expressions for the
+    grammar in `src/biro/grammar`. Produces the very same AST as `Parser`.
+    """
+
+    # Binding power of the binary operators, mirrors Parser.precedence
+    binding_power = {
+        "LESS": 1,
+        "MORE": 1,
+        "EQUALS": 1,
+        "PLUS": 2,
+        "MINUS": 2,
+        "ASTERISK": 3,
+        "DIVIDE": 3,
+        "AND": 5,
+        "OR": 5,
+    }
+    nonassoc = frozenset(("LESS", "MORE", "EQUALS"))
+
+    _statement_start = frozenset(
+        ("BIRO", "SMALLBIRO", "ID", "LITERAL_A", "LITERAL_Q", "LITERAL_S")
+    )
+    _expression_start = frozenset(
+        ("ID", "STRING", "NUMBER", "TRUE", "FALSE", "BIRO")
+    )
+    _base_types = frozenset(("NUM", "STR", "BOOL"))
+    _collections = {"LITERAL_A": "a", "LITERAL_Q": "q", "LITERAL_S": "s"}
+
+    def __init__(self):
+        self.biro = BiroIntermediateCode()
+        self.lexer = Lexer()
+
+    def parse(self, code, biro=None, lineno=1):
+        """
+        Parse `code`, either a string or an iterable of consecutive pieces.
+        `biro` holds the globals and functions of the code before it, which
+        starts at line `lineno`.
+        """
+        self.biro = biro or BiroIntermediateCode()
+        if isinstance(code, str):
+            code = (code,)
+        self._tokens = self.lexer.tokenize_stream(code, lineno)
+        self._lookahead = []
+        program = self._statement_list()
+        if self._peek().type != "$end":
+            self._error(self._peek())
+        self.biro.setCode(program)
+
+    # Token stream
+
+    def _peek(self, k=0):
+        while len(self._lookahead) <= k:
+            token = next(self._tokens, None)
+            if token is None:
+                token = Token("$end", None, None)
+            self._lookahead.append(token)
+        return self._lookahead[k]
+
+    def _next(self):
+        token = self._peek()
+        del self._lookahead[0]
+        return token
+
+    def _expect(self, kind):
+        token = self._next()
+        if token.type != kind:
+            self._error(token)
+        return token
+
+    def _error(self, token):
+        if token.type == "$end":
+            raise BiroSyntaxError()
+        raise BiroSyntaxError(token.lineno, token.value)
+
+    # Statements
+
+    def _statement_list(self):
+        statements = []
+        start = self._statement_start
+        while self._peek().type in start:
+            statements.append(self._statement())
+        return statements
+
+    def _statement(self):
+        token = self._peek()
+        kind = token.type
+        if kind == "BIRO":
+            follow = self._peek(1).type
+            if follow == "ID":
+                if self._peek(2).type == "LPAREN":
+                    return self._function_declaration()
+                return self._variable_declaration()
+            if follow == "IS":
+                return self._conditional_statement()
+            if follow == "LOOP":
+                self._next()
+                self._next()
+                return nodes.Loop(self._control_flow_block(), token.lineno)
+            if follow == "ATTEMPT":
+                self._next()
+                self._next()
+                return nodes.Try(self._statement_block(), token.lineno)
+            if follow == "ARREST":
+                self._next()
+                self._next()
+                return nodes.Catch(self._statement_block(), token.lineno)
+            if follow == "DOT":
+                return self._builtin_call()
+            self._next()
+            self._error(self._next())
+        if kind == "SMALLBIRO":
+            return self._variable_declaration()
+        if kind == "ID":
+            if self._peek(1).type == "LPAREN":
+                return self._function_call()
+            name = self._next()
+            self._expect("ASSIGN")
+            return nodes.Assign(
+                name.value, self._assigned_expression(), name.lineno
+            )
+        return self._collection()
+
+    def _variable_declaration(self):
+        keyword = self._next()
+        name = self._expect("ID")
+        self._expect("COLON")
+        typ = self._type()
+        self._expect("ASSIGN")
+        expression = self._assigned_expression()
+        if keyword.type == "BIRO":
+            scope = Scope.GLOBAL
+            self.biro.setGlobal(name.value, typ, name.lineno, 0)
+        else:
+            scope = Scope.LOCAL
+        return nodes.VarDecl(scope, typ, name.value, expression, name.lineno)
+
+    def _conditional_statement(self):
+        lineno = self._next().lineno
+        self._next()
+        condition = self._expression()
+        self._expect("QUESMARK")
+        return nodes.If(condition, self._control_flow_block(), lineno)
+
+    def _function_declaration(self):
+        self._next()
+        token = self._next()
+        name = token.value
+        self._expect("LPAREN")
+        args = self._comma_list(lambda: self._expect("ID").value, ("ID",))
+        self._expect("RPAREN")
+        self._expect("COLON")
+        self._expect("LPAREN")
+        types = self._comma_list(
+            self._type, ("NUM", "STR", "BOOL", *self._collections)
+        )
+        self._expect("RPAREN")
+        self._expect("LCURL")
+        block = []
+        while True:
+            kind = self._peek().type
+            if kind == "DONATE":
+                lineno = self._next().lineno
+                block.append(nodes.Donate(self._expression(), lineno))
+            elif kind in self._statement_start:
+                block += self._statement_list()
+            else:
+                break
+        self._expect("RCURL")
+        return_type = function_return_type(name, args, types)
+        self.biro.setFunc(
+            name=name,
+            arg_names=args,
+            arg_type=types,
+            return_type=return_type,
+            block=block,
+        )
+        return nodes.FunctionDef(
+            name, args, types, return_type, block, token.lineno
+        )
+
+    def _statement_block(self):
+        self._expect("LCURL")
+        statements = self._statement_list()
+        self._expect("RCURL")
+        return statements
+
+    def _control_flow_block(self):
+        self._expect("LCURL")
+        statements = []
+        while True:
+            kind = self._peek().type
+            if kind == "LEAVE":
+                statements.append(nodes.Leave(self._next().lineno))
+            elif kind == "PROCEED":
+                statements.append(nodes.Proceed(self._next().lineno))
+            elif kind == "DONATE":
+                lineno = self._next().lineno
+                statements.append(nodes.Donate(self._expression(), lineno))
+            elif kind in self._statement_start:
+                statements += self._statement_list()
+            else:
+                break
+        self._expect("RCURL")
+        return statements
+
+    def _type(self):
+        token = self._next()
+        if token.type in self._base_types:
+            return token.value
+        if token.type not in self._collections:
+            self._error(token)
+        self._expect("LSQUARE")
+        inner = self._next()
+        if inner.type not in self._base_types:
+            self._error(inner)
+        self._expect("RSQUARE")
+        return (token.value, inner.value)
+
+    def _comma_list(self, item, start):
+        """`item COMMA list | item | empty`, a trailing comma adds nothing"""
+        if self._peek().type not in start:
+            return []
+        items = [item()]
+        while self._peek().type == "COMMA":
+            self._next()
+            if self._peek().type not in start:
+                break
+            items.append(item())
+        return items
+
+    # Expressions
+
+    def _assigned_expression(self):
+        if self._peek().type in self._collections:
+            return self._collection()
+        return self._expression()
+
+    def _collection(self):
+        token = self._next()
+        kind = self._collections.get(token.type)
+        if kind is None:
+            self._error(token)
+        self._expect("LSQUARE")
+        items = self._comma_list(self._expression, self._expression_start)
+        self._expect("RSQUARE")
+        return nodes.Collection(kind, items, token.lineno)
+
+    def _function_call(self):
+        name = self._expect("ID")
+        self._expect("LPAREN")
+        args = self._comma_list(self._expression, self._expression_start)
+        self._expect("RPAREN")
+        return nodes.Call(name.value, args, name.lineno)
+
+    def _builtin_call(self):
+        lineno = self._next().lineno
+        self._expect("DOT")
+        call = self._function_call()
+        return nodes.BuiltinCall(call.name, call.args, lineno)
+
+    def _primary(self):
+        token = self._peek()
+        kind = token.type
+        if kind == "ID":
+            if self._peek(1).type == "LPAREN":
+                return self._function_call()
+            return self._next().value
+        if kind in ("STRING", "NUMBER", "TRUE", "FALSE"):
+            return self._next().value
+        if kind == "BIRO":
+            return self._builtin_call()
+        self._error(self._next())
+
+    def _expression(self, min_power=1):
+        left = self._primary()
+        binding_power = self.binding_power
+        while True:
+            token = self._peek()
+            power = binding_power.get(token.type)
+            if power is None or power < min_power:
+                return left
+            self._next()
+            right = self._expression(power + 1)
+            left = nodes.BinOp(token.value, left, right, token.lineno)
+            if token.type in self.nonassoc:
+                follow = self._peek()
+                if binding_power.get(follow.type) == power:
+                    self._error(follow)
@@ -0,0 +1,327 @@
+import itertools
+import typing as t
+from biro import analysis, nodes
+from biro.middleware import BiroIntermediateCode
+
+# Largest integer up to which the C++ types of `num` hold every integer
+exact_limits = {"float": 1 << 24, "double": 1 << 53}
+
+# Rounds after which the variables still growing are given up
+widening_rounds = 8
+
+# Value of an interval for the variables nothing is known about
+TOP = None
+
+
+class TypeInference:
+    """
+    Finds the `num` variables that only ever hold integers their C++ type
+    represents exactly, so they can be generated as `int64_t` without a
+    change in the behaviour of the program.
+
+    The analysis is flow insensitive: every assignment of a variable,
+    wherever it is, bounds the variable by an interval. Variables are keyed
+    by `(scope, name)`, the scope is the body of their function, the main
+    code or None for the globals, see `analysis.Scopes`. `num` is the C++ type of the other `num`
+    values, `float` or `double`.
+    """
+
+    def __init__(self, biro: BiroIntermediateCode, num: str = "float"):
+        self.biro = biro
+        self.num = num
+        self.code = biro.getCode()
+        self.global_names = biro.getGlobals()
+        scopes = analysis.Scopes(self.code, self.global_names)
+        self.main = scopes.main
+        self.types = scopes.types
+        self.temporaries = scopes.temporaries
+        self.locals = scopes.locals
+        self.functions = scopes.functions
+        self.variable = scopes.variable
+        # (variable, expression, scope) for every value a variable takes
+        self.assignments: t.List[tuple] = []
+        # Intervals known without evaluating an expression
+        self.fixed: t.Dict[tuple, tuple] = {}
+        self.given_up: t.Set[tuple] = set()
+        self.intervals: t.Dict[tuple, tuple] = {}
+        self._memo: t.Dict[tuple, t.Any] = {}
+        # Increments of the counted loops, their counters are bounded anyway
+        self._steps: t.Set[int] = set()
+
+        self.size = self._container_size()
+        self._collect(self.code, self.main)
+        self._solve()
+
+    def _container_size(self) -> t.Optional[int]:
+        """
+        Bound of the size of every container. Biro only grows containers by
+        their literals, each run of one adds its items: the bound is their
+        count when no literal can run twice.
+        """
+        size = 0
+        for statement, repeated in _runs(self.code, False):
+            value = getattr(statement, "value", None)
+            if type(value) is nodes.Collection:
+                if repeated:
+                    return TOP
+                size += len(value.items)
+        return size if size <= exact_limits["float"] else TOP
+
+    # Assignments
+
+    def _collect(self, body: list, scope: int) -> None:
+        for position, statement in enumerate(body):
+            kind = type(statement)
+            if kind is nodes.Loop:
+                counted = analysis.counted_loop(
+                    body, position, self.global_names
+                )
+                variable = counted and self.variable(counted.counter, scope)
+                if variable and self._original_type(variable):
+                    # The counter stops at the largest integer of its type
+                    limit = exact_limits[self._original_type(variable)]
+                    self._fix(variable, (counted.start, limit))
+                    self._steps.add(id(counted.step))
+            if kind is nodes.FunctionDef:
+                self._collect(statement.body, id(statement.body))
+                continue
+            if kind in (nodes.VarDecl, nodes.Assign):
+                if id(statement) not in self._steps:
+                    variable = self.variable(statement.name, scope)
+                    self.assignments.append((variable, statement.value, scope))
+            for expression in analysis.expressions(statement):
+                self._arguments(expression, scope)
+            if kind in analysis.compound_statements:
+                self._collect(statement.body, scope)
+        if scope == self.main:
+            # C++ zero initializes the globals
+            for name in self.global_names:
+                self._fix((None, name), (0, 0))
+
+    def _arguments(self, expression, scope: int) -> None:
+        """Values the parameters of the functions called take"""
+        if type(expression) is nodes.Call:
+            functions = self.functions.get(expression.name, ())
+            for function in functions:
+                inner = id(function.body)
+                for position, name in enumerate(function.args):
+                    variable = (inner, name)
+                    if len(functions) > 1:
+                        # The overload called is up to the C++ compiler
+                        self.given_up.add(variable)
+                    elif position < len(expression.args):
+                        argument = expression.args[position]
+                        self.assignments.append((variable, argument, scope))
+        for child in analysis.children(expression):
+            self._arguments(child, scope)
+
+    def _fix(self, variable: tuple, interval: tuple) -> None:
+        self.fixed[variable] = _join(self.fixed.get(variable, ()), interval)
+
+    # Solving
+
+    def _solve(self) -> None:
+        for variable, Type in self.types.items():
+            if Type not in ("num", "auto"):
+                self.given_up.add(variable)
+        for name in self.global_names:
+            for scope, names in self.locals.items():
+                if name in names:
+                    # One name for two variables, keep it simple
+                    self.given_up.update({(None, name), (scope, name)})
+        while True:
+            self._fixpoint()
+            unreached = [
+                variable
+                for variable in self.types
+                if variable not in self.given_up
+                and self.intervals.get(variable, ()) == ()
+            ]
+            if not unreached:
+                return
+            self.given_up.update(unreached)
+
+    def _fixpoint(self) -> None:
+        self.intervals = {}
+        for round in itertools.count():
+            self._memo = {}
+            intervals = dict(self.fixed)
+            for variable, expression, scope in self.assignments:
+                if variable is None:
+                    continue
+                interval = self.interval(expression, scope)
+                intervals[variable] = _join(
+                    intervals.get(variable, ()), interval
+                )
+            for variable in list(intervals):
+                if variable in self.given_up:
+                    intervals[variable] = TOP
+                elif not self._fits(intervals[variable], variable):
+                    self.given_up.add(variable)
+                    intervals[variable] = TOP
+            if intervals == self.intervals:
+                self._memo = {}
+                return
+            if round >= widening_rounds:
+                for variable, interval in intervals.items():
+                    previous = self.intervals.get(variable, ())
+                    if previous != () and interval != previous:
+                        self.given_up.add(variable)
+                        intervals[variable] = TOP
+            self.intervals = intervals
+
+    def _fits(self, interval, variable) -> bool:
+        if interval is TOP:
+            return False
+        if interval == ():
+            return True
+        Type = self._original_type(variable)
+        if Type is None:
+            return False
+        limit = exact_limits[Type]
+        return -limit <= interval[0] and interval[1] <= limit
+
+    # Queries
+
+    def interval(self, expression, scope: int):
+        """
+        Interval of the integer values of `expression`, TOP when it may not
+        be an integer and `()` when nothing assigns it yet
+        """
+        key = (id(expression), scope)
+        if key not in self._memo:
+            self._memo[key] = self._interval(expression, scope)
+        return self._memo[key]
+
+    def _interval(self, expression, scope: int):
+        kind = type(expression)
+        if kind is float:
+            if (
+                expression.is_integer()
+                and abs(expression) <= exact_limits["double"]
+            ):
+                return (int(expression), int(expression))
+            return TOP
+        if nodes.is_name(expression):
+            variable = self.variable(expression, scope)
+            if variable is None or variable in self.given_up:
+                return TOP
+            return self.intervals.get(variable, ())
+        if kind is nodes.BinOp and expression.op in ("+", "-", "*"):
+            left = self.interval(expression.left, scope)
+            right = self.interval(expression.right, scope)
+            if left is TOP or right is TOP:
+                return TOP
+            if left == () or right == ():
+                return ()
+            if expression.op == "+":
+                result = (left[0] + right[0], left[1] + right[1])
+            elif expression.op == "-":
+                result = (left[0] - right[1], left[1] - right[0])
+            else:
+                corners = [a * b for a in left for b in right]
+                result = (min(corners), max(corners))
+            Type = self.original(expression, scope)
+            if Type is None:
+                return TOP
+            limit = exact_limits[Type]
+            if result[0] < -limit or result[1] > limit:
+                return TOP
+            return result
+        if kind is nodes.BuiltinCall and expression.name == "len":
+            if self.size is not TOP and len(expression.args) == 1:
+                if self._is_container(expression.args[0], scope):
+                    return (0, self.size)
+        return TOP
+
+    def _is_container(self, expression, scope: int) -> bool:
+        if nodes.is_name(expression):
+            variable = self.variable(expression, scope)
+            return isinstance(self.types.get(variable), tuple)
+        if type(expression) is nodes.Call:
+            functions = self.functions.get(expression.name, ())
+            return bool(functions) and all(
+                isinstance(f.return_type, tuple) for f in functions
+            )
+        return False
+
+    def original(self, expression, scope: int) -> t.Optional[str]:
+        """C++ type, `float` or `double`, of a number without the inference"""
+        kind = type(expression)
+        if kind is float:
+            # Literals are generated as doubles
+            return "double"
+        if nodes.is_name(expression):
+            return self._original_type(self.variable(expression, scope))
+        if kind is nodes.BinOp and expression.op in ("+", "-", "*", "/"):
+            left = self.original(expression.left, scope)
+            right = self.original(expression.right, scope)
+            if left is None or right is None:
+                return None
+            return "double" if "double" in (left, right) else "float"
+        if kind is nodes.BuiltinCall and expression.name == "len":
+            return "float"
+        return None
+
+    def _original_type(self, variable) -> t.Optional[str]:
+        Type = self.types.get(variable)
+        if Type == "num":
+            return self.num
+        if Type == "auto":
+            value, scope = self.temporaries[variable]
+            return self.original(value, scope)
+        return None
+
+    def is_integer(self, expression, scope: int) -> bool:
+        """True when `expression` evaluates to an integer held exactly"""
+        return bool(self.interval(expression, scope))
+
+    def is_integer_variable(self, name: str, scope: int) -> bool:
+        variable = self.variable(name, scope)
+        if variable is None or variable in self.given_up:
+            return False
+        return bool(self.intervals.get(variable))
+
+    def integer_parameters(self, function: str) -> t.List[bool]:
+        """Whether each parameter of `function` is an integer variable"""
+        functions = self.functions.get(function, ())
+        if len(functions) != 1:
+            return []
+        inner = id(functions[0].body)
+        return [
+            self.is_integer_variable(name, inner) for name in functions[0].args
+        ]
+
+    def is_index(self, expression, scope: int) -> bool:
+        """
+        True when `expression` can index a container as an integer: the
+        float index the runtime takes holds it, or no container is as big
+        """
+        if not self.is_integer(expression, scope):
+            return False
+        low, high = self.interval(expression, scope)
+        limit = exact_limits["float"]
+        return self.size is not TOP or (-limit <= low and high <= limit)
+
+
+def _join(a, b):
+    """Smallest interval holding `a` and `b`, `()` is the empty interval"""
+    if a is TOP or b is TOP:
+        return TOP
+    if a == ():
+        return b
+    if b == ():
+        return a
+    return (min(a[0], b[0]), max(a[1], b[1]))
+
+
+def _runs(body: list, repeated: bool) -> t.Iterator[tuple]:
+    """Statements with whether they can run more than once"""
+    for statement in body:
+        yield statement, repeated
+        if type(statement) in analysis.compound_statements:
+            inner = repeated or type(statement) in (
+                nodes.Loop,
+                nodes.FunctionDef,
+            )
+            yield from _runs(statement.body, inner)
@@ -1,9 +1,48 @@
+import copy
+import os
+import threading
+import ply
 import ply.lex as lex
 import ply.yacc as yacc
-from biro.middleware import Scope, Error, BiroIntermediateCode
+from biro.middleware import (
+    Scope,
+    BiroError,
+    BiroSyntaxError,
+    BiroIntermediateCode,
+)
+from biro import nodes
+
+
+def _table_file():
+    """Versioned location of the pickled LALR tables, None to keep them in memory"""
+    birohome = os.environ.get("BIROHOME")
+    if not birohome:
+        return None
+    table_dir = os.path.join(birohome, "ply", f"ply-{ply.__version__}")
+    try:
+        os.makedirs(table_dir, exist_ok=True)
+    except OSError:
+        return None
+    return os.path.join(table_dir, "parsetab.pickle")
+
+
+def function_return_type(name, args, types):
+    """Split the return type off the declared types, `types` loses it in place"""
+    if len(args) == len(types):
+        return "void"
+    elif len(args) - len(types) == -1:
+        return types.pop()
+    raise BiroError(
+        f"Not all types are defined for {name}({','.join(args)}) function"
+    )
 
 
 class Parser(object):
+    # Built once per process and shared by every Parser instance
+    _lexer = None
+    _tables = None
+    _build_lock = threading.Lock()
+
     reserved = {
         "biro": "BIRO",
         "smallbiro": "SMALLBIRO",
@@ -123,13 +162,18 @@ class Parser(object):
         p[0] = p[1]
 
     # Statement List
+    # Lists are left recursive and grow in place: linear time and constant
+    # parser stack depth in the number of items
     def p_statement_list(self, p):
-        """statement_list : statement statement_list
+        """statement_list : statement_list statement
         | statement"""
+        # Empty statements are dropped
         if len(p) == 3:
-            p[0] = [p[1]] + p[2]
+            if p[2] is not None:
+                p[1].append(p[2])
+            p[0] = p[1]
         else:
-            p[0] = [p[1]]
+            p[0] = [] if p[1] is None else [p[1]]
 
     # Statement
     def p_statement(self, p):
@@ -157,12 +201,12 @@ class Parser(object):
             self.biro.setGlobal(p[2], p[4], p.lineno(2), p.lexpos(2))
         else:
             scope = Scope.LOCAL
-        p[0] = ("variable_declaration", scope, p[4], p[2], p[6])
+        p[0] = nodes.VarDecl(scope, p[4], p[2], p[6], p.lineno(2))
 
     # Variable Assignment
     def p_variable_assignment(self, p):
         """variable_assignment : ID ASSIGN assigned_expression"""
-        p[0] = ("variable_assignment", p[1], p[3])
+        p[0] = nodes.Assign(p[1], p[3], p.lineno(1))
 
     # Assigned Expression
     def p_assigned_expression(self, p):
@@ -175,50 +219,42 @@ class Parser(object):
     # Array Declaration
     def p_array_declaration(self, p):
         """array_declaration : LITERAL_A LSQUARE expression_list RSQUARE"""
-        p[0] = ("array_declaration", p[3])
+        p[0] = nodes.Collection("a", p[3], p.lineno(1))
 
     # Queue Declaration
     def p_queue_declaration(self, p):
         """queue_declaration : LITERAL_Q LSQUARE expression_list RSQUARE"""
-        p[0] = ("queue_declaration", p[3])
+        p[0] = nodes.Collection("q", p[3], p.lineno(1))
 
     # Stack Declaration
     def p_stack_declaration(self, p):
         """stack_declaration : LITERAL_S LSQUARE expression_list RSQUARE"""
-        p[0] = ("stack_declaration", p[3])
+        p[0] = nodes.Collection("s", p[3], p.lineno(1))
 
     # Conditional Statement
     def p_conditional_statement(self, p):
         """conditional_statement : BIRO IS expression QUESMARK LCURL control_flow_statements_list RCURL"""
-        p[0] = ("conditional_statement", p[3], p[6])
+        p[0] = nodes.If(p[3], p[6], p.lineno(1))
 
     # Try Block
     def p_try_block(self, p):
         """try_block : BIRO ATTEMPT LCURL statement_list RCURL"""
-        p[0] = ("try_block", p[4])
+        p[0] = nodes.Try(p[4], p.lineno(1))
 
     # Catch Block
     def p_catch_block(self, p):
         """catch_block : BIRO ARREST LCURL statement_list RCURL"""
-        p[0] = ("catch_block", p[4])
+        p[0] = nodes.Catch(p[4], p.lineno(1))
 
     # Loop Block
     def p_loop_statement(self, p):
         """loop_statement : BIRO LOOP LCURL control_flow_statements_list RCURL"""
-        p[0] = ("loop_statement", p[4])
+        p[0] = nodes.Loop(p[4], p.lineno(1))
 
     # Function Declaration
     def p_function_declaration(self, p):
         """function_declaration : BIRO ID LPAREN arg_list RPAREN COLON LPAREN type_list RPAREN LCURL donate_statement_list RCURL"""
-        if len(p[4]) == len(p[8]):
-            return_type = "void"
-        elif len(p[4]) - len(p[8]) == -1:
-            return_type = p[8].pop()
-        else:
-            Error().show(
-                f"Not all types are defined for {p[2]}({','.join(p[4])}) function"
-            )
-            exit(1)
+        return_type = function_return_type(p[2], p[4], p[8])
         self.biro.setFunc(
             name=p[2],
             arg_names=p[4],
@@ -226,26 +262,29 @@ class Parser(object):
             return_type=return_type,
             block=p[11],
         )
-        p[0] = ("function_declaration", p[2], p[4], p[8], p[11])
+        p[0] = nodes.FunctionDef(
+            p[2], p[4], p[8], return_type, p[11], p.lineno(2)
+        )
 
     # Function Call
     def p_function_call(self, p):
         """function_call : ID LPAREN expression_list RPAREN"""
-        p[0] = ("function_call", p[1], p[3])
+        p[0] = nodes.Call(p[1], p[3], p.lineno(1))
 
     # Builtin Call
     def p_builtin_call(self, p):
         """builtin_call : BIRO DOT function_call"""
-        p[0] = ("builtin_call", p[3])
+        p[0] = nodes.BuiltinCall(p[3].name, p[3].args, p.lineno(1))
 
     # Donate Statement List
     def p_donate_statement_list(self, p):
-        """donate_statement_list : donate_statement donate_statement_list
+        """donate_statement_list : donate_statement_list donate_statement
         | donate_statement"""
         if len(p) == 3:
-            p[0] = [p[1]] + p[2]
+            p[1] += p[2]
+            p[0] = p[1]
         else:
-            p[0] = [p[1]]
+            p[0] = p[1]
 
     # Donate Statement
     def p_donate_statement(self, p):
@@ -254,16 +293,17 @@ class Parser(object):
         if len(p) == 2:
             p[0] = p[1]
         else:
-            p[0] = ("donate_statement", p[2])
+            p[0] = [nodes.Donate(p[2], p.lineno(1))]
 
     # Control Flow Statements List
     def p_control_flow_statements_list(self, p):
-        """control_flow_statements_list : control_flow_statements control_flow_statements_list
+        """control_flow_statements_list : control_flow_statements_list control_flow_statements
         | control_flow_statements"""
         if len(p) == 3:
-            p[0] = [p[1]] + p[2]
+            p[1] += p[2]
+            p[0] = p[1]
         else:
-            p[0] = [p[1]]
+            p[0] = p[1]
 
     # Control Flow Statements
     def p_control_flow_statements(self, p):
@@ -271,12 +311,13 @@ class Parser(object):
         | LEAVE
         | PROCEED
         | DONATE expression"""
+        # Every alternative gives a list of statements
         if p[1] == "leave":
-            p[0] = ("leave",)
+            p[0] = [nodes.Leave(p.lineno(1))]
         elif p[1] == "proceed":
-            p[0] = ("proceed",)
+            p[0] = [nodes.Proceed(p.lineno(1))]
         elif p[1] == "donate":
-            p[0] = ("donate_statement", p[2])
+            p[0] = [nodes.Donate(p[2], p.lineno(1))]
         else:
             p[0] = p[1]
 
@@ -301,35 +342,56 @@ class Parser(object):
         if len(p) == 2:
             p[0] = p[1]
         else:
-            p[0] = (p[2], p[1], p[3])
+            p[0] = nodes.BinOp(p[2], p[1], p[3], p.lineno(2))
+
+    # Comma separated lists may be empty or end with a comma, neither adds an
+    # item
 
     # Expression List
     def p_expression_list(self, p):
-        """expression_list : expression COMMA expression_list
-        | expression
+        """expression_list : expression_items
+        | expression_items COMMA empty
         | empty"""
+        p[0] = [] if p[1] is None else p[1]
+
+    def p_expression_items(self, p):
+        """expression_items : expression_items COMMA expression
+        | expression"""
         if len(p) == 4:
-            p[0] = [p[1]] + p[3]
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
             p[0] = [p[1]]
 
     # Argument List
     def p_arg_list(self, p):
-        """arg_list : ID COMMA arg_list
-        | ID
+        """arg_list : arg_items
+        | arg_items COMMA empty
         | empty"""
+        p[0] = [] if p[1] is None else p[1]
+
+    def p_arg_items(self, p):
+        """arg_items : arg_items COMMA ID
+        | ID"""
         if len(p) == 4:
-            p[0] = [p[1]] + p[3]
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
             p[0] = [p[1]]
 
     # Type List
     def p_type_list(self, p):
-        """type_list : type COMMA type_list
-        | type
+        """type_list : type_items
+        | type_items COMMA empty
         | empty"""
+        p[0] = [] if p[1] is None else p[1]
+
+    def p_type_items(self, p):
+        """type_items : type_items COMMA type
+        | type"""
         if len(p) == 4:
-            p[0] = [p[1]] + p[3]
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
             p[0] = [p[1]]
 
@@ -359,13 +421,74 @@ class Parser(object):
 
     # Error
     def p_error(self, p):
-        Error().parsing(p)
-        exit(1)
+        if p is None:
+            raise BiroSyntaxError()
+        raise BiroSyntaxError(p.lineno, p.value)
 
     def __init__(self):
         self.biro = BiroIntermediateCode()
-        self.lexer = lex.lex(module=self)
-        self.parser = yacc.yacc(module=self)
-
-    def parse(self, code):
-        self.biro.setCode(self.parser.parse(code))
+        cls = type(self)
+        with cls._build_lock:
+            if cls._lexer is None:
+                cls._lexer = lex.lex(module=self)
+            if cls._tables is None:
+                # The signature check regenerates stale tables, debug output
+                # (parser.out) and table modules in the cwd are never written
+                options = dict(
+                    module=self,
+                    debug=False,
+                    write_tables=False,
+                    errorlog=yacc.NullLogger(),
+                )
+                try:
+                    parser = yacc.yacc(picklefile=_table_file(), **options)
+                except Exception:
+                    # Another process is writing the tables, build them here
+                    parser = yacc.yacc(picklefile=None, **options)
+                cls._tables = parser.action, parser.goto, parser.productions
+        self.lexer = cls._lexer.clone(self)
+        self.parser = self._bind_tables(*cls._tables)
+
+    def _bind_tables(self, action, goto, productions):
+        """LR parser over the shared tables calling this instance's rules"""
+        table = yacc.LRTable()
+        table.lr_action = action
+        table.lr_goto = goto
+        table.lr_productions = [copy.copy(p) for p in productions]
+        table.bind_callables(
+            {
+                name: getattr(self, name)
+                for name in dir(self)
+                if name[:2] == "p_"
+            }
+        )
+        return yacc.LRParser(table, self.p_error)
+
+    def parse(self, code, biro=None, lineno=1):
+        """
+        Parse `code`, either a string or an iterable of consecutive pieces.
+        `biro` holds the globals and functions of the code before it, which
+        starts at line `lineno`.
+        """
+        # Fresh program state so one Parser can be reused for many programs
+        self.biro = biro or BiroIntermediateCode()
+        self.lexer.lineno = lineno
+        if isinstance(code, str):
+            self.biro.setCode(self.parser.parse(code, lexer=self.lexer))
+            return
+        # PLY lexes from one string, pieces go through the streaming lexer
+        from biro.fastparser import Lexer
+
+        tokens = Lexer().tokenize_stream(code, lineno)
+
+        def token():
+            for t in tokens:
+                tok = lex.LexToken()
+                tok.type = t.type
+                tok.value = t.value
+                tok.lineno = t.lineno
+                tok.lexpos = 0
+                return tok
+            return None
+
+        self.biro.setCode(self.parser.parse(lexer=self.lexer, tokenfunc=token))
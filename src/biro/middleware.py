@@ -1,4 +1,5 @@
 from abc import ABC, abstractclassmethod
+import typing as t
 
 
 class Scope:
@@ -6,28 +7,46 @@ class Scope:
     LOCAL = 1
 
 
+class BiroError(Exception):
+    """
+    Error in a biro program or in the files it pulls in. `message` is what
+    the CLI shows, `line` the line the error is at when it is known.
+    """
+
+    def __init__(self, message: str, line: t.Optional[int] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.line = line
+
+
+class BiroSyntaxError(BiroError):
+    """Code the grammar does not accept, `token` is None at the end of input"""
+
+    def __init__(self, line: t.Optional[int] = None, token=None) -> None:
+        if line is None:
+            where = "\tat end of input"
+        else:
+            where = f"\tline: {line}\n\tat `{token}`"
+        super().__init__(f"Syntax Error:\n{where}", line)
+        self.token = token
+
+
+class ModuleError(BiroError):
+    """`!add` or `!install` directive that can't be followed"""
+
+
 class Error:
     header = "biro listen, you have an error :(\n"
 
     def _show_header(self):
         print(self.header, end="")
 
-    def _type_SYNTAX(self):
-        print("Syntax Error:")
-
     def show(self, msg):
         self._show_header()
         print(msg)
 
-    def parsing(self, p):
-        self._show_header()
-        self._type_SYNTAX()
-        print(f"\tline: {p.lineno}\n\tat `{p.value}`")
-
 
 class BiroIntermediateCode:
-    _global_vars = {}
-    _func_defs = {}
     _code = ""
     _header = """
     This code is automatically generated by the biro compiler (link). 
@@ -37,19 +56,19 @@ class BiroIntermediateCode:
         - Meetesh Saini (https://github.com/Meetesh-Saini)
     """
 
-    def setGlobal(self, name, typ):
-        if name in self._global_vars:
-            Error().show(f"Global variable `{name}` defined again")
-            exit(1)
-        self._global_vars[name] = typ
+    def __init__(self) -> None:
+        # Per program state, two programs parsed in one process must not mix
+        self._global_vars = {}
+        self._func_defs = {}
 
     def setGlobal(self, name, typ, line=None, col=None):
         if name in self._global_vars:
             line_col = f"\n\tline: {line}"
             if line is None or col is None:
                 line_col = ""
-            Error().show(f"Global variable `{name}` defined again{line_col}")
-            exit(1)
+            raise BiroError(
+                f"Global variable `{name}` defined again{line_col}", line
+            )
         self._global_vars[name] = typ
 
     def getGlobals(self):
@@ -58,10 +77,9 @@ class BiroIntermediateCode:
     def setFunc(self, name, arg_names, arg_type, return_type, block) -> None:
         k = (name, tuple(arg_type))
         if k in self._func_defs:
-            Error.show(
+            raise BiroError(
                 f"Function {name} is defined again with same argument types {arg_type}"
             )
-            exit(1)
         self._func_defs[k] = (arg_names, return_type, block)
 
     def getFunc(self):
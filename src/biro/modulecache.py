@@ -0,0 +1,185 @@
+import hashlib
+import marshal
+import os
+import threading
+from biro import analysis, nodes
+from biro.middleware import BiroError, BiroIntermediateCode, Scope
+
+# Node classes by tag, a node is stored as `(tag, lineno, *fields)`
+_classes = (
+    nodes.BinOp,
+    nodes.Call,
+    nodes.BuiltinCall,
+    nodes.Collection,
+    nodes.VarDecl,
+    nodes.Assign,
+    nodes.If,
+    nodes.Loop,
+    nodes.Try,
+    nodes.Catch,
+    nodes.FunctionDef,
+    nodes.Donate,
+    nodes.Leave,
+    nodes.Proceed,
+)
+_tags = {cls: tag for tag, cls in enumerate(_classes)}
+
+# Sources shaping the AST, a change in any of them invalidates the entries
+_front_end = ("nodes.py", "lexerparser.py", "fastparser.py", "modulecache.py")
+
+# Bytes of a module hashed at a time
+_block = 1 << 20
+
+
+class ModuleCache:
+    """
+    Parsed ASTs of the files pulled in with `!add`, stored with `marshal` and
+    keyed by the hash of their content, the compiler version and the sources
+    of the front end. Library modules are parsed once, then loaded by every
+    program adding them.
+
+    A module is parsed on its own, its line numbers are moved to where it
+    sits in the program and the globals and functions it declares are
+    registered in the order the parser would have. The entry file is then
+    parsed after them.
+    """
+
+    _stamp = None
+    _stamp_lock = threading.Lock()
+
+    def __init__(self, root: str, version: str) -> None:
+        """
+        Constructor method
+
+        :param root: directory holding the cached modules
+        :type root: str
+        :param version: version of the compiler, part of every key
+        :type version: str
+        """
+        self.root = root
+        self.version = version
+        os.makedirs(self.root, exist_ok=True)
+
+    @classmethod
+    def stamp(cls) -> bytes:
+        """Hash of the sources of the front end"""
+        with cls._stamp_lock:
+            if cls._stamp is None:
+                digest = hashlib.sha256()
+                here = os.path.dirname(os.path.abspath(__file__))
+                for name in _front_end:
+                    with open(os.path.join(here, name), "rb") as f:
+                        digest.update(f.read())
+                cls._stamp = digest.digest()
+        return cls._stamp
+
+    def key(self, file: str) -> str:
+        """Hash of `file`, read a block at a time, and of the compiler"""
+        digest = hashlib.sha256(self.stamp())
+        digest.update(self.version.encode() + b"\0")
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(_block), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def parse(self, parser, preprocessor) -> None:
+        """
+        Parse the program of `preprocessor` into `parser.biro`, the `!add`
+        modules come from the cache
+        """
+        sources = preprocessor.sources()
+        biro = BiroIntermediateCode()
+        code = []
+        lineno = 1
+        try:
+            for file in sources[:-1]:
+                lines, statements = self._module(parser, preprocessor, file)
+                statements = _decode(statements, lineno - 1)
+                _register(biro, statements)
+                code += statements
+                lineno += lines
+        except BiroError:
+            # Reported as by the parse of the whole program, with its lines
+            parser.parse(preprocessor.chunks())
+            return
+        parser.parse(preprocessor.file_chunks(sources[-1]), biro, lineno)
+        biro.setCode(code + biro.getCode())
+
+    def _module(self, parser, preprocessor, file: str) -> tuple:
+        """Lines and encoded statements of a module, parsed on a miss"""
+        key = self.key(file)
+        path = os.path.join(self.root, f"{key}.ast")
+        try:
+            with open(path, "rb") as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        lines = []
+        parser.parse(_counting(preprocessor.file_chunks(file), lines))
+        entry = (sum(lines), _encode(parser.biro.getCode()))
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                marshal.dump(entry, f)
+            os.replace(tmp, path)
+        except (OSError, ValueError):
+            # Nested deeper than marshal goes, or the cache can't be written
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return entry
+
+
+def _counting(chunks, lines: list):
+    """`chunks` as they are, the newlines of each appended to `lines`"""
+    for chunk in chunks:
+        lines.append(chunk.count("\n"))
+        yield chunk
+
+
+def _encode(value):
+    """`value` out of builtin types only, nodes become tagged tuples"""
+    kind = type(value)
+    if kind in _tags:
+        fields = [_encode(getattr(value, field)) for field in value._fields]
+        return (_tags[kind], value.lineno, *fields)
+    if kind is list:
+        return [_encode(item) for item in value]
+    if kind is tuple:
+        return tuple(_encode(item) for item in value)
+    return value
+
+
+def _decode(value, offset: int):
+    """
+    Nodes back out of `_encode`, `offset` is added to their lines. Tuples
+    starting with an int are nodes, numbers of the code are floats.
+    """
+    kind = type(value)
+    if kind is tuple:
+        if value and type(value[0]) is int:
+            fields = [_decode(field, offset) for field in value[2:]]
+            return _classes[value[0]](*fields, value[1] + offset)
+        return tuple(_decode(item, offset) for item in value)
+    if kind is list:
+        return [_decode(item, offset) for item in value]
+    return value
+
+
+def _register(biro: BiroIntermediateCode, body: list) -> None:
+    """Declare the globals and functions of `body` as the parser does"""
+    for statement in body:
+        kind = type(statement)
+        if kind is nodes.VarDecl and statement.scope == Scope.GLOBAL:
+            biro.setGlobal(statement.name, statement.type, statement.lineno, 0)
+        elif kind is nodes.FunctionDef:
+            # Reduced once its body is
+            _register(biro, statement.body)
+            biro.setFunc(
+                statement.name,
+                statement.args,
+                statement.types,
+                statement.return_type,
+                statement.body,
+            )
+        elif kind in analysis.compound_statements:
+            _register(biro, statement.body)
@@ -0,0 +1,132 @@
+import json
+import os
+import threading
+import typing as t
+from biro.middleware import ModuleError
+
+
+def parse_directives(lines: t.Iterable[str]) -> t.List[t.Tuple[str, str]]:
+    """`(command, arguments)` of the `!` directives heading `lines`"""
+    directives = []
+    for line in lines:
+        line = line.strip()
+        if not line.startswith("!"):
+            break
+        line = line[1:].strip().split(" ")
+        directives.append((line[0], " ".join(line[1:]).strip()))
+    return directives
+
+
+class ModuleGraph:
+    """
+    Dependency graph of the `!add` directives of biro files.
+
+    The directives of every file are memoized by path, mtime and size, and the
+    memo can be persisted, so large library trees are only read again when a
+    file actually changes.
+    """
+
+    def __init__(
+        self, libpath: str, cache_file: t.Optional[str] = None
+    ) -> None:
+        """
+        Constructor method
+
+        :param libpath: path of the `lib` directory
+        :type libpath: str
+        :param cache_file: json file keeping the directives across processes
+        :type cache_file: str
+        """
+        self.libpath = libpath
+        self.cache_file = cache_file
+        self._directives = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if cache_file:
+            try:
+                with open(cache_file) as f:
+                    self._directives = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    def directives(self, file: str) -> t.List[t.Tuple[str, str]]:
+        """`(command, arguments)` of the directives heading `file`"""
+        stat = os.stat(file)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        with self._lock:
+            cached = self._directives.get(file)
+        if cached and cached["stamp"] == stamp:
+            return [tuple(d) for d in cached["directives"]]
+
+        with open(file, "r") as f:
+            directives = parse_directives(f)
+        with self._lock:
+            self._directives[file] = {"stamp": stamp, "directives": directives}
+            self._dirty = True
+        return directives
+
+    def locate(self, args: str, entry: str) -> str:
+        """Path of an `!add` argument, next to the entry file or in the lib"""
+        dirname = os.path.dirname(entry)
+        filename = os.path.abspath(os.path.join(dirname, args))
+        if os.path.isfile(filename):
+            return filename
+        module = os.path.abspath(os.path.join(self.libpath, args))
+        if not os.path.isfile(module):
+            raise ModuleError(f"Error reading file {filename} or {module}.")
+        return module
+
+    def resolve(
+        self, entry: str, code: t.Optional[str] = None
+    ) -> t.List[t.Tuple[str, str]]:
+        """
+        Directives of the program starting at `entry` in a deterministic
+        topological order: every `!add` file comes after the files it adds,
+        in the order they are written, and only once. Cycles are an error.
+        `code` is the code of `entry` when it is not read from disk.
+        """
+        order = []
+        seen = set()
+        done = set()
+        stack = []
+
+        def visit(file):
+            stack.append(file)
+            if file == entry and code is not None:
+                directives = parse_directives(code.splitlines())
+            else:
+                directives = self.directives(file)
+            for cmd, args in directives:
+                if cmd == "add":
+                    args = self.locate(args, entry)
+                    if args in stack:
+                        cycle = stack[stack.index(args) :] + [args]
+                        raise ModuleError(
+                            "Circular `!add` dependency:\n\t"
+                            + "\n\t-> ".join(cycle)
+                        )
+                    if args not in done:
+                        visit(args)
+                        done.add(args)
+                if (cmd, args) not in seen:
+                    seen.add((cmd, args))
+                    order.append((cmd, args))
+            stack.pop()
+
+        visit(entry)
+        return order
+
+    def save(self) -> None:
+        if not self.cache_file or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps(self._directives)
+            self._dirty = False
+        tmp = f"{self.cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                f.write(data)
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
@@ -0,0 +1,237 @@
+import typing as t
+
+# Spelling of the binary operators in the AST, keyed by their biro keyword
+operator_symbols = {
+    "equals": "==",
+    "more": ">",
+    "less": "<",
+    "and": "&&",
+    "or": "||",
+}
+
+
+class Node:
+    """
+    Base of the AST nodes. Nodes compare equal when they are of the same class
+    and their fields are equal, the line number is not part of the comparison.
+
+    The leaves of expressions are plain values, which keeps big programs
+    small: floats and bools for number and boolean literals, strings for
+    names and strings with their quotes for string literals.
+    """
+
+    __slots__ = ("lineno",)
+    _fields: t.Tuple[str, ...] = ()
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(
+            _same(getattr(self, field), getattr(other, field))
+            for field in self._fields
+        )
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+def _same(a, b) -> bool:
+    # `true == 1.0` in python, the literals are still different
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(map(_same, a, b))
+    return a == b
+
+
+def is_name(expression) -> bool:
+    return isinstance(expression, str) and expression[:1] != '"'
+
+
+def is_string(expression) -> bool:
+    return isinstance(expression, str) and expression[:1] == '"'
+
+
+class Expression(Node):
+    """Expressions are immutable, so they can be hashed and compared"""
+
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash((type(self), *(getattr(self, f) for f in self._fields)))
+
+
+# Expressions
+
+
+class BinOp(Expression):
+    """`left op right`, `op` is the C++ spelling of the operator"""
+
+    __slots__ = ("op", "left", "right")
+    _fields = __slots__
+
+    def __init__(
+        self, op: str, left: Expression, right: Expression, lineno=0
+    ) -> None:
+        self.op = operator_symbols.get(op, op)
+        self.left = left
+        self.right = right
+        self.lineno = lineno
+
+
+class Call(Expression):
+    """Call of a user defined function, also used as a statement"""
+
+    __slots__ = ("name", "args")
+    _fields = __slots__
+
+    def __init__(
+        self, name: str, args: t.Sequence[Expression], lineno=0
+    ) -> None:
+        self.name = name
+        self.args = tuple(args)
+        self.lineno = lineno
+
+
+class BuiltinCall(Call):
+    """`biro.name(args)`"""
+
+    __slots__ = ()
+
+
+class Collection(Expression):
+    """Array, queue or stack literal, `kind` is `a`, `q` or `s`"""
+
+    __slots__ = ("kind", "items")
+    _fields = __slots__
+
+    def __init__(
+        self, kind: str, items: t.Sequence[Expression], lineno=0
+    ) -> None:
+        self.kind = kind
+        self.items = tuple(items)
+        self.lineno = lineno
+
+
+# Statements, the bodies of blocks are plain lists of statements
+
+
+class VarDecl(Node):
+    """
+    Declaration of a global (`biro`) or local (`smallbiro`) variable. `type`
+    is `num`, `str`, `bool` or a `(kind, type)` pair for collections.
+    """
+
+    __slots__ = ("scope", "type", "name", "value")
+    _fields = __slots__
+
+    def __init__(self, scope: int, type, name: str, value, lineno=0) -> None:
+        self.scope = scope
+        self.type = type
+        self.name = name
+        self.value = value
+        self.lineno = lineno
+
+
+class Assign(Node):
+    __slots__ = ("name", "value")
+    _fields = __slots__
+
+    def __init__(self, name: str, value: Expression, lineno=0) -> None:
+        self.name = name
+        self.value = value
+        self.lineno = lineno
+
+
+class If(Node):
+    __slots__ = ("condition", "body")
+    _fields = __slots__
+
+    def __init__(self, condition: Expression, body: list, lineno=0) -> None:
+        self.condition = condition
+        self.body = body
+        self.lineno = lineno
+
+
+class Loop(Node):
+    __slots__ = ("body",)
+    _fields = __slots__
+
+    def __init__(self, body: list, lineno=0) -> None:
+        self.body = body
+        self.lineno = lineno
+
+
+class Try(Node):
+    """`biro attempt { ... }`"""
+
+    __slots__ = ("body",)
+    _fields = __slots__
+
+    def __init__(self, body: list, lineno=0) -> None:
+        self.body = body
+        self.lineno = lineno
+
+
+class Catch(Node):
+    """`biro arrest { ... }`"""
+
+    __slots__ = ("body",)
+    _fields = __slots__
+
+    def __init__(self, body: list, lineno=0) -> None:
+        self.body = body
+        self.lineno = lineno
+
+
+class FunctionDef(Node):
+    __slots__ = ("name", "args", "types", "return_type", "body")
+    _fields = __slots__
+
+    def __init__(
+        self,
+        name: str,
+        args: t.List[str],
+        types: list,
+        return_type,
+        body: list,
+        lineno=0,
+    ) -> None:
+        self.name = name
+        self.args = args
+        self.types = types
+        self.return_type = return_type
+        self.body = body
+        self.lineno = lineno
+
+
+class Donate(Node):
+    """`donate value`, returns from the function"""
+
+    __slots__ = ("value",)
+    _fields = __slots__
+
+    def __init__(self, value: Expression, lineno=0) -> None:
+        self.value = value
+        self.lineno = lineno
+
+
+class Leave(Node):
+    """`leave`, breaks out of the innermost loop"""
+
+    __slots__ = ()
+
+    def __init__(self, lineno=0) -> None:
+        self.lineno = lineno
+
+
+class Proceed(Node):
+    """`proceed`, continues the innermost loop"""
+
+    __slots__ = ()
+
+    def __init__(self, lineno=0) -> None:
+        self.lineno = lineno
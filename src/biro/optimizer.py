@@ -0,0 +1,600 @@
+import collections
+import itertools
+import math
+import operator
+import typing as t
+from biro import analysis, nodes
+from biro.middleware import BiroIntermediateCode, Scope
+
+# Statements after which nothing in the same block runs
+_terminators = (nodes.Leave, nodes.Proceed, nodes.Donate)
+
+_arithmetic = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+_comparisons = {"==": operator.eq, ">": operator.gt, "<": operator.lt}
+
+
+class Optimizer:
+    """
+    AST passes run between `Parser.parse` and `CPP.make`. The program is
+    rewritten in place and every change is described in `report`.
+    """
+
+    def __init__(self, biro: BiroIntermediateCode) -> None:
+        """
+        Constructor method
+
+        :param biro: intermediate code of a parsed program
+        :type biro: BiroIntermediateCode
+        """
+        self.biro = biro
+        self.report: t.List[str] = []
+        self._folded = 0
+        self._globals = set(biro.getGlobals())
+        self._used: t.Set[str] = set()
+        self._counter = itertools.count()
+
+    def optimize(self) -> t.List[str]:
+        code = self.biro.getCode()
+        self._block(code)
+        if self._folded:
+            self.report.append(
+                f"folded {self._folded} constant "
+                f"expression{'s' * (self._folded > 1)}"
+            )
+        self._prune(code)
+        self._used = analysis.used_names(code, self._globals)
+        self._hoist(code)
+        _Reuse(self, code)
+        return self.report
+
+    def _temporary(self, value, lineno) -> nodes.VarDecl:
+        """Declaration of a new local holding `value`"""
+        name = f"_biro{next(self._counter)}"
+        while name in self._used:
+            name = f"_biro{next(self._counter)}"
+        return nodes.VarDecl(Scope.LOCAL, "auto", name, value, lineno)
+
+    # Dead function and global elimination
+
+    def _prune(self, code: list) -> None:
+        """
+        Drop the functions no call reaches from the main code and the globals
+        the remaining code never names, typically what a program does not use
+        of the libraries it `!add`s. A global is only dropped when its
+        initializer can't have a visible effect.
+        """
+        functions = collections.defaultdict(list)
+        for statement in analysis.statements(code):
+            if type(statement) is nodes.FunctionDef:
+                functions[statement.name].append(statement)
+        reached = set()
+        pending = [code]
+        while pending:
+            for name in _called(pending.pop()):
+                if name in functions and name not in reached:
+                    reached.add(name)
+                    pending += [function.body for function in functions[name]]
+
+        dead = sorted(set(functions) - reached)
+        if dead:
+            _drop_functions(code, reached)
+            definitions = self.biro.getFunc()
+            for key in [key for key in definitions if key[0] not in reached]:
+                del definitions[key]
+            removed = sum(len(functions[name]) for name in dead)
+            total = sum(len(overloads) for overloads in functions.values())
+            self.report.append(
+                f"removed {removed} of {total} function{'s' * (total > 1)} "
+                f"no call reaches: {_listing(dead)}"
+            )
+
+        unused = []
+        while True:
+            dropped = self._unused_globals(code)
+            if not dropped:
+                break
+            unused += dropped
+        if unused:
+            self.report.append(
+                f"removed {len(unused)} unused "
+                f"global{'s' * (len(unused) > 1)}: {_listing(sorted(unused))}"
+            )
+
+    def _unused_globals(self, code: list) -> t.List[str]:
+        """Drop the globals nothing names but their declaration, once"""
+        named = set()
+        declarations = {}
+        for statement in analysis.statements(code):
+            kind = type(statement)
+            if kind is nodes.VarDecl and statement.scope == Scope.GLOBAL:
+                declarations[statement.name] = statement
+            elif kind is nodes.VarDecl or kind is nodes.Assign:
+                named.add(statement.name)
+            elif kind is nodes.FunctionDef:
+                named.update(statement.args)
+            for expression in analysis.expressions(statement):
+                named |= analysis.names(expression)
+        unused = [
+            name
+            for name in self.biro.getGlobals()
+            if name not in named
+            and (
+                name not in declarations or _removable(declarations[name].value)
+            )
+        ]
+        dropped = {id(declarations[n]) for n in unused if n in declarations}
+        _drop_statements(code, dropped)
+        for name in unused:
+            del self.biro.getGlobals()[name]
+            self._globals.discard(name)
+        return unused
+
+    # Loop-invariant code motion
+
+    def _hoist(self, body: list) -> None:
+        """
+        Move the pure expressions that don't change while a loop runs in
+        front of it. Outer loops go first, so an expression is taken out of
+        all the loops it does not depend on at once.
+        """
+        out = []
+        for statement in body:
+            if type(statement) is nodes.Loop:
+                out += self._invariants(statement)
+            out.append(statement)
+            if type(statement) in analysis.compound_statements:
+                self._hoist(statement.body)
+        body[:] = out
+
+    def _invariants(self, loop: nodes.Loop) -> t.List[nodes.VarDecl]:
+        """Declarations of the invariants of `loop`, replaced in its body"""
+        written = analysis.writes(loop.body, self._globals)
+        hoisted = {}
+
+        def expression(e, unit=True, root=False):
+            kind = type(e)
+            if (
+                not root
+                and (kind is nodes.BinOp or kind is nodes.BuiltinCall)
+                and unit
+                and analysis.faithful(e)
+                and analysis.is_pure(e)
+                # Evaluated even when the loop would not have reached it
+                and not analysis.may_throw(e)
+            ):
+                used = analysis.names(e)
+                if used and not used & written:
+                    if e not in hoisted:
+                        hoisted[e] = self._temporary(e, e.lineno)
+                    return hoisted[e].name
+            operands = zip(analysis.children(e), analysis.units(e, unit))
+            return _rebuild(e, [expression(*operand) for operand in operands])
+
+        def block(body):
+            for position, statement in enumerate(body):
+                kind = type(statement)
+                if kind is nodes.FunctionDef:
+                    continue
+                if kind in (nodes.VarDecl, nodes.Assign, nodes.Donate):
+                    statement.value = expression(statement.value)
+                elif kind is nodes.If:
+                    statement.condition = expression(statement.condition)
+                elif kind is nodes.Call or kind is nodes.BuiltinCall:
+                    body[position] = expression(statement, root=True)
+                if kind in analysis.compound_statements:
+                    block(statement.body)
+
+        block(loop.body)
+        for value in hoisted:
+            self.report.append(
+                f"line {loop.lineno}: hoisted `{analysis.source(value)}` "
+                "out of the loop"
+            )
+        return list(hoisted.values())
+
+    def _block(self, body: list) -> None:
+        """Optimize a list of statements in place"""
+        out = []
+        for position, statement in enumerate(body):
+            statement = self._statement(statement)
+            if statement is None:
+                continue
+            out.append(statement)
+            if isinstance(statement, _terminators):
+                out += self._unreachable(statement, body[position + 1 :])
+                break
+        # Function bodies are shared with the intermediate code, keep the list
+        body[:] = out
+
+    def _unreachable(self, terminator, rest) -> list:
+        """Statements of `rest` kept after a terminator"""
+        # Function declarations are not emitted in place, they stay
+        kept = [
+            self._statement(s) for s in rest if type(s) is nodes.FunctionDef
+        ]
+        removed = len(rest) - len(kept)
+        if removed:
+            keyword = type(terminator).__name__.lower()
+            self.report.append(
+                f"line {terminator.lineno}: removed {removed} unreachable "
+                f"statement{'s' * (removed > 1)} after `{keyword}`"
+            )
+        return kept
+
+    def _statement(self, statement):
+        """The optimized statement, None when it can be dropped"""
+        kind = type(statement)
+        if kind is nodes.VarDecl or kind is nodes.Assign:
+            statement.value = self._expression(statement.value)
+        elif kind is nodes.Donate:
+            statement.value = self._expression(statement.value)
+        elif kind is nodes.If:
+            statement.condition = self._expression(statement.condition)
+            if self._never(statement.condition):
+                self.report.append(
+                    f"line {statement.lineno}: dropped branch that never runs"
+                )
+                return None
+            self._block(statement.body)
+        elif kind in (nodes.Loop, nodes.Try, nodes.Catch, nodes.FunctionDef):
+            self._block(statement.body)
+        elif kind is nodes.Call or kind is nodes.BuiltinCall:
+            statement = self._expression(statement)
+        return statement
+
+    @staticmethod
+    def _never(condition) -> bool:
+        return type(condition) in (bool, float) and not condition
+
+    def _expression(self, expression, unit=True):
+        """`unit` is false when C++ does not read the expression whole"""
+        kind = type(expression)
+        if kind is nodes.BinOp:
+            folded_before = self._folded
+            left_unit, right_unit = analysis.units(expression, unit)
+            left = self._expression(expression.left, left_unit)
+            right = self._expression(expression.right, right_unit)
+            folded = self._fold(expression.op, left, right) if unit else None
+            if folded is not None:
+                # Counted once, however many operators it had
+                self._folded = folded_before + 1
+                return folded
+            if left is expression.left and right is expression.right:
+                return expression
+            return nodes.BinOp(expression.op, left, right, expression.lineno)
+        if kind is nodes.Call or kind is nodes.BuiltinCall:
+            args = self._expressions(expression.args)
+            if args is expression.args:
+                return expression
+            return kind(expression.name, args, expression.lineno)
+        if kind is nodes.Collection:
+            items = self._expressions(expression.items)
+            if items is expression.items:
+                return expression
+            return nodes.Collection(expression.kind, items, expression.lineno)
+        return expression
+
+    def _expressions(self, expressions: tuple) -> tuple:
+        """Optimized `expressions`, the same tuple when nothing changed"""
+        optimized = tuple(self._expression(e) for e in expressions)
+        if all(a is b for a, b in zip(optimized, expressions)):
+            return expressions
+        return optimized
+
+    @staticmethod
+    def _fold(op, left, right):
+        """Value of `left op right` when it is known at compile time"""
+        lkind, rkind = type(left), type(right)
+        # `false and x` and `true or x` don't depend on x, which is not
+        # evaluated by the generated code either
+        if op == "&&" and lkind is bool and not left:
+            return False
+        if op == "||" and lkind is bool and left:
+            return True
+        if lkind is not rkind or lkind not in (float, bool):
+            return None
+        if op == "&&":
+            return bool(left and right)
+        if op == "||":
+            return bool(left or right)
+        if op in _comparisons:
+            return _comparisons[op](left, right)
+        if lkind is not float:
+            return None
+        if op == "/" and right == 0:
+            return None
+        value = _arithmetic[op](left, right)
+        # The C++ code is written with literals, keep what they can spell
+        return value if math.isfinite(value) else None
+
+
+def _listing(names: t.List[str], shown: int = 8) -> str:
+    """`names` for a report line, the first few of long lists"""
+    if len(names) <= shown:
+        return ", ".join(names)
+    return f"{', '.join(names[:shown])} and {len(names) - shown} more"
+
+
+def _called(body: list) -> t.Iterator[str]:
+    """Names of the functions `body` calls, not counting nested functions"""
+    for statement in body:
+        kind = type(statement)
+        if kind is nodes.FunctionDef:
+            continue
+        for expression in analysis.expressions(statement):
+            yield from _calls(expression)
+        if kind in analysis.compound_statements:
+            yield from _called(statement.body)
+
+
+def _calls(expression) -> t.Iterator[str]:
+    if type(expression) is nodes.Call:
+        yield expression.name
+    for child in analysis.children(expression):
+        yield from _calls(child)
+
+
+def _drop_functions(body: list, reached: t.Set[str]) -> None:
+    """
+    Remove the declarations of the functions not in `reached`. Functions
+    declared in them are not emitted in place, those reached take their
+    place.
+    """
+    out = []
+    for statement in body:
+        if type(statement) in analysis.compound_statements:
+            _drop_functions(statement.body, reached)
+        if (
+            type(statement) is nodes.FunctionDef
+            and statement.name not in reached
+        ):
+            out += [s for s in statement.body if type(s) is nodes.FunctionDef]
+        else:
+            out.append(statement)
+    # Function bodies are shared with the intermediate code, keep the list
+    body[:] = out
+
+
+def _drop_statements(body: list, dropped: t.Set[int]) -> None:
+    """Remove the statements whose id is in `dropped`"""
+    if not dropped:
+        return
+    body[:] = [statement for statement in body if id(statement) not in dropped]
+    for statement in body:
+        if type(statement) in analysis.compound_statements:
+            _drop_statements(statement.body, dropped)
+
+
+def _removable(value) -> bool:
+    """True when nothing tells whether `value` was evaluated"""
+    if type(value) is nodes.Collection:
+        return all(_removable(item) for item in value.items)
+    return analysis.is_pure(value) and not analysis.may_throw(value)
+
+
+def _rebuild(expression, operands: list):
+    """`expression` with new operands, itself when none changed"""
+    if all(a is b for a, b in zip(operands, analysis.children(expression))):
+        return expression
+    kind = type(expression)
+    if kind is nodes.BinOp:
+        return nodes.BinOp(expression.op, *operands, expression.lineno)
+    if kind is nodes.Collection:
+        return nodes.Collection(expression.kind, operands, expression.lineno)
+    return kind(expression.name, operands, expression.lineno)
+
+
+class _Reuse:
+    """
+    Common subexpression elimination over a block and the `biro is` branches
+    nested in it, which run after what precedes them in the block. The bodies
+    of loops, `attempt`, `arrest` and functions start blocks of their own.
+
+    A first walk counts the pure expressions, keyed by the versions of the
+    variables they read, a second one stores those seen more than once in a
+    temporary at their first occurrence and uses it for the others.
+    """
+
+    def __init__(self, optimizer: Optimizer, body: list, step=None) -> None:
+        """`step` is the increment of the counted loop running `body`"""
+        self.optimizer = optimizer
+        self.step = step
+        self.globals = optimizer._globals
+        # Occurrences left, by key and by block they are seen from
+        self.counts = collections.Counter()
+        self.temporaries = collections.defaultdict(list)
+        self.uses = {}
+        self.roots = []
+        for self.rewrite in (False, True):
+            self.versions = collections.Counter()
+            self._block(body, (id(body),))
+        for expression, uses in self.uses.values():
+            if uses > 1:
+                optimizer.report.append(
+                    f"line {expression.lineno}: computed "
+                    f"`{analysis.source(expression)}` once for {uses} uses"
+                )
+        for root, step in self.roots:
+            _Reuse(optimizer, root, step)
+
+    def _block(self, body: list, chain: tuple) -> None:
+        out = []
+        for position in range(len(body)):
+            self.chain = chain
+            self.pending = pending = []
+            statement = self._statement(body, position)
+            out += pending
+            out.append(statement)
+        if self.rewrite:
+            body[:] = out
+
+    def _statement(self, body: list, position: int):
+        statement = body[position]
+        kind = type(statement)
+        if kind in (nodes.Loop, nodes.Try, nodes.Catch, nodes.FunctionDef):
+            if self.rewrite:
+                step = None
+                if kind is nodes.Loop:
+                    # Counted loops are generated as `for`, keep their shape
+                    counted = analysis.counted_loop(
+                        body, position, self.globals
+                    )
+                    step = counted and counted.step
+                self.roots.append((statement.body, step))
+            if kind is not nodes.FunctionDef:
+                self._bump(analysis.writes(statement.body, self.globals))
+            return statement
+
+        evaluated = analysis.expressions(statement)
+        # Expressions that can throw are only moved in front of statements
+        # without side effects, which would happen first otherwise
+        self.pure = all(analysis.is_pure(e) for e in evaluated)
+        written = set()
+        for expression in evaluated:
+            written |= analysis.expression_writes(expression, self.globals)
+        if kind is nodes.VarDecl or kind is nodes.Assign:
+            written.add(statement.name)
+
+        if statement is self.step:
+            # `i = i + 1` ending a counted loop stays as it is
+            kind = None
+        if kind in (nodes.VarDecl, nodes.Assign, nodes.Donate):
+            statement.value = self._expression(statement.value)
+        elif kind is nodes.If:
+            statement.condition = self._expression(statement.condition)
+        elif kind is nodes.Call or kind is nodes.BuiltinCall:
+            # The call itself is the statement, only its arguments are shared
+            statement = self._expression(statement, root=True)
+        self._bump(written)
+        if kind is nodes.If:
+            self._block(statement.body, self.chain + (id(statement.body),))
+        return statement
+
+    def _bump(self, names: t.Iterable[str]) -> None:
+        for name in names:
+            self.versions[name] += 1
+
+    def _key(self, expression, outside: t.Set[str], unit: bool):
+        """Key of a shareable expression, None for the others"""
+        kind = type(expression)
+        if kind is not nodes.BinOp and kind is not nodes.BuiltinCall:
+            return None
+        if not unit or not analysis.faithful(expression):
+            return None
+        if not analysis.is_pure(expression):
+            return None
+        used = analysis.names(expression)
+        # Constant expressions are folded, variables written by the statement
+        # out of order with the expression can't be trusted
+        if not used or used & outside:
+            return None
+        return expression, tuple((n, self.versions[n]) for n in sorted(used))
+
+    def _expression(
+        self,
+        expression,
+        outside=frozenset(),
+        conditional=False,
+        unit=True,
+        root=False,
+    ):
+        """
+        Count or rewrite `expression`. `outside` holds the variables written
+        by the calls of the statement that don't contain it, `conditional` is
+        set for the right operands of `and` and `or` and `unit` when C++
+        reads the expression whole.
+        """
+        if not analysis.children(expression):
+            return expression
+        key = None if root else self._key(expression, outside, unit)
+        if key is not None and not self.rewrite:
+            self._count(key, 1, conditional)
+        elif key is not None:
+            remaining = self.counts[key, self.chain[-1]]
+            self._count(key, -1, conditional)
+            name = self._available(key)
+            if name is not None:
+                self.uses[name][1] += 1
+                return name
+            if (
+                not conditional
+                and remaining > 1
+                and (self.pure or not analysis.may_throw(expression))
+            ):
+                return self._materialize(key, outside, remaining)
+        return _rebuild(
+            expression,
+            self._operands(expression, outside, conditional, unit),
+        )
+
+    def _operands(self, expression, outside, conditional, unit, weight=None):
+        operands = analysis.children(expression)
+        units = analysis.units(expression, unit)
+        writers = {}
+        for position, operand in enumerate(operands):
+            # Leaves are plain values, they neither write nor get shared
+            if isinstance(operand, nodes.Expression):
+                written = analysis.expression_writes(operand, self.globals)
+                if written:
+                    writers[position] = written
+        logical = type(expression) is nodes.BinOp and expression.op in (
+            "&&",
+            "||",
+        )
+        out = []
+        for position, operand in enumerate(operands):
+            seen = outside
+            for other, written in writers.items():
+                if other != position:
+                    seen = seen | written
+            if not isinstance(operand, nodes.Expression):
+                out.append(operand)
+                continue
+            skipped = conditional or (logical and position == 1)
+            if weight is None:
+                out.append(
+                    self._expression(operand, seen, skipped, units[position])
+                )
+            else:
+                self._discount(operand, seen, skipped, units[position], weight)
+        return out
+
+    def _discount(self, expression, outside, conditional, unit, weight):
+        """Take `weight` occurrences of the subexpressions off the counts"""
+        if not analysis.children(expression):
+            return
+        key = self._key(expression, outside, unit)
+        if key is not None:
+            self._count(key, -weight, conditional)
+        self._operands(expression, outside, conditional, unit, weight)
+
+    def _count(self, key, delta: int, conditional: bool) -> None:
+        if conditional:
+            return
+        for block in self.chain:
+            self.counts[key, block] += delta
+
+    def _available(self, key) -> t.Optional[str]:
+        for name, block in reversed(self.temporaries[key]):
+            if block in self.chain:
+                return name
+        return None
+
+    def _materialize(self, key, outside, remaining: int) -> str:
+        expression = key[0]
+        value = _rebuild(
+            expression, self._operands(expression, outside, False, True)
+        )
+        # The next occurrences are replaced whole, their operands won't be
+        # seen again
+        self._operands(expression, outside, False, True, remaining - 1)
+        declaration = self.optimizer._temporary(value, expression.lineno)
+        self.pending.append(declaration)
+        self.temporaries[key].append((declaration.name, self.chain[-1]))
+        self.uses[declaration.name] = [expression, 1]
+        return declaration.name
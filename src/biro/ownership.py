@@ -0,0 +1,139 @@
+import typing as t
+from biro import analysis, nodes
+from biro.middleware import BiroIntermediateCode
+
+
+class Move(t.NamedTuple):
+    """
+    The argument at `position` of a call is moved into it, the arguments at
+    `early` read the moved container and are computed before the call
+    """
+
+    position: int
+    early: t.Tuple[int, ...]
+
+
+class Ownership:
+    """
+    Finds where containers can be handed to functions without a copy.
+
+    Container parameters a function never writes, through an assignment or
+    `biro.index` with three arguments, are taken by `const&`. The container
+    a call replaces or donates is moved into the parameter taking it::
+
+        items = bubblesort(items, biro.len(items))
+
+    A reference must not see its container change while the function runs,
+    so functions writing to a global container or calling others take every
+    parameter by value. A moved container must not be read again before it
+    is replaced, which rules out statements in an `attempt` and the globals
+    the function called or an `arrest` anywhere could read.
+    """
+
+    def __init__(
+        self, biro: BiroIntermediateCode, scopes: analysis.Scopes = None
+    ) -> None:
+        self.global_names = biro.getGlobals()
+        self.code = biro.getCode()
+        self.scopes = scopes or analysis.Scopes(self.code, self.global_names)
+        # (scope, name) of the parameters taken by `const&`
+        self.references: t.Set[tuple] = set()
+        # `Move` of the assignments and donations moving a container, by id
+        self.moves: t.Dict[int, Move] = {}
+        self.attempts = any(
+            type(statement) is nodes.Try
+            for statement in analysis.statements(self.code)
+        )
+        for functions in self.scopes.functions.values():
+            for function in functions:
+                self._parameters(function)
+        self._walk(self.code, self.scopes.main, False)
+
+    def _is_container(self, variable) -> bool:
+        return isinstance(self.scopes.types.get(variable), tuple)
+
+    def _parameters(self, function: nodes.FunctionDef) -> None:
+        scope = id(function.body)
+        written = analysis.writes(function.body, self.global_names)
+        for name in written:
+            variable = self.scopes.variable(name, scope)
+            if (
+                variable
+                and variable[0] is None
+                and self._is_container(variable)
+            ):
+                return
+        for name in function.args:
+            if name not in written and self._is_container((scope, name)):
+                self.references.add((scope, name))
+
+    def _walk(self, body: list, scope: int, attempted: bool) -> None:
+        for statement in body:
+            kind = type(statement)
+            if kind is nodes.Assign or kind is nodes.Donate:
+                if not attempted:
+                    move = self._move(statement, scope)
+                    if move:
+                        self.moves[id(statement)] = move
+            if kind is nodes.FunctionDef:
+                self._walk(statement.body, id(statement.body), False)
+            elif kind in analysis.compound_statements:
+                self._walk(
+                    statement.body, scope, attempted or kind is nodes.Try
+                )
+
+    def _move(self, statement, scope: int) -> t.Optional[Move]:
+        call = statement.value
+        if type(call) is not nodes.Call:
+            return None
+        functions = self.scopes.functions.get(call.name, ())
+        if len(functions) != 1:
+            return None
+        function = functions[0]
+        inner = id(function.body)
+        for position, (arg, parameter) in enumerate(
+            zip(call.args, function.args)
+        ):
+            if not nodes.is_name(arg):
+                continue
+            if type(statement) is nodes.Assign and arg != statement.name:
+                continue
+            variable = self.scopes.variable(arg, scope)
+            if not variable or not self._is_container(variable):
+                continue
+            if variable in self.references or (
+                (inner, parameter) in self.references
+            ):
+                continue
+            if variable[0] is None:
+                # Donated globals live on, others can't be read meanwhile
+                if type(statement) is nodes.Donate or self.attempts:
+                    continue
+                if self._reads(function, arg):
+                    continue
+            others = call.args[:position] + call.args[position + 1 :]
+            if arg in others:
+                continue
+            early = tuple(
+                index
+                for index, other in enumerate(call.args)
+                if index != position and arg in analysis.names(other)
+            )
+            if early or variable[0] is None:
+                if not all(analysis.is_pure(other) for other in others):
+                    continue
+            return Move(position, early)
+        return None
+
+    def _reads(self, function: nodes.FunctionDef, name: str) -> bool:
+        """True when running `function` may read the global `name`"""
+        if name in analysis.used_names(function.body, ()):
+            return True
+        return any(
+            analysis.calls(expression)
+            for statement in analysis.statements(function.body)
+            for expression in analysis.expressions(statement)
+        )
+
+    def is_reference(self, name: str, scope: int) -> bool:
+        return (scope, name) in self.references
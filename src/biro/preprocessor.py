@@ -1,14 +1,29 @@
-import re
+import codecs
+import io
+import mmap
 import os
-from biro.middleware import Error
+import re
 from biro.loader import Loader
+from biro.middleware import ModuleError
+from biro.modulegraph import ModuleGraph
 import typing as t
 
+# A line holding a directive, they are dropped from the preprocessed code
+_directive = re.compile(rb"^[ \t\r\f\v]*!", re.MULTILINE)
+_directive_line = re.compile(r"^[ \t\r\f\v]*![^\n]*\n?", re.MULTILINE)
+
 
 class Preprocessor:
     """Preprocess the code, installs the dependencies and add the other code into the file"""
 
-    def __init__(self, file: str, libpath: str, pirocode: str) -> None:
+    def __init__(
+        self,
+        file: str,
+        libpath: str,
+        pirocode: t.Optional[str] = None,
+        graph: t.Optional[ModuleGraph] = None,
+        code: t.Optional[str] = None,
+    ) -> None:
         """
         Constructor method
 
@@ -16,56 +31,60 @@ class Preprocessor:
         :type file: str
         :param libpath: path of the `lib` directory
         :type libpath: str
-        :param pirocode: name of the intermediate preprocessed file
+        :param pirocode: optional file to also write the preprocessed code to
         :type pirocode: str
+        :param graph: module graph to resolve `!add` with, shared to reuse its memo
+        :type graph: ModuleGraph
+        :param code: code of `file` when it is not read from disk, `!add` paths are still relative to `file`
+        :type code: str
         """
         self.file = os.path.abspath(file)
         self.deps = []
         self.pirocode = pirocode
         self.libpath = libpath
+        self.graph = graph or ModuleGraph(libpath)
+        self.code = code
+        self._sources = None
 
     def resolve_directives(self, file):
-        with open(file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not re.match("^!.*", line):
-                    break
-                line = line[1:].strip().split(" ")
-                cmd = line[0]
-                args = " ".join(line[1:]).strip()
-                if cmd == "install" and (cmd, args) not in self.deps:
-                    self._install(args)
-                elif cmd == "add":
-                    dirname = os.path.dirname(self.file)
-                    filename = os.path.abspath(os.path.join(dirname, args))
-                    if not os.path.exists(filename) or not os.path.isfile(
-                        filename
-                    ):
-                        module = os.path.abspath(
-                            os.path.join(self.libpath, args)
-                        )
-                        if not os.path.exists(module) or not os.path.isfile(
-                            module
-                        ):
-                            Error().show(
-                                f"Error reading file {filename} or {module}."
-                            )
-                            exit(1)
-                        filename = module
-                    self.resolve_directives(filename)
-                    args = filename
-                if (cmd, args) not in self.deps:
-                    self.deps.append((cmd, args))
+        code = self.code if file == self.file else None
+        self.deps = self.graph.resolve(file, code)
+        for cmd, args in self.deps:
+            if cmd == "install":
+                self._install(args)
+        self.graph.save()
+
+    def process(self) -> str:
+        """Return the preprocessed code, dependencies first"""
+        code = "".join(self.chunks())
+        if self.pirocode:
+            with open(self.pirocode, "w") as f:
+                f.write(code)
+        return code
+
+    def sources(self) -> t.List[str]:
+        """Files making up the program in the order they are concatenated"""
+        if self._sources is None:
+            self.resolve_directives(self.file)
+            adds = [args for cmd, args in self.deps if cmd == "add"]
+            self._sources = adds + [self.file]
+        return self._sources
 
-    def process(self):
-        self.resolve_directives(self.file)
-        print(self.deps)
-        open(self.pirocode, "w").close()
-        for deps in self.deps:
-            if deps[0] == "add":
-                self._add_dep_file(deps[1])
+    def chunks(self, size: int = 1 << 20) -> t.Iterator[str]:
+        """
+        The preprocessed code as pieces of at most `size` bytes. The files are
+        memory mapped and read incrementally, so the whole program never has
+        to be held in memory at once.
+        """
+        for file in self.sources():
+            yield from self.file_chunks(file, size)
 
-        self._add_dep_file(self.file)
+    def file_chunks(self, file: str, size: int = 1 << 20) -> t.Iterator[str]:
+        """The preprocessed code of one of the `sources`, see `chunks`"""
+        if file == self.file and self.code is not None:
+            yield self._code_chunk()
+        else:
+            yield from self._file_chunks(file, size)
 
     def _install(self, pkg):
         ldr = Loader(
@@ -82,11 +101,45 @@ class Preprocessor:
         except:
             ldr.end = f"[x] Failed to install {pkg}"
             ldr.stop()
-            exit(1)
+            raise ModuleError(f"Failed to install {pkg}")
+
+    def _code_chunk(self) -> str:
+        """`code` as `_file_chunks` reads a file: directives dropped"""
+        code = self.code.replace("\r\n", "\n").replace("\r", "\n")
+        return _directive_line.sub("", code) + "\n"
+
+    def _file_chunks(self, dep_file, size):
+        # Same decoding and newline translation as reading in text mode
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(), translate=True
+        )
+        with open(dep_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield "\n"
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                pos = 0
+                end = len(m)
+                while pos < end:
+                    directive = _directive.search(m, pos)
+                    stop = directive.start() if directive else end
+                    while pos < stop:
+                        piece = min(stop, pos + size)
+                        yield decoder.decode(m[pos:piece])
+                        self._release(m, pos, piece)
+                        pos = piece
+                    if directive:
+                        newline = m.find(b"\n", stop)
+                        pos = end if newline == -1 else newline + 1
+                tail = decoder.decode(b"", final=True)
+                yield tail + "\n"
 
-    def _add_dep_file(self, dep_file):
-        with open(dep_file) as p, open(self.pirocode, "a") as f:
-            for line in p:
-                if not line.lstrip().startswith("!"):
-                    f.write(line)
-            f.write("\n")
+    @staticmethod
+    def _release(m, start, stop):
+        """Drop the pages of `m` that were read from the resident memory"""
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        start -= start % mmap.PAGESIZE
+        stop -= stop % mmap.PAGESIZE
+        if stop > start:
+            m.madvise(mmap.MADV_DONTNEED, start, stop - start)
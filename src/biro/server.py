@@ -0,0 +1,116 @@
+import json
+import os
+import socketserver
+import sys
+import tempfile
+import typing as t
+
+
+def capture_output(fn: t.Callable[[], int]) -> t.Tuple[int, str]:
+    """
+    Run `fn` with the stdout and stderr file descriptors redirected into a
+    buffer, so the output of child processes like g++ is captured as well.
+    Returns the exit status of `fn` and everything it printed.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    with tempfile.TemporaryFile() as buffer:
+        os.dup2(buffer.fileno(), 1)
+        os.dup2(buffer.fileno(), 2)
+        try:
+            try:
+                status = fn()
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                print(f"Internal error: {e!r}")
+                status = 1
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+        buffer.seek(0)
+        return status or 0, buffer.read().decode(errors="replace")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        server: CompileServer = self.server
+        if request.get("stop"):
+            server.stopped = True
+            self._reply({"stopped": True})
+            return
+        if request.get("stamp") != server.stamp:
+            # Stale daemon, the client restarts a fresh one
+            server.stopped = True
+            self._reply({"restart": True})
+            return
+        cwd = os.getcwd()
+        try:
+            os.chdir(request["cwd"])
+            status, output = capture_output(
+                lambda: server.run(request["argv"], request.get("color", False))
+            )
+        finally:
+            os.chdir(cwd)
+        self._reply({"status": status, "output": output})
+
+    def _reply(self, response):
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class CompileServer(socketserver.UnixStreamServer):
+    """Keeps the compiler warm and runs CLI requests sent over a Unix socket"""
+
+    def __init__(
+        self,
+        path: str,
+        run: t.Callable[[t.List[str], bool], int],
+        stamp: str,
+        idle_timeout: float = 1800,
+    ) -> None:
+        """
+        Constructor method
+
+        :param path: path of the Unix domain socket
+        :type path: str
+        :param run: runs the CLI with the given arguments and color setting, returns its exit status
+        :type run: Callable[[List[str], bool], int]
+        :param stamp: identifies the compiler sources and environment, clients with another stamp restart the server
+        :type stamp: str
+        :param idle_timeout: seconds without requests after which the server exits
+        :type idle_timeout: float
+        """
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path, _RequestHandler)
+        self.path = path
+        self._inode = os.stat(path).st_ino
+        self.run = run
+        self.stamp = stamp
+        self.timeout = idle_timeout
+        self.stopped = False
+
+    def handle_timeout(self) -> None:
+        self.stopped = True
+
+    def serve(self) -> None:
+        try:
+            while not self.stopped:
+                self.handle_request()
+        finally:
+            self.server_close()
+            # A restarted server may already own the path
+            if (
+                os.path.exists(self.path)
+                and os.stat(self.path).st_ino == self._inode
+            ):
+                os.remove(self.path)
@@ -0,0 +1,161 @@
+import os
+import threading
+import typing as t
+from biro.cpp_transpiler import CPP
+from biro.fastparser import FastParser
+from biro.lexerparser import Parser
+from biro.modulecache import ModuleCache
+from biro.modulegraph import ModuleGraph
+from biro.optimizer import Optimizer
+from biro.preprocessor import Preprocessor
+
+
+class CompileOptions(t.NamedTuple):
+    """How a program is made into C++, the defaults are those of `biro compile`"""
+
+    # Parser used for the biro code, a key of `Session.frontends`
+    frontend: str = "ply"
+    # Run the `Optimizer` before generating C++
+    optimize: bool = False
+    # C++ type of the non integer numbers, `float` or `double`
+    num: str = "float"
+    # Index without bounds checks, unless the program uses `attempt`
+    unchecked: bool = False
+    # Include the (precompiled) runtime header instead of inlining it
+    use_runtime_header: bool = False
+    # Description of the build embedded into the binary
+    build_info: t.Optional[str] = None
+    # Path the source is compiled as, its `!add` files are found next to it
+    filename: str = "<source>"
+
+
+class CompileResult(t.NamedTuple):
+    """C++ code of a program and what was done to make it"""
+
+    # None when the code was written to a sink instead
+    code: t.Optional[str]
+    # Changes of the `Optimizer`, empty when it did not run
+    report: t.List[str]
+    # Whether `biro.index` skips its bounds checks, `unchecked` is dropped
+    # for the programs using `attempt`
+    unchecked: bool
+    # Files pulled in with `!add`, in the order they are concatenated
+    sources: t.List[str]
+
+
+class Session:
+    """
+    Compiles programs one after the other, keeping the parsers warm. Every
+    bit of state of a program lives in the session, errors are raised as
+    `BiroError`. A session is used by one thread at a time, sessions in
+    different threads or processes don't share anything but the module
+    graph and the module cache given to them.
+    """
+
+    frontends = {"ply": Parser, "fast": FastParser}
+
+    def __init__(
+        self,
+        libpath: t.Optional[str] = None,
+        graph: t.Optional[ModuleGraph] = None,
+        modules: t.Optional[ModuleCache] = None,
+    ) -> None:
+        """
+        Constructor method
+
+        :param libpath: path of the `lib` directory, `$BIROLIB` or `$BIROHOME/lib` by default
+        :type libpath: str
+        :param graph: module graph to resolve `!add` with, shared to reuse its memo
+        :type graph: ModuleGraph
+        :param modules: cache of the parsed `!add` files, parsed with the program without it
+        :type modules: ModuleCache
+        """
+        self.libpath = libpath or default_libpath()
+        self.graph = graph or ModuleGraph(self.libpath)
+        self.modules = modules
+        self._parsers = {}
+
+    def compile_source(
+        self, text: str, options: t.Optional[CompileOptions] = None
+    ) -> CompileResult:
+        """C++ code of the biro program `text`, with its `!add` files"""
+        options = options or CompileOptions()
+        preprocessor = Preprocessor(
+            options.filename, self.libpath, graph=self.graph, code=text
+        )
+        return self.compile(preprocessor, options)
+
+    def compile(
+        self,
+        preprocessor: Preprocessor,
+        options: t.Optional[CompileOptions] = None,
+        sink: t.Optional[t.TextIO] = None,
+    ) -> CompileResult:
+        """
+        C++ code of the program of `preprocessor`, written to `sink` as it is
+        made when one is given
+        """
+        backend, report = self.prepare(preprocessor, options)
+        if sink is None:
+            code = backend.make()
+        else:
+            backend.write(sink)
+            code = None
+        return CompileResult(
+            code, report, backend.unchecked, preprocessor.sources()[:-1]
+        )
+
+    def prepare(
+        self,
+        preprocessor: Preprocessor,
+        options: t.Optional[CompileOptions] = None,
+    ) -> t.Tuple[CPP, t.List[str]]:
+        """
+        Parse and optimize the program of `preprocessor`. Returns the backend
+        writing its C++, before the session parses another program, and the
+        changes of the `Optimizer`.
+        """
+        options = options or CompileOptions()
+        parser = self.parser(options.frontend)
+        if self.modules is None:
+            parser.parse(preprocessor.chunks())
+        else:
+            self.modules.parse(parser, preprocessor)
+        report = []
+        if options.optimize:
+            report = Optimizer(parser.biro).optimize()
+        backend = CPP(
+            parser,
+            use_runtime_header=options.use_runtime_header,
+            build_info=options.build_info,
+            num=options.num,
+            unchecked=options.unchecked,
+        )
+        return backend, report
+
+    def parser(self, frontend: str):
+        """Parser of the session for `frontend`, made on first use"""
+        if frontend not in self._parsers:
+            self._parsers[frontend] = self.frontends[frontend]()
+        return self._parsers[frontend]
+
+
+def default_libpath() -> str:
+    birohome = os.environ.get("BIROHOME", "")
+    return os.environ.get("BIROLIB", os.path.join(birohome, "lib"))
+
+
+_local = threading.local()
+
+
+def compile_source(
+    text: str, options: t.Optional[CompileOptions] = None
+) -> CompileResult:
+    """
+    C++ code of the biro program `text`. Each thread compiles in a session of
+    its own, so this can be called from a thread or a process pool.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = Session()
+    return session.compile_source(text, options)
@@ -0,0 +1,286 @@
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import subprocess
+import threading
+import typing as t
+
+# Named g++ flag sets selectable with `biro compile --profile`
+PROFILES = {
+    "debug": ["-O0", "-g"],
+    "release": ["-O2"],
+    "fast": ["-O3", "-march=native"],
+    "lto": ["-O2", "-flto"],
+}
+
+
+def load_profiles(config: str) -> t.Dict[str, t.List[str]]:
+    """
+    Builtin profiles merged with the user defined ones. The config file maps a
+    profile name to its g++ flags, given either as a list or as one string::
+
+        small: -Os -s
+        bench: [-O3, -march=native, -fno-plt]
+
+    :param config: path of the yaml profile configuration
+    :type config: str
+    """
+    profiles = {name: flags[:] for name, flags in PROFILES.items()}
+    if not os.path.isfile(config):
+        return profiles
+    import yaml
+
+    with open(config) as f:
+        user = yaml.safe_load(f) or {}
+    if not isinstance(user, dict):
+        raise ValueError(f"{config} must map profile names to g++ flags")
+    for name, flags in user.items():
+        if isinstance(flags, str):
+            flags = flags.split()
+        if not isinstance(flags, list):
+            raise ValueError(f"Invalid flags for profile `{name}` in {config}")
+        profiles[str(name)] = [str(flag) for flag in flags]
+    return profiles
+
+
+class Toolchain:
+    """Thin wrapper around the g++ executable used to build birocode"""
+
+    runtime_header = "biro_runtime.hpp"
+
+    def __init__(self, runtime_path: str, compiler: str = "g++") -> None:
+        """
+        Constructor method
+
+        :param runtime_path: directory of the C++ runtime implementation
+        :type runtime_path: str
+        :param compiler: g++ compatible compiler executable
+        :type compiler: str
+        """
+        self.runtime_path = runtime_path
+        self.compiler = compiler
+        self._version = None
+
+    def version(self) -> str:
+        if self._version is None:
+            try:
+                out = subprocess.run(
+                    [self.compiler, "--version"],
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            except OSError:
+                out = ""
+            self._version = out.split("\n")[0]
+        return self._version
+
+    def runtime_digest(self) -> str:
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(self.runtime_path)):
+            h.update(name.encode() + b"\0")
+            with open(os.path.join(self.runtime_path, name), "rb") as f:
+                h.update(f.read())
+        return h.hexdigest()
+
+    def precompiled_header(
+        self, root: str, flags: t.Sequence[str]
+    ) -> t.Optional[str]:
+        """
+        Build the runtime header into a `.gch` once per toolchain, runtime and
+        flag set. Returns the include directory holding it, or None when the
+        header could not be precompiled. Headers are kept under a directory
+        per toolchain and runtime, building one removes those of the others.
+
+        :param root: directory holding the precompiled headers
+        :type root: str
+        :param flags: g++ flags the program will be compiled with
+        :type flags: Sequence[str]
+        """
+        runtime = hashlib.sha256()
+        for part in (self.version(), self.runtime_digest()):
+            runtime.update(part.encode() + b"\0")
+        h = hashlib.sha256()
+        for part in flags:
+            h.update(part.encode() + b"\0")
+        runtime_dir = runtime.hexdigest()[:16]
+        pch_dir = os.path.join(root, runtime_dir, h.hexdigest()[:16])
+        gch = os.path.join(pch_dir, f"{self.runtime_header}.gch")
+        if os.path.isfile(gch):
+            return pch_dir
+
+        # Headers of an older runtime or g++ are never used again
+        if os.path.isdir(root):
+            for entry in os.scandir(root):
+                if entry.name != runtime_dir:
+                    if entry.is_dir():
+                        shutil.rmtree(entry.path, ignore_errors=True)
+        os.makedirs(pch_dir, exist_ok=True)
+        tmp = f"{gch}.{os.getpid()}.tmp"
+        command = [
+            self.compiler,
+            "-x",
+            "c++-header",
+            os.path.join(self.runtime_path, self.runtime_header),
+            *flags,
+            "-o",
+            tmp,
+        ]
+        try:
+            subprocess.run(command, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return None
+        os.replace(tmp, gch)
+        return pch_dir
+
+    def compile(self, code: str, output: str, flags: t.Sequence[str]) -> bool:
+        """Build the C++ `code`, which is handed to g++ on stdin"""
+        return self.compile_stream(lambda sink: sink.write(code), output, flags)
+
+    def compile_stream(
+        self,
+        write: t.Callable[[t.TextIO], None],
+        output: str,
+        flags: t.Sequence[str],
+    ) -> bool:
+        """
+        Build the C++ code `write` writes to the file it is given, a pipe g++
+        reads from while the code is being made
+
+        :param write: writes the code to the text file it is called with
+        :type write: Callable[[TextIO], None]
+        :param output: path of the binary
+        :type output: str
+        :param flags: g++ flags
+        :type flags: Sequence[str]
+        """
+        process = subprocess.Popen(
+            [self.compiler, "-x", "c++", "-", *flags, "-o", output],
+            stdin=subprocess.PIPE,
+        )
+        stdin = io.TextIOWrapper(process.stdin, encoding="utf-8")
+        try:
+            write(stdin)
+            stdin.close()
+        except BrokenPipeError:
+            # g++ stopped reading, its status tells why
+            with contextlib.suppress(BrokenPipeError):
+                stdin.close()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        return process.wait() == 0
+
+    def pgo_compile(
+        self,
+        code: str,
+        output: str,
+        flags: t.Sequence[str],
+        data_dir: str,
+        training: t.Sequence[str] = (),
+    ) -> bool:
+        """
+        Profile guided build. When training inputs are given the program is
+        built with `-fprofile-generate` and run once per input (fed on stdin),
+        replacing the profile stored in `data_dir`. The final binary is built
+        with `-fprofile-use` from whatever profile `data_dir` holds.
+
+        :param code: C++ code to build
+        :type code: str
+        :param output: path of the optimized binary
+        :type output: str
+        :param flags: g++ flags of the build profile
+        :type flags: Sequence[str]
+        :param data_dir: directory keeping the profile of this program
+        :type data_dir: str
+        :param training: input files used for the training runs
+        :type training: Sequence[str]
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        # Each build has files of its own, so concurrent builds of a program
+        # don't overwrite each other. gcda files are named after the dump
+        # base, which is the same for both stages and every build. The code
+        # comes from stdin in both of them.
+        build = f"{os.getpid()}.{threading.get_ident()}"
+        obj = os.path.join(data_dir, f"program.{build}.o")
+        from_stdin = ["-x", "c++", "-", "-dumpbase", "program"]
+        source = code.encode()
+        profile = os.path.join(data_dir, "profile")
+        trained = f"{profile}.{build}.tmp"
+        instrumented = os.path.join(data_dir, f"instrumented.{build}")
+        try:
+            if training:
+                shutil.rmtree(trained, ignore_errors=True)
+                generate = [*flags, f"-fprofile-generate={trained}"]
+                subprocess.run(
+                    [self.compiler, "-c", *from_stdin, *generate, "-o", obj],
+                    input=source,
+                    check=True,
+                )
+                subprocess.run(
+                    [self.compiler, obj, *generate, "-o", instrumented],
+                    check=True,
+                )
+                for train in training:
+                    with open(train, "rb") as stdin:
+                        subprocess.run(
+                            [instrumented],
+                            stdin=stdin,
+                            stdout=subprocess.DEVNULL,
+                        )
+                shutil.rmtree(profile, ignore_errors=True)
+                if os.path.isdir(trained):
+                    try:
+                        os.replace(trained, profile)
+                    except OSError:
+                        # Another build stored its profile meanwhile
+                        pass
+            use = [
+                *flags,
+                f"-fprofile-use={profile}",
+                "-fprofile-partial-training",
+                "-Wno-missing-profile",
+            ]
+            subprocess.run(
+                [self.compiler, "-c", *from_stdin, *use, "-o", obj],
+                input=source,
+                check=True,
+            )
+            subprocess.run([self.compiler, obj, *use, "-o", output], check=True)
+        except subprocess.CalledProcessError:
+            return False
+        finally:
+            for path in (obj, instrumented):
+                if os.path.exists(path):
+                    os.remove(path)
+            shutil.rmtree(trained, ignore_errors=True)
+        return True
+
+    @staticmethod
+    def has_profile(data_dir: str) -> bool:
+        for _, _, filenames in os.walk(os.path.join(data_dir, "profile")):
+            if any(name.endswith(".gcda") for name in filenames):
+                return True
+        return False
+
+    def include_flags(self, pch_dir: t.Optional[str]) -> t.List[str]:
+        """Search path for the runtime header, precompiled one first"""
+        flags = []
+        if pch_dir:
+            flags += ["-I", pch_dir]
+        return flags + ["-I", self.runtime_path]
+
+
+def read_build_info(binary: str, marker: str) -> t.Optional[str]:
+    """Find the build description embedded by the C++ backend in a binary"""
+    with open(binary, "rb") as f:
+        data = f.read()
+    start = data.find(marker.encode())
+    if start == -1:
+        return None
+    end = data.find(b"\0", start)
+    return data[start + len(marker) : end].decode(errors="replace")
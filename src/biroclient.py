@@ -0,0 +1,112 @@
+"""
+Thin client of `biro serve`. Compile requests are forwarded to a warm server
+listening on `$BIROHOME/biro.sock`, which is started on demand. Everything
+else, or any request when the server can't be used, runs `biro.py` directly.
+Only the standard library is imported here to keep the startup cheap.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FORWARDED = ("compile",)
+# Read by the compiler or g++ once, at server start. A server started under
+# other values is restarted, so it compiles as `biro.py` would.
+ENVIRONMENT = (
+    "BIROHOME",
+    "BIROLIB",
+    "BIROCACHESIZE",
+    "PATH",
+    "CPATH",
+    "CPLUS_INCLUDE_PATH",
+    "LIBRARY_PATH",
+    "LANG",
+    "LC_ALL",
+)
+START_TIMEOUT = 10
+
+
+def source_stamp():
+    """Identifies the compiler sources and environment a server runs with"""
+    paths = [os.path.join(HERE, "biro.py")]
+    for dirpath, dirnames, filenames in os.walk(os.path.join(HERE, "biro")):
+        paths += [
+            os.path.join(dirpath, f) for f in filenames if f.endswith(".py")
+        ]
+    mtime = max(os.stat(path).st_mtime_ns for path in paths)
+    environment = [os.environ.get(name) for name in ENVIRONMENT]
+    return json.dumps([mtime, environment])
+
+
+def socket_path():
+    return os.path.join(os.environ["BIROHOME"], "biro.sock")
+
+
+def _direct(argv):
+    biro = os.path.join(HERE, "biro.py")
+    os.execv(sys.executable, [sys.executable, biro, *argv])
+
+
+def _request(path, payload):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def _start_server(path):
+    if os.path.exists(path):
+        os.remove(path)
+    subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "biro.py"), "serve"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def main(argv):
+    if (
+        not argv
+        or argv[0] not in FORWARDED
+        or not hasattr(socket, "AF_UNIX")
+        or os.environ.get("BIRONOSERVER")
+        or "BIROHOME" not in os.environ
+    ):
+        _direct(argv)
+
+    path = socket_path()
+    payload = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "stamp": source_stamp(),
+        "color": sys.stdout.isatty(),
+    }
+    for _ in range(2):
+        try:
+            response = _request(path, payload)
+        except (OSError, ValueError):
+            response = {"restart": True}
+        if not response.get("restart"):
+            sys.stdout.write(response["output"])
+            sys.stdout.flush()
+            return response["status"]
+        if not _start_server(path):
+            break
+    _direct(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,27 @@
+// Runtime of the biro language. Generated code includes this header which is
+// precompiled once per toolchain and flag set into $BIROHOME/pch.
+#ifndef BIRO_RUNTIME_HPP
+#define BIRO_RUNTIME_HPP
+
+#include <iostream>
+#include <string>
+#include <vector>
+#include <queue>
+#include <stack>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include <type_traits>
+#include <stdexcept>
+#include <utility>
+#include <exception>
+
+namespace builtins {
+#include "builtin_say.cpp"
+#include "builtin_ask.cpp"
+#include "builtin_index.cpp"
+#include "builtin_len.cpp"
+#include "builtin_loop.cpp"
+}
+
+#endif
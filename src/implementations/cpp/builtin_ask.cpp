@@ -1,3 +1,4 @@
+// requires: <iostream> <string>
 std::string ask(std::string prompt){
     std::string temp;
     std::cout << prompt;
@@ -1,3 +1,4 @@
+// requires: <vector> <cmath> <cstdint> <stdexcept> <type_traits>
 template <typename T>
 T index(const std::vector<T>& vec, float floatIndex) {
     size_t index = static_cast<size_t>(std::round(floatIndex));
@@ -20,4 +21,70 @@ T index(std::vector<T>& vec, float floatIndex, const T& newValue) {
     } else {
         throw std::out_of_range("Index out of bounds");
     }
-}
\ No newline at end of file
+}
+
+// Integer indexes, of the counters proven to hold integers, need no rounding
+template <typename T, typename I,
+          std::enable_if_t<std::is_integral_v<I>, int> = 0>
+T index(const std::vector<T>& vec, I position) {
+    if (position >= 0 && static_cast<size_t>(position) < vec.size()) {
+        return vec[position];
+    } else {
+        throw std::out_of_range("Index out of bounds");
+    }
+}
+
+template <typename T, typename I,
+          std::enable_if_t<std::is_integral_v<I>, int> = 0>
+T index(std::vector<T>& vec, I position, const T& newValue) {
+    if (position >= 0 && static_cast<size_t>(position) < vec.size()) {
+        T tmp = vec[position];
+        vec[position] = newValue;
+        return tmp;
+    } else {
+        throw std::out_of_range("Index out of bounds");
+    }
+}
+
+
+// Access without bounds checks, for the calls proven in bounds and the
+// builds made with `--unchecked`. Float indexes round like `index`.
+template <typename T, typename I>
+T index_unchecked(const std::vector<T>& vec, I position) {
+    if constexpr (std::is_integral_v<I>) {
+        return vec[position];
+    } else {
+        return vec[static_cast<size_t>(std::round(static_cast<float>(position)))];
+    }
+}
+
+template <typename T, typename I>
+T index_unchecked(std::vector<T>& vec, I position, const T& newValue) {
+    size_t at;
+    if constexpr (std::is_integral_v<I>) {
+        at = position;
+    } else {
+        at = static_cast<size_t>(std::round(static_cast<float>(position)));
+    }
+    T tmp = vec[at];
+    vec[at] = newValue;
+    return tmp;
+}
+
+// True when the positions `start + low` to `end - 1 + high` reached by a
+// counted loop running from `start` to `end` are all in `vec`
+template <typename T>
+bool spans(const std::vector<T>& vec, int64_t start, int64_t end, int64_t low,
+           int64_t high) {
+    if (start == end) {
+        return true;
+    }
+    return end != INT64_MAX && start + low >= 0 &&
+           end - 1 + high < static_cast<int64_t>(vec.size());
+}
+
+// True when `position` is in `vec`
+template <typename T>
+bool covers(const std::vector<T>& vec, int64_t position) {
+    return position >= 0 && position < static_cast<int64_t>(vec.size());
+}
@@ -1,4 +1,11 @@
+// requires: <cstdint>
 template <typename Container>
 float len(const Container& container) {
     return static_cast<float>(container.size());
-}
\ No newline at end of file
+}
+
+// Length of the containers indexed by integer counters
+template <typename Container>
+int64_t size(const Container& container) {
+    return static_cast<int64_t>(container.size());
+}
@@ -0,0 +1,36 @@
+// requires: <cmath> <cstdint> <limits>
+// Counted loops run on an integer induction variable. The biro counter is a
+// number of type T growing by 1 from an integer start: it is exact up to
+// 2^24 for a float (2^53 for a double), where `i + 1.0` rounds back to `i`
+// and the counter stops.
+template <typename T>
+constexpr int64_t loop_counter_max = int64_t(1) << std::numeric_limits<T>::digits;
+
+// Counter value for which `i == limit` first holds, INT64_MAX for never
+template <typename T>
+int64_t loop_end_equals(int64_t start, double limit) {
+    if (limit >= start && limit <= loop_counter_max<T> &&
+        limit == std::floor(limit)) {
+        return static_cast<int64_t>(limit);
+    }
+    return INT64_MAX;
+}
+
+// Counter value for which `i > limit` first holds, INT64_MAX for never
+template <typename T>
+int64_t loop_end_more(int64_t start, double limit) {
+    if (!(limit < loop_counter_max<T>)) {
+        return INT64_MAX;
+    }
+    if (limit < start) {
+        return start;
+    }
+    return static_cast<int64_t>(std::floor(limit)) + 1;
+}
+
+// Biro counter at a value of the induction variable, it converts exactly to
+// T and is kept as an integer when the counter is one
+template <typename T>
+int64_t loop_index(int64_t value) {
+    return value < loop_counter_max<T> ? value : loop_counter_max<T>;
+}
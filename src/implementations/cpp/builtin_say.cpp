@@ -1,3 +1,4 @@
+// requires: <iostream> <string> <vector> <queue> <stack> <type_traits>
 template <typename T> void printRaw(const T &value) {
     if constexpr (std::is_same_v<T, bool>) {
         std::string boolean = value ? "true" : "false";
@@ -39,7 +40,8 @@ template <typename T> void printStack(const std::stack<T> &s) {
 }
 
 template <typename T> void say(const T &value) {
-    if constexpr (std::is_same_v<T, float> || std::is_same_v<T, std::string> ||
+    if constexpr (std::is_same_v<T, float> || std::is_same_v<T, double> ||
+                std::is_same_v<T, std::string> ||
                 std::is_same_v<T, bool>) {
         printRaw(value);
     } else if constexpr (std::is_same_v<T,
@@ -56,7 +58,8 @@ template <typename T> void say(const T &value) {
 
 template <typename T, typename... Args>
 void say(const T &value, const Args &...args) {
-    if constexpr (std::is_same_v<T, float> || std::is_same_v<T, std::string> ||
+    if constexpr (std::is_same_v<T, float> || std::is_same_v<T, double> ||
+                std::is_same_v<T, std::string> ||
                 std::is_same_v<T, bool>) {
         printRaw(value);
     } else if constexpr (std::is_same_v<T,
@@ -0,0 +1,247 @@
+"""
+The hand written FastParser has to build exactly what the PLY Parser builds:
+the same AST with the same line numbers, globals and function tables, and
+the same errors for the programs the grammar rejects.
+"""
+
+import contextlib
+import glob
+import io
+import os
+
+import pytest
+
+from biro import BiroError, FastParser, Parser
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+PROGRAMS = {
+    "numbers": """
+biro a : num = 1
+biro b : num = 2.5
+biro c : num = .5
+biro d : num = -3
+biro e : num = a + -1
+biro f : num = a - 1
+biro.say(a, b, c, d, e, f)
+""",
+    "precedence": """
+biro x : num = 1 + 2 * 3 - 4 / 5
+biro y : num = 1 - 2 - 3 + 4 * 5 * 6 / 7 / 8
+biro z : bool = x less y and y
+biro w : bool = 1 + 2 == 3 - 1 * 2
+biro v : bool = true and false or true
+biro u : bool = x more y or x
+biro.say(x, y, z, w, v, u)
+""",
+    "strings": """
+// a comment
+biro s : str = "hello"
+biro t : str = s + " world"   // trailing comment
+biro u : str = ""
+biro.say(s, "\\n", t, u, "a // not a comment")
+""",
+    "bools": """
+biro yes : bool = true
+biro no : bool = false
+biro both : bool = yes and no or yes
+biro is both? {
+    biro.say("both")
+}
+""",
+    "collections": """
+biro xs : a[num] = a[1, 2, 3,]
+biro ys : a[str] = a["x", "y"]
+biro zs : a[bool] = a[]
+biro qs : q[num] = q[1, 2]
+biro ss : s[str] = s["a"]
+biro qb : q[bool] = q[true]
+biro sn : s[num] = s[]
+biro.push(qs, 3)
+biro.push(ss, "b")
+biro.say(biro.pop(qs), biro.top(ss), biro.len(xs), biro.index(xs, 0))
+biro.index(xs, 1, 5)
+""",
+    "functions": """
+biro xs : a[num] = a[1]
+biro nothing() : () {
+    biro.say("nothing")
+}
+biro add(a, b) : (num, num, num) {
+    donate a + b
+}
+biro first(xs, n,) : (a[num], num, num,) {
+    biro is n equals 0? { donate 0 }
+    donate biro.index(xs, 0)
+}
+biro echo(s) : (str) {
+    biro.say(s)
+}
+biro outer(x) : (num, num) {
+    biro inner(y) : (num, num) {
+        biro counter : num = 0
+        donate y * 2
+    }
+    donate inner(x) + add(x, 1)
+}
+nothing()
+echo("hi")
+biro.say(outer(3), first(xs, 1))
+""",
+    "control flow": """
+biro i : num = 0
+biro loop {
+    biro is i more 10? { leave }
+    biro is i equals 3? {
+        i = i + 2
+        proceed
+    }
+    smallbiro j : num = 0
+    biro loop {
+        biro is j less i? { j = j + 1 }
+        biro is j == i? { leave }
+    }
+    i = i + 1
+}
+""",
+    "attempt": """
+biro xs : a[num] = a[1]
+biro attempt {
+    biro.say(biro.index(xs, 5))
+    biro attempt {
+        biro.say("nested")
+    }
+    biro arrest {
+        biro.say("inner")
+    }
+}
+biro arrest {
+    biro.say("caught")
+}
+""",
+    "ask": """
+biro name : str = biro.ask()
+biro.say(name, biro.len(biro.ask()))
+""",
+    "empty": "",
+    "blank lines": "\n\n// only a comment\n\n",
+}
+
+INVALID = {
+    "missing value": "biro a : num =\n",
+    "missing type": "biro a = 1\n",
+    "unclosed block": 'biro is true? {\n    biro.say("x")\n',
+    "extra brace": "biro a : num = 1\n}\n",
+    "bad type": "biro a : a[a[num]] = a[]\n",
+    "operator at end": "biro a : num = 1 +\n",
+    "minus read as a sign": "biro a : num = 2\nbiro b : num = a-1\n",
+    "two operators": "biro a : num = 1 * * 2\n",
+    "chained comparison": "biro a : bool = 1 less 2 less 3\n",
+    "donate outside": "donate 1\n",
+    "leave in attempt": "biro attempt {\n    leave\n}\nbiro arrest {\n}\n",
+    "untyped function": "biro f(a, b) : (num) {\n    donate a\n}\n",
+    "function without types": "biro f(a) {\n    donate a\n}\n",
+    "call without parens": "biro.say\n",
+    "unterminated string": 'biro s : str = "abc\n',
+    "illegal character": "biro a : num = 1 $ 2\nbiro.say(a)\n",
+    "duplicate global": 'biro a : num = 1\n\nbiro a : str = "x"\n',
+    "keyword as name": "biro loop : num = 1\n",
+    "assign to call": "f() = 1\n",
+    "comparison of comparisons": "biro a : bool = 1 less 2 and 2 less 3\n",
+    "late function error": (
+        "biro f(x) : (num, num) {\n"
+        "    biro g(y, z) : (num) {\n"
+        "        donate y\n"
+        "    }\n"
+        "    donate x\n"
+        "}\n"
+    ),
+}
+
+
+def _lines(value):
+    """Line numbers of every node in `value`, in the order of its fields"""
+    if isinstance(value, (list, tuple)):
+        return [_lines(item) for item in value]
+    if hasattr(value, "_fields"):
+        fields = [_lines(getattr(value, field)) for field in value._fields]
+        return (type(value).__name__, value.lineno, fields)
+    return None
+
+
+def _outcome(cls, code):
+    """What parsing `code` with a `cls` parser builds, raises and prints"""
+    parser = cls()
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        try:
+            parser.parse(code)
+        except BiroError as e:
+            return (
+                "error",
+                type(e).__name__,
+                e.message,
+                e.line,
+                printed.getvalue(),
+            )
+    biro = parser.biro
+    return (
+        "parsed",
+        biro.getCode(),
+        _lines(biro.getCode()),
+        biro.getGlobals(),
+        biro.getFunc(),
+        printed.getvalue(),
+    )
+
+
+def _variants(code):
+    """`code`, its prefixes ending at a line and `code` with a line left out"""
+    lines = code.splitlines(keepends=True)
+    for end in range(len(lines) + 1):
+        yield "".join(lines[:end])
+    for skipped in range(len(lines)):
+        yield "".join(lines[:skipped] + lines[skipped + 1 :])
+
+
+def _examples():
+    for path in sorted(glob.glob(os.path.join(ROOT, "examples", "*.biro"))):
+        with open(path) as f:
+            yield os.path.basename(path), f.read()
+
+
+CORPUS = [*PROGRAMS.items(), *_examples()]
+
+
+@pytest.mark.parametrize("name, code", CORPUS, ids=[n for n, _ in CORPUS])
+def test_valid_programs(name, code):
+    outcome = _outcome(Parser, code)
+    assert outcome[0] == "parsed", outcome
+    assert _outcome(FastParser, code) == outcome
+
+
+@pytest.mark.parametrize("name, code", INVALID.items(), ids=list(INVALID))
+def test_invalid_programs(name, code):
+    outcome = _outcome(Parser, code)
+    assert outcome[0] == "error" or outcome[-1], outcome
+    assert _outcome(FastParser, code) == outcome
+
+
+@pytest.mark.parametrize("name, code", CORPUS, ids=[n for n, _ in CORPUS])
+def test_damaged_programs(name, code):
+    for variant in _variants(code):
+        assert _outcome(FastParser, variant) == _outcome(
+            Parser, variant
+        ), variant
+
+
+def test_streamed_chunks():
+    code = PROGRAMS["functions"] + PROGRAMS["control flow"]
+    pieces = [code[i : i + 7] for i in range(0, len(code), 7)]
+    for cls in (Parser, FastParser):
+        streamed = cls()
+        streamed.parse(iter(pieces))
+        assert _outcome(cls, code)[1:3] == (
+            streamed.biro.getCode(),
+            _lines(streamed.biro.getCode()),
+        )
@@ -0,0 +1,103 @@
+"""
+List productions are left recursive, so the parser stack stays flat however
+long a list is. Programs with thousands of statements, arguments and terms
+are parsed with little Python stack to spare and must build the AST the
+right recursive grammar built.
+"""
+
+import inspect
+import sys
+
+import pytest
+
+from biro import FastParser, Parser, nodes
+
+STATEMENTS = 5000
+# Frames the parsers may use on top of the test, far less than any list
+HEADROOM = 150
+
+
+def program(n):
+    """Every list production of the grammar, each `n` items long"""
+    args = ", ".join(f"a{i}" for i in range(n))
+    types = ", ".join("num" for _ in range(n))
+    lines = [f"biro f({args}) : ({types}, num) {{"]
+    lines += [f"    smallbiro v{i} : num = a{i}" for i in range(n)]
+    lines.append("    donate v0")
+    lines.append("}")
+    lines += [f"x{i} = {i} + 1" for i in range(n)]
+    lines.append("biro loop {")
+    lines += [f"    y = y * {i}" for i in range(n)]
+    lines.append("    leave")
+    lines.append("}")
+    lines.append(f"biro xs : a[num] = a[{', '.join(map(str, range(n)))}]")
+    lines.append(f"biro.say({', '.join(map(str, range(n)))})")
+    lines.append(f"t = {' + '.join(map(str, range(n)))}")
+    return "\n".join(lines) + "\n"
+
+
+def baseline(n):
+    """The AST of `program(n)` as the right recursive grammar built it"""
+    code = []
+    line = 1
+    body = [
+        nodes.VarDecl(1, "num", f"v{i}", f"a{i}", line + 1 + i)
+        for i in range(n)
+    ]
+    body.append(nodes.Donate("v0", line + n + 1))
+    args = [f"a{i}" for i in range(n)]
+    code.append(nodes.FunctionDef("f", args, ["num"] * n, "num", body, line))
+    line += n + 3
+    for i in range(n):
+        value = nodes.BinOp("+", float(i), 1.0, line)
+        code.append(nodes.Assign(f"x{i}", value, line))
+        line += 1
+    loop = []
+    for i in range(n):
+        value = nodes.BinOp("*", "y", float(i), line + 1 + i)
+        loop.append(nodes.Assign("y", value, line + 1 + i))
+    loop.append(nodes.Leave(line + n + 1))
+    code.append(nodes.Loop(loop, line))
+    line += n + 3
+    numbers = [float(i) for i in range(n)]
+    collection = nodes.Collection("a", numbers, line)
+    code.append(nodes.VarDecl(0, ("a", "num"), "xs", collection, line))
+    code.append(nodes.BuiltinCall("say", numbers, line + 1))
+    total = 0.0
+    for i in range(1, n):
+        total = nodes.BinOp("+", total, float(i), line + 2)
+    code.append(nodes.Assign("t", total, line + 2))
+    return code
+
+
+def assert_same(got, expected):
+    """Compare ASTs with their line numbers, without recursing"""
+    pending = [(got, expected)]
+    while pending:
+        a, b = pending.pop()
+        assert type(a) is type(b), (a, b)
+        if isinstance(a, (list, tuple)):
+            assert len(a) == len(b)
+            pending += zip(a, b)
+        elif isinstance(a, nodes.Node):
+            assert a.lineno == b.lineno, (a, b)
+            pending += [(getattr(a, f), getattr(b, f)) for f in a._fields]
+        else:
+            assert a == b
+
+
+@pytest.fixture
+def shallow_stack():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + HEADROOM)
+    yield
+    sys.setrecursionlimit(limit)
+
+
+@pytest.mark.parametrize("cls", [Parser, FastParser])
+def test_long_lists(cls, shallow_stack):
+    parser = cls()
+    parser.parse(program(STATEMENTS))
+    assert_same(parser.biro.getCode(), baseline(STATEMENTS))
+    (key,) = parser.biro.getFunc()
+    assert key == ("f", ("num",) * STATEMENTS)